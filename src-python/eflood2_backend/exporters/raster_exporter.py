@@ -4,14 +4,25 @@ Converts hydraulic results to GeoTIFF format for GIS compatibility
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import rasterio
 from rasterio.crs import CRS
+from rasterio.enums import Resampling
 from rasterio.transform import from_bounds
+from rasterio.windows import Window
+from scipy.interpolate import (
+    CloughTocher2DInterpolator,
+    LinearNDInterpolator,
+    NearestNDInterpolator,
+)
+from scipy.ndimage import map_coordinates
+from scipy.spatial import Delaunay
 
 # Import utilities
 from ..utils.common import format_error_message, setup_logging, validate_file_path
@@ -19,18 +30,155 @@ from ..utils.common import format_error_message, setup_logging, validate_file_pa
 # Configure logging
 logger = setup_logging()
 
+# Tile size (pixels) used when interpolating meshes onto the target raster
+# (rounded to a multiple of the GeoTIFF block size)
+MESH_RASTER_TILE = 1024
+
+# GeoTIFF codecs that apply the horizontal-differencing / floating-point predictor
+_PREDICTOR_COMPRESSIONS = {"lzw", "deflate", "zstd", "lzma"}
+
+
+def _regular_lattice(
+    points: np.ndarray,
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Detect mesh points that form a complete, evenly spaced lattice
+
+    Args:
+        points: Array of (x, y) coordinates
+
+    Returns:
+        Tuple (x_nodes, y_nodes, column_index, row_index) locating every point
+        on the lattice, or None if the points are scattered
+    """
+    x_nodes, column_index = np.unique(points[:, 0], return_inverse=True)
+    y_nodes, row_index = np.unique(points[:, 1], return_inverse=True)
+    if len(x_nodes) < 2 or len(y_nodes) < 2:
+        return None
+    if len(x_nodes) * len(y_nodes) != len(points):
+        return None
+
+    for nodes in (x_nodes, y_nodes):
+        steps = np.diff(nodes)
+        if not np.allclose(steps, steps[0]):
+            return None
+
+    # Every lattice node must appear exactly once
+    linear_index = row_index * len(x_nodes) + column_index
+    if np.bincount(linear_index, minlength=len(points)).max() != 1:
+        return None
+
+    return x_nodes, y_nodes, column_index, row_index
+
 
 class RasterExporter:
     """Class for converting hydraulic data to raster formats"""
 
-    def __init__(self, crs: str = "EPSG:4326"):
+    def __init__(
+        self,
+        crs: str = "EPSG:4326",
+        compression: str = "zstd",
+        predictor: Optional[int] = None,
+        blocksize: int = 512,
+        overviews: bool = True,
+    ):
         """
         Initialize raster converter
 
         Args:
             crs (str): Coordinate reference system (default: WGS84)
+            compression (str): GeoTIFF compression codec (e.g. 'zstd', 'deflate', 'lzw')
+            predictor (int): TIFF predictor; None selects 3 for floating point
+                data and 2 for integers
+            blocksize (int): Internal tile size in pixels (multiple of 16)
+            overviews (bool): Build internal overviews (2x, 4x, ...) so viewers
+                can read reduced-resolution tiles instead of the full raster
         """
         self.crs = CRS.from_string(crs)
+        self.compression = compression
+        self.predictor = predictor
+        self.blocksize = blocksize
+        self.overviews = overviews
+
+    def _creation_options(self, dtype: np.dtype) -> Dict[str, Any]:
+        """GeoTIFF creation options (compression, predictor, tiling) for a dtype"""
+        predictor = self.predictor
+        if predictor is None:
+            predictor = 3 if np.issubdtype(dtype, np.floating) else 2
+
+        options = {
+            "compress": self.compression,
+            "tiled": True,
+            "blockxsize": self.blocksize,
+            "blockysize": self.blocksize,
+            "num_threads": "ALL_CPUS",
+            "bigtiff": "IF_SAFER",
+        }
+        if self.compression.lower() in _PREDICTOR_COMPRESSIONS:
+            # Predictor 3 byte-shuffles float mantissas/exponents, predictor 2
+            # differences integers; both make smooth fields far more compressible
+            options["predictor"] = predictor
+        if self.compression.lower() == "zstd":
+            options["zstd_level"] = 1
+        return options
+
+    def _open_geotiff(
+        self,
+        output_path: str,
+        height: int,
+        width: int,
+        dtype: np.dtype,
+        bounds: Tuple[float, float, float, float],
+        nodata_value: float,
+    ):
+        """
+        Open a single-band GeoTIFF for writing with the exporter's profile
+
+        Args:
+            output_path: Path for output GeoTIFF
+            height: Raster height in pixels
+            width: Raster width in pixels
+            dtype: Raster data type
+            bounds: (min_x, min_y, max_x, max_y) bounds
+            nodata_value: Value for no data pixels
+
+        Returns:
+            Open rasterio dataset in write mode
+        """
+        return rasterio.open(
+            output_path,
+            "w",
+            driver="GTiff",
+            height=height,
+            width=width,
+            count=1,
+            dtype=dtype,
+            crs=self.crs,
+            transform=from_bounds(*bounds, width, height),
+            nodata=nodata_value,
+            **self._creation_options(dtype),
+        )
+
+    def _build_overviews(self, dst) -> None:
+        """
+        Add internal overviews to a GeoTIFF open for writing
+
+        Levels are doubled until the reduced raster fits within one block.
+
+        Args:
+            dst: Open rasterio dataset in write mode
+        """
+        if not self.overviews:
+            return
+
+        levels = []
+        factor = 2
+        while max(dst.height, dst.width) / factor > self.blocksize:
+            levels.append(factor)
+            factor *= 2
+        if levels:
+            dst.build_overviews(levels, Resampling.average)
+            dst.update_tags(ns="rio_overview", resampling="average")
 
     def array_to_geotiff(
         self,
@@ -39,6 +187,8 @@ class RasterExporter:
         output_path: str,
         nodata_value: float = -9999.0,
         description: str = "",
+        inplace: bool = False,
+        dtype: Optional[Any] = np.float32,
     ) -> None:
         """
         Convert numpy array to GeoTIFF
@@ -49,32 +199,40 @@ class RasterExporter:
             output_path: Path for output GeoTIFF file
             nodata_value: Value to use for no-data pixels
             description: Description for the raster
+            inplace: Replace NaN values with nodata_value in data itself
+                instead of in a copy (only when no dtype conversion is needed)
+            dtype: Floating point type written for float data (float32 by
+                default; None keeps the input precision). Integer data is
+                always written as is.
         """
         height, width = data.shape
 
-        # Create transform from bounds
-        transform = from_bounds(*bounds, width, height)
-
-        # Handle NaN values
-        data_copy = data.copy()
-        data_copy[np.isnan(data_copy)] = nodata_value
+        # Hydraulic results do not need double precision: halve the bytes
+        # to compress and write. The cast copy can be modified in place.
+        if (
+            dtype is not None
+            and np.issubdtype(data.dtype, np.floating)
+            and data.dtype != dtype
+        ):
+            data = data.astype(dtype)
+            inplace = True
+
+        # Handle NaN values (only floating point data can hold NaN; a copy is
+        # made only when there is something to replace)
+        if np.issubdtype(data.dtype, np.floating):
+            nan_mask = np.isnan(data)
+            if inplace:
+                np.copyto(data, nodata_value, where=nan_mask)
+            elif nan_mask.any():
+                data = np.where(nan_mask, data.dtype.type(nodata_value), data)
 
         # Write GeoTIFF
-        with rasterio.open(
-            output_path,
-            "w",
-            driver="GTiff",
-            height=height,
-            width=width,
-            count=1,
-            dtype=data_copy.dtype,
-            crs=self.crs,
-            transform=transform,
-            nodata=nodata_value,
-            compress="lzw",
+        with self._open_geotiff(
+            output_path, height, width, data.dtype, bounds, nodata_value
         ) as dst:
-            dst.write(data_copy, 1)
+            dst.write(data, 1)
             dst.set_band_description(1, description)
+            self._build_overviews(dst)
 
     def hdf_results_to_rasters(
         self,
@@ -82,6 +240,7 @@ class RasterExporter:
         coordinates: Dict[str, np.ndarray],
         output_dir: str,
         prefix: str = "hecras",
+        dtype: Optional[Any] = np.float32,
     ) -> List[str]:
         """
         Convert multiple HDF datasets to raster files
@@ -91,6 +250,7 @@ class RasterExporter:
             coordinates: Dictionary with 'x' and 'y' coordinate arrays
             output_dir: Directory for output files
             prefix: Prefix for output filenames
+            dtype: Floating point type of the rasters (None keeps the input)
 
         Returns:
             List of created file paths
@@ -114,22 +274,35 @@ class RasterExporter:
             float(np.max(y_coords)),
         )
 
-        for dataset_name, data_array in hdf_data.items():
-            # Clean dataset name for filename
-            clean_name = dataset_name.replace("/", "_").replace(" ", "_")
-            output_path = output_dir / f"{prefix}_{clean_name}.tif"
-
-            try:
-                self.array_to_geotiff(
-                    data=data_array,
-                    bounds=bounds,
-                    output_path=str(output_path),
-                    description=f"HEC-RAS result: {dataset_name}",
+        # GDAL releases the GIL while compressing and writing, so rasters are
+        # written concurrently (each one also compresses with ALL_CPUS)
+        max_workers = max(1, min(os.cpu_count() or 1, len(hdf_data)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for dataset_name, data_array in hdf_data.items():
+                # Clean dataset name for filename
+                clean_name = dataset_name.replace("/", "_").replace(" ", "_")
+                output_path = output_dir / f"{prefix}_{clean_name}.tif"
+
+                futures[dataset_name] = (
+                    str(output_path),
+                    executor.submit(
+                        self.array_to_geotiff,
+                        data=data_array,
+                        bounds=bounds,
+                        output_path=str(output_path),
+                        description=f"HEC-RAS result: {dataset_name}",
+                        dtype=dtype,
+                    ),
                 )
-                created_files.append(str(output_path))
 
-            except Exception as e:
-                print(f"Warning: Failed to create raster for {dataset_name}: {e}")
+            for dataset_name, (output_path, future) in futures.items():
+                try:
+                    future.result()
+                    created_files.append(output_path)
+
+                except Exception as e:
+                    print(f"Warning: Failed to create raster for {dataset_name}: {e}")
 
         return created_files
 
@@ -140,6 +313,7 @@ class RasterExporter:
         output_path: str,
         resolution: float = 1.0,
         interpolation_method: str = "linear",
+        triangulation: Optional[Any] = None,
     ) -> None:
         """
         Create raster from irregular mesh points
@@ -150,38 +324,141 @@ class RasterExporter:
             output_path: Path for output raster
             resolution: Pixel resolution in CRS units
             interpolation_method: Interpolation method ('linear', 'cubic', 'nearest')
+            triangulation: Pre-built scipy.spatial.Delaunay of mesh_points
+                (optional, e.g. SectionProcessor.get_triangulation())
         """
-        from scipy.interpolate import griddata
-
         # Get bounds
         x_min, y_min = np.min(mesh_points, axis=0)
         x_max, y_max = np.max(mesh_points, axis=0)
 
-        # Create regular grid
+        # Create regular grid (raster rows run from the top, y descending)
         x_range = np.arange(x_min, x_max + resolution, resolution)
-        y_range = np.arange(y_min, y_max + resolution, resolution)
-        xi, yi = np.meshgrid(x_range, y_range)
-
-        # Interpolate values to regular grid
-        zi = griddata(
-            mesh_points,
-            values,
-            (xi, yi),
-            method=interpolation_method,
-            fill_value=np.nan,
+        y_range = np.arange(y_min, y_max + resolution, resolution)[::-1]
+        height, width = len(y_range), len(x_range)
+
+        bounds = (x_min, y_min, x_max, y_max)
+        nodata_value = -9999.0
+        interpolate = self._mesh_interpolator(
+            mesh_points, values, interpolation_method, triangulation
         )
 
-        # Flip y-axis for raster (top-left origin)
-        zi = np.flipud(zi)
+        # Interpolate and write tile by tile so only one tile of the target
+        # grid is held in memory at a time. Tiles span whole GeoTIFF blocks so
+        # every block is compressed once, never re-read for a partial update.
+        tile = max(1, MESH_RASTER_TILE // self.blocksize) * self.blocksize
+        with self._open_geotiff(
+            output_path, height, width, np.float32, bounds, nodata_value
+        ) as dst:
+            for row_off in range(0, height, tile):
+                tile_y = y_range[row_off : row_off + tile]
+                for col_off in range(0, width, tile):
+                    tile_x = x_range[col_off : col_off + tile]
+                    xi, yi = np.meshgrid(tile_x, tile_y)
+                    block = interpolate(xi, yi).astype(np.float32)
+                    np.copyto(block, nodata_value, where=np.isnan(block))
+                    dst.write(
+                        block,
+                        1,
+                        window=Window(col_off, row_off, len(tile_x), len(tile_y)),
+                    )
+            dst.set_band_description(1, "Interpolated mesh data")
+            self._build_overviews(dst)
+
+    def _mesh_interpolator(
+        self,
+        mesh_points: np.ndarray,
+        values: np.ndarray,
+        method: str,
+        triangulation: Optional[Any] = None,
+    ) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Build a function interpolating mesh values at (xi, yi) target points
+
+        'nearest' on a complete regular lattice is resolved with
+        scipy.ndimage.map_coordinates (direct index arithmetic). Every other
+        case, including 'linear' and 'cubic' on lattices, uses a
+        griddata-equivalent interpolator on a Delaunay triangulation built
+        once, so results do not depend on the mesh layout.
 
-        bounds = (x_min, y_min, x_max, y_max)
+        Args:
+            mesh_points: Array of (x, y) coordinates
+            values: Values at each mesh point
+            method: Interpolation method ('linear', 'cubic', 'nearest')
+            triangulation: Pre-built Delaunay triangulation of mesh_points
+                (optional, used for scattered points)
 
-        self.array_to_geotiff(
-            data=zi,
-            bounds=bounds,
-            output_path=output_path,
-            description="Interpolated mesh data",
-        )
+        Returns:
+            Function (xi, yi) -> interpolated values (NaN outside the mesh
+            for 'linear' and 'cubic', as with griddata)
+        """
+        lattice = None if method != "nearest" else _regular_lattice(mesh_points)
+        if lattice is None:
+            return self._scattered_interpolator(
+                mesh_points, values, method, triangulation
+            )
+
+        x_nodes, y_nodes, column_index, row_index = lattice
+        grid = np.empty((len(y_nodes), len(x_nodes)), dtype=np.float64)
+        grid[row_index, column_index] = values
+
+        dx = x_nodes[1] - x_nodes[0]
+        dy = y_nodes[1] - y_nodes[0]
+
+        def interpolate_lattice(xi: np.ndarray, yi: np.ndarray) -> np.ndarray:
+            # On a rectangular lattice the nearest node is the nearest column
+            # and row, so order 0 matches griddata's 'nearest' (also outside)
+            return map_coordinates(
+                grid,
+                [(yi - y_nodes[0]) / dy, (xi - x_nodes[0]) / dx],
+                order=0,
+                mode="nearest",
+            )
+
+        return interpolate_lattice
+
+    @staticmethod
+    def _scattered_interpolator(
+        mesh_points: np.ndarray,
+        values: np.ndarray,
+        method: str,
+        triangulation: Optional[Any] = None,
+    ) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """
+        Build a griddata-equivalent interpolator for scattered mesh points
+
+        The Delaunay triangulation is computed once here (or reused when
+        given), so the returned function can be evaluated on successive tiles
+        of the target grid without re-triangulating the mesh.
+
+        Args:
+            mesh_points: Array of (x, y) coordinates
+            values: Values at each mesh point
+            method: Interpolation method ('linear', 'cubic', 'nearest')
+            triangulation: Pre-built Delaunay triangulation of mesh_points
+
+        Returns:
+            Function (xi, yi) -> interpolated values
+        """
+        if method == "nearest":
+            interpolator = NearestNDInterpolator(mesh_points, values)
+        elif method in ("linear", "cubic"):
+            if triangulation is None:
+                triangulation = Delaunay(mesh_points)
+            elif triangulation.npoints != len(mesh_points):
+                raise ValueError("Triangulation does not match the mesh points")
+
+            if method == "linear":
+                interpolator_class = LinearNDInterpolator
+            else:
+                interpolator_class = CloughTocher2DInterpolator
+            interpolator = interpolator_class(triangulation, values, fill_value=np.nan)
+        else:
+            raise ValueError(f"Unknown interpolation method: {method}")
+
+        def interpolate_scattered(xi: np.ndarray, yi: np.ndarray) -> np.ndarray:
+            return interpolator(xi, yi)
+
+        return interpolate_scattered
 
     def get_raster_info(self, raster_path: str) -> Dict[str, Any]:
         """
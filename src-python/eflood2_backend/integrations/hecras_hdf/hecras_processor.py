@@ -6,6 +6,8 @@ Compatible with HEC-RAS versions 5.0.7 through 6.7+
 """
 
 import base64
+import contextlib
+import importlib.util
 import io
 import json
 import logging
@@ -14,19 +16,13 @@ import sys
 import tempfile
 from pathlib import Path
 
+import numpy as np
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 try:
-    import matplotlib
-    import matplotlib.pyplot as plt
-    import numpy as np
-    from tabulate import tabulate
-
-    # Use non-interactive backend for server environment
-    matplotlib.use("Agg")
-
     # Import our integrated HECRAS-HDF modules
     import os
     import sys
@@ -44,24 +40,206 @@ except (ImportError, AttributeError) as e:
     raise ImportError(f"HECRAS-HDF modules are required but not available: {e}")
 
 
-def encode_plot_to_base64(fig):
-    """Convert matplotlib figure to base64 string"""
+def _load_common():
+    """
+    Load eflood2_backend/utils/common.py by file path
+
+    This script runs by path, and importing it as eflood2_backend.utils.common
+    would import the whole package first.
+    """
+    path = Path(__file__).resolve().parents[2] / "utils" / "common.py"
+    spec = importlib.util.spec_from_file_location("eflood2_backend_common", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Shared JSON encoder from eflood2_backend.utils
+dumps_json = _load_common().dumps_json
+
+
+def _webp_supported():
+    """Whether Pillow was built with WebP support"""
+    try:
+        from PIL import features
+
+        return features.check("webp")
+    except ImportError:
+        return False
+
+
+# Image format used for plots sent to the frontend (reported as "plot_format").
+# The frontend builds image/png data URIs, so PNG is the default; WebP and JPEG
+# are opt-in through encode_plot_to_base64's fmt argument
+PLOT_FORMAT = "png"
+WEBP_AVAILABLE = _webp_supported()
+
+# Pillow encoder options per lossy format
+PLOT_PIL_KWARGS = {
+    "webp": {"quality": 85, "method": 4},
+    "jpeg": {"quality": 85, "optimize": True},
+}
+
+
+# Depth maps with more cells than this are binned onto a grid instead of scattered
+DEPTH_MAP_SCATTER_LIMIT = 20000
+
+# Number of grid bins along the longest side of a binned depth map
+DEPTH_MAP_BINS = 600
+
+# Depth maps with mesh connectivity and up to this many cells are drawn as the
+# actual cell polygons (tripcolor) instead of binned
+DEPTH_MAP_MESH_LIMIT = 100000
+
+
+_plt = None
+
+
+def _get_plt():
+    """
+    Import matplotlib.pyplot on first use
+
+    Only the plotting operations need matplotlib, so "process", "export_vtk"
+    and the Manning table skip its import cost.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+
+        # Use non-interactive backend for server environment
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        _plt = plt
+    return _plt
+
+
+# Figures reused across plots, keyed by figure size (avoids re-allocating the
+# figure and its canvas for every plot when running in server mode)
+_FIGURE_POOL = {}
+
+
+def get_pooled_figure(figsize):
+    """
+    Get a cleared figure of the given size with a single axes
+
+    Args:
+        figsize: Figure size (width, height) in inches
+
+    Returns:
+        Tuple (fig, ax)
+    """
+    fig = _FIGURE_POOL.get(figsize)
+    if fig is None:
+        fig = _get_plt().figure(figsize=figsize)
+        _FIGURE_POOL[figsize] = fig
+    else:
+        # Also drops colorbar axes added by the previous plot
+        fig.clear()
+    return fig, fig.add_subplot()
+
+
+def encode_plot_to_base64(fig, fmt=None, dpi=100):
+    """
+    Convert matplotlib figure to base64 string
+
+    Args:
+        fig: Matplotlib figure
+        fmt: Image format ("webp", "jpeg" or "png"), defaults to PLOT_FORMAT;
+            "webp" falls back to PNG when Pillow lacks WebP support
+        dpi: Output resolution
+
+    Returns:
+        Base64 encoded image
+    """
+    fmt = fmt or PLOT_FORMAT
+    if fmt == "webp" and not WEBP_AVAILABLE:
+        fmt = "png"
+
     buffer = io.BytesIO()
     fig.savefig(
         buffer,
-        format="png",
-        dpi=150,
+        format=fmt,
+        dpi=dpi,
         bbox_inches="tight",
         facecolor="white",
         edgecolor="none",
+        pil_kwargs=PLOT_PIL_KWARGS.get(fmt),
     )
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    image_base64 = base64.b64encode(buffer.getbuffer()).decode("utf-8")
     buffer.close()
-    plt.close(fig)
+    if not any(fig is pooled for pooled in _FIGURE_POOL.values()):
+        _get_plt().close(fig)
     return image_base64
 
 
+# Loaded RAS_2D_Data objects keyed by the real paths and modification times of
+# the HDF and terrain files, so repeated operations on the same file (server
+# mode) skip parsing the HDF again
+_RAS_CACHE = {}
+_RAS_CACHE_SIZE = 4
+
+
+def resolve_terrain_file(terrain_file):
+    """
+    Check an optional terrain path once
+
+    Args:
+        terrain_file: Optional path to terrain file
+
+    Returns:
+        terrain_file if it is an existing file, None otherwise (so callers
+        can report "terrain used" as terrain_file is not None)
+    """
+    if terrain_file and not os.path.isfile(terrain_file):
+        logger.warning(f"Terrain file not found, ignoring: {terrain_file}")
+        return None
+    return terrain_file or None
+
+
+def load_ras_data(hdf_file, terrain_file=None):
+    """
+    Load a RAS_2D_Data object for an HDF file, reusing a cached one if available
+
+    Args:
+        hdf_file: Path to HDF file
+        terrain_file: Optional path to terrain file (ignored if it does not exist)
+
+    Returns:
+        RAS_2D_Data object with 2D area solutions loaded
+    """
+    hdf_path = os.path.realpath(hdf_file)
+    terrain_key = None
+    if terrain_file:
+        try:
+            terrain_path = os.path.realpath(terrain_file)
+            terrain_key = (terrain_path, os.stat(terrain_path).st_mtime)
+        except OSError:
+            logger.warning(f"Terrain file not found, ignoring: {terrain_file}")
+            terrain_file = None
+
+    cache_key = (hdf_path, os.stat(hdf_path).st_mtime, terrain_key)
+    if cache_key in _RAS_CACHE:
+        logger.info(f"Using cached HEC-RAS data: {hdf_file}")
+        return _RAS_CACHE[cache_key]
+
+    # pyHMT2D requires a terrain file - use a dummy path when none is provided
+    if terrain_file:
+        ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
+        logger.info(f"Using terrain file: {terrain_file}")
+    else:
+        dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
+        ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
+        logger.info("Using dummy terrain file (pyHMT2D compatibility)")
+
+    _RAS_CACHE[cache_key] = ras_data
+    if len(_RAS_CACHE) > _RAS_CACHE_SIZE:
+        # Evict the oldest entry
+        _RAS_CACHE.pop(next(iter(_RAS_CACHE)))
+
+    return ras_data
+
+
 def extract_manning_values(ras_data):
     """
     Extract Manning's n values from RAS_2D object
@@ -122,6 +300,8 @@ def extract_manning_values(ras_data):
             table_rows.sort(key=lambda x: float(x[2]))
 
             # Create formatted table
+            from tabulate import tabulate
+
             headers = ["ID", "Tipo de Cobertura", "Manning n", "Descripción"]
             manning_data["formatted_table"] = tabulate(
                 table_rows, headers=headers, tablefmt="grid", stralign="left"
@@ -275,20 +455,20 @@ def process_hec_ras_data(hdf_file, terrain_file=None):
             return get_basic_hdf_metadata(hdf_file)
 
         logger.info(f"Processing HEC-RAS data: {hdf_file}")
+        terrain_file = resolve_terrain_file(terrain_file)
 
         # Replicate pyHMT2D methodology exactly:
         # 1. pyHMT2D REQUIRES a terrain file (even if dummy)
         # 2. pyHMT2D does NOT handle missing datasets gracefully
         # 3. Our version improves on this by handling missing data
 
-        if terrain_file and os.path.exists(terrain_file):
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
-            logger.info(f"Using terrain file: {terrain_file}")
-        else:
-            # pyHMT2D requires terrain file - create dummy path
-            dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
-            logger.info("Using dummy terrain file (pyHMT2D compatibility)")
+        ras_data = load_ras_data(hdf_file, terrain_file)
+
+        cell_counts = (
+            [int(count) for count in ras_data.TwoDAreaCellCounts]
+            if hasattr(ras_data, "TwoDAreaCellCounts")
+            else []
+        )
 
         # Extract metadata following pyHMT2D structure (JSON serializable)
         metadata = {
@@ -302,11 +482,8 @@ def process_hec_ras_data(hdf_file, terrain_file=None):
                 if hasattr(ras_data, "TwoDAreaNames")
                 else []
             ),
-            "cell_counts": (
-                [int(count) for count in ras_data.TwoDAreaCellCounts]
-                if hasattr(ras_data, "TwoDAreaCellCounts")
-                else []
-            ),
+            "cell_counts": cell_counts,
+            "total_cells": sum(cell_counts),
             "solution_times": (
                 len(ras_data.solution_time) if hasattr(ras_data, "solution_time") else 0
             ),
@@ -328,11 +505,7 @@ def process_hec_ras_data(hdf_file, terrain_file=None):
                 ),
             },
             "processor": "HECRAS-HDF Integrated (pyHMT2D compatible)",
-            "terrain_provided": (
-                terrain_file is not None and os.path.exists(terrain_file)
-                if terrain_file
-                else False
-            ),
+            "terrain_provided": terrain_file is not None,
             "datasets_available": {
                 "depth_data": (
                     len(ras_data.TwoDAreaCellDepth) > 0
@@ -373,14 +546,10 @@ def create_hydrograph(hdf_file, cell_id=0, terrain_file=None):
         logger.info(f"Creating hydrograph from boundary conditions")
 
         # Use integrated RAS_2D_Data class
-        if terrain_file and os.path.exists(terrain_file):
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
-        else:
-            dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
+        ras_data = load_ras_data(hdf_file, terrain_file)
 
         # Create hydrograph plot
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = get_pooled_figure((12, 8))
 
         # Try to extract boundary condition data from HDF5 file directly
         boundary_data_found = False
@@ -521,6 +690,7 @@ def create_hydrograph(hdf_file, cell_id=0, terrain_file=None):
         return {
             "success": True,
             "plot": plot_base64,
+            "plot_format": PLOT_FORMAT,
             "data_found": boundary_data_found,
             "units": getattr(ras_data, "units", "Unknown"),
             "version": getattr(ras_data, "version", "Unknown"),
@@ -536,6 +706,56 @@ def create_hydrograph(hdf_file, cell_id=0, terrain_file=None):
         return {"success": False, "error": f"Error creating hydrograph: {str(e)}"}
 
 
+def get_cell_mesh_triangles(ras_data, area_index, num_cells):
+    """
+    Fan-triangulate the cell polygons of a 2D flow area
+
+    Args:
+        ras_data: RAS_2D_Data object
+        area_index: Index of the 2D flow area
+        num_cells: Number of (real) cells to triangulate
+
+    Returns:
+        Tuple (x, y, triangles, triangle_cells) where triangle_cells maps each
+        triangle to its cell, or None if the mesh connectivity is unavailable
+    """
+    face_points_list = getattr(ras_data, "TwoDAreaFacePointCoordinatesList", None)
+    if not face_points_list or len(face_points_list) <= area_index:
+        return None
+
+    face_points = face_points_list[area_index]
+    # Face point indexes per cell, padded with -1 (ghost cells come last)
+    cell_face_points = ras_data.get2DAreaCellFacePointsIndexes(
+        ras_data.TwoDAreaNames[area_index]
+    )[:num_cells]
+
+    triangles = []
+    triangle_cells = []
+    cells = np.arange(len(cell_face_points))
+    for corner in range(1, cell_face_points.shape[1] - 1):
+        valid = cell_face_points[:, corner + 1] >= 0
+        triangles.append(
+            np.column_stack(
+                (
+                    cell_face_points[valid, 0],
+                    cell_face_points[valid, corner],
+                    cell_face_points[valid, corner + 1],
+                )
+            )
+        )
+        triangle_cells.append(cells[valid])
+
+    if not triangles:
+        return None
+
+    return (
+        face_points[:, 0],
+        face_points[:, 1],
+        np.concatenate(triangles),
+        np.concatenate(triangle_cells),
+    )
+
+
 def create_depth_map(hdf_file, terrain_file=None):
     """Create depth map using integrated HECRAS-HDF modules"""
     try:
@@ -545,14 +765,10 @@ def create_depth_map(hdf_file, terrain_file=None):
         logger.info("Creating depth map")
 
         # Use integrated RAS_2D_Data class
-        if terrain_file and os.path.exists(terrain_file):
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
-        else:
-            dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
+        ras_data = load_ras_data(hdf_file, terrain_file)
 
         # Create depth map plot
-        fig, ax = plt.subplots(figsize=(12, 10))
+        fig, ax = get_pooled_figure((12, 10))
 
         if (
             hasattr(ras_data, "TwoDAreaCellDepth")
@@ -564,17 +780,66 @@ def create_depth_map(hdf_file, terrain_file=None):
                 max_depths = np.max(depths, axis=0)
                 cell_points = ras_data.TwoDAreaCellPoints[0]  # First flow area
 
-                # Create scatter plot
-                scatter = ax.scatter(
-                    cell_points[:, 0],
-                    cell_points[:, 1],
-                    c=max_depths,
-                    cmap="Blues",
-                    s=1,
-                    alpha=0.7,
-                )
+                x_coords = cell_points[:, 0]
+                y_coords = cell_points[:, 1]
+
+                mesh = None
+                if len(max_depths) <= DEPTH_MAP_MESH_LIMIT:
+                    try:
+                        mesh = get_cell_mesh_triangles(ras_data, 0, len(max_depths))
+                    except Exception as e:
+                        logger.warning(f"Mesh connectivity not available: {e}")
+
+                if mesh is not None:
+                    # Draw the actual cell polygons, colored by max depth
+                    mesh_x, mesh_y, triangles, triangle_cells = mesh
+                    mappable = ax.tripcolor(
+                        mesh_x,
+                        mesh_y,
+                        triangles,
+                        facecolors=max_depths[triangle_cells],
+                        cmap="Blues",
+                        alpha=0.7,
+                    )
+                elif len(max_depths) > DEPTH_MAP_SCATTER_LIMIT:
+                    # Dense meshes: average depths on a regular grid so rendering
+                    # cost depends on the image size instead of the cell count
+                    width = np.ptp(x_coords) or 1.0
+                    height = np.ptp(y_coords) or 1.0
+                    scale = DEPTH_MAP_BINS / max(width, height)
+                    bins = (
+                        max(int(width * scale), 1),
+                        max(int(height * scale), 1),
+                    )
+
+                    depth_sum, x_edges, y_edges = np.histogram2d(
+                        x_coords, y_coords, bins=bins, weights=max_depths
+                    )
+                    cell_count, _, _ = np.histogram2d(
+                        x_coords, y_coords, bins=(x_edges, y_edges)
+                    )
+                    depth_grid = np.divide(
+                        depth_sum,
+                        cell_count,
+                        out=np.full_like(depth_sum, np.nan),
+                        where=cell_count > 0,
+                    )
+
+                    mappable = ax.pcolormesh(
+                        x_edges, y_edges, depth_grid.T, cmap="Blues", alpha=0.7
+                    )
+                else:
+                    # Create scatter plot
+                    mappable = ax.scatter(
+                        x_coords,
+                        y_coords,
+                        c=max_depths,
+                        cmap="Blues",
+                        s=1,
+                        alpha=0.7,
+                    )
 
-                plt.colorbar(scatter, ax=ax, label=f"Max Depth ({ras_data.units})")
+                fig.colorbar(mappable, ax=ax, label=f"Max Depth ({ras_data.units})")
                 ax.set_xlabel("X Coordinate")
                 ax.set_ylabel("Y Coordinate")
                 ax.set_title(f"Maximum Depth Map\nHEC-RAS Version: {ras_data.version}")
@@ -603,6 +868,7 @@ def create_depth_map(hdf_file, terrain_file=None):
         return {
             "success": True,
             "plot": plot_base64,
+            "plot_format": PLOT_FORMAT,
             "units": ras_data.units,
             "version": ras_data.version,
         }
@@ -621,14 +887,10 @@ def create_profile(hdf_file, terrain_file=None):
         logger.info("Creating profile")
 
         # Use integrated RAS_2D_Data class
-        if terrain_file and os.path.exists(terrain_file):
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
-        else:
-            dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
+        ras_data = load_ras_data(hdf_file, terrain_file)
 
         # Create profile plot
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = get_pooled_figure((12, 8))
 
         if hasattr(ras_data, "TwoDAreaCellWSE") and len(ras_data.TwoDAreaCellWSE) > 0:
             # Get water surface elevations
@@ -680,6 +942,7 @@ def create_profile(hdf_file, terrain_file=None):
         return {
             "success": True,
             "plot": plot_base64,
+            "plot_format": PLOT_FORMAT,
             "units": ras_data.units,
             "version": ras_data.version,
         }
@@ -701,12 +964,10 @@ def get_vtk_export_info(hdf_file, terrain_file=None):
         if not metadata["success"]:
             return metadata
 
+        terrain_file = resolve_terrain_file(terrain_file)
+
         # Initialize RAS_2D_Data object to get detailed information
-        if terrain_file and os.path.exists(terrain_file):
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
-        else:
-            dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
+        ras_data = load_ras_data(hdf_file, terrain_file)
 
         # Extract detailed information
         export_info = {
@@ -745,11 +1006,7 @@ def get_vtk_export_info(hdf_file, terrain_file=None):
                 "end_time": (
                     ras_data.end_time if hasattr(ras_data, "end_time") else "N/A"
                 ),
-                "terrain_provided": (
-                    terrain_file is not None and os.path.exists(terrain_file)
-                    if terrain_file
-                    else False
-                ),
+                "terrain_provided": terrain_file is not None,
                 "processor": "HECRAS-HDF Integrated (pyHMT2D compatible)",
             },
         }
@@ -778,15 +1035,10 @@ def export_to_vtk(
 
         # Ensure output directory exists
         os.makedirs(output_directory, exist_ok=True)
+        terrain_file = resolve_terrain_file(terrain_file)
 
         # Use integrated RAS_2D_Data class
-        if terrain_file and os.path.exists(terrain_file):
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
-            logger.info(f"Using terrain file: {terrain_file}")
-        else:
-            dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
-            logger.info("Using dummy terrain file")
+        ras_data = load_ras_data(hdf_file, terrain_file)
 
         base_name = os.path.splitext(os.path.basename(hdf_file))[0]
 
@@ -807,11 +1059,7 @@ def export_to_vtk(
         result.update(
             {
                 "version": ras_data.version,
-                "terrain_used": (
-                    terrain_file is not None and os.path.exists(terrain_file)
-                    if terrain_file
-                    else False
-                ),
+                "terrain_used": terrain_file is not None,
                 "export_type": export_type,
                 "total_timesteps": (
                     len(ras_data.solution_time)
@@ -1125,13 +1373,15 @@ def add_max_data_to_vtk(ugrid, max_data):
         raise Exception(f"Error adding data to VTK: {str(e)}")
 
 
-def extract_manning_table(hdf_file, terrain_file=None):
+def extract_manning_table(hdf_file, terrain_file=None, verbose=True):
     """
     Extract Manning values and return formatted table
 
     Args:
         hdf_file: Path to HDF file
         terrain_file: Optional path to terrain file
+        verbose: Print the formatted table to the console (the table is
+            always returned in manning_data["formatted_table"])
 
     Returns:
         Dict with Manning table data and formatted output
@@ -1143,16 +1393,20 @@ def extract_manning_table(hdf_file, terrain_file=None):
         logger.info("Extracting Manning values table")
 
         # Initialize RAS_2D object
-        if terrain_file and os.path.exists(terrain_file):
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, terrain_file)
-        else:
-            dummy_terrain = os.path.join(os.path.dirname(hdf_file), "dummy_terrain.tif")
-            ras_data = RAS_2D.RAS_2D_Data(hdf_file, dummy_terrain)
+        ras_data = load_ras_data(hdf_file, terrain_file)
 
         # Extract Manning values
         manning_data = extract_manning_values(ras_data)
 
         if manning_data["success"]:
+            if not verbose:
+                logger.info(f"Manning: {manning_data['total_zones']} zones")
+                return {
+                    "success": True,
+                    "manning_data": manning_data,
+                    "table_printed": False,
+                }
+
             # Print table to console
             print("\n" + "=" * 80)
             print("🌿 VALORES DE MANNING CALIBRADOS EN EL MODELO HEC-RAS")
@@ -1178,14 +1432,106 @@ def extract_manning_table(hdf_file, terrain_file=None):
         return {"success": False, "error": f"Error extracting Manning table: {str(e)}"}
 
 
+def run_operation(
+    operation,
+    hdf_file,
+    terrain_file=None,
+    cell_id=0,
+    output_directory=None,
+    export_type="all_timesteps",
+    verbose=False,
+):
+    """
+    Run a single processor operation
+
+    Args:
+        operation: Operation name (process, hydrograph, depth_map, profile,
+            export_vtk, vtk_info, manning)
+        hdf_file: Path to HDF file
+        terrain_file: Optional path to terrain file (ignored if it does not exist)
+        cell_id: Cell used by the hydrograph fallback
+        output_directory: Output directory for export_vtk (temporary if None)
+        export_type: VTK export type ("all_timesteps" or "max_values")
+        verbose: Print console tables (manning); off so stdout carries only
+            the JSON result
+
+    Returns:
+        Dict with operation results
+    """
+    # The operations resolve the terrain path themselves (resolve_terrain_file
+    # or load_ras_data), once per call
+    if operation == "process":
+        return process_hec_ras_data(hdf_file, terrain_file)
+    elif operation == "hydrograph":
+        return create_hydrograph(hdf_file, cell_id, terrain_file)
+    elif operation == "depth_map":
+        return create_depth_map(hdf_file, terrain_file)
+    elif operation == "profile":
+        return create_profile(hdf_file, terrain_file)
+    elif operation == "export_vtk":
+        return export_to_vtk(
+            hdf_file,
+            output_directory or tempfile.mkdtemp(),
+            terrain_file,
+            export_type,
+        )
+    elif operation == "vtk_info":
+        return get_vtk_export_info(hdf_file, terrain_file)
+    elif operation == "manning":
+        return extract_manning_table(hdf_file, terrain_file, verbose=verbose)
+    else:
+        return {"success": False, "error": f"Unknown operation: {operation}"}
+
+
+def run_server():
+    """
+    Serve operations from stdin, one JSON request per line
+
+    Each request is an object with "operation" and "hdf_file" plus any of the
+    optional run_operation arguments. One JSON response line is written per
+    request. Loaded HEC-RAS data stays cached between requests on the same file.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            operation = request.pop("operation")
+            hdf_file = request.pop("hdf_file")
+            os.stat(hdf_file)
+        except FileNotFoundError:
+            result = {"success": False, "error": f"HDF file not found: {hdf_file}"}
+        except Exception as e:
+            result = {"success": False, "error": f"Invalid request: {str(e)}"}
+        else:
+            try:
+                # Keep stdout for responses only (RAS_2D_Data prints progress)
+                with contextlib.redirect_stdout(sys.stderr):
+                    result = run_operation(operation, hdf_file, **request)
+            except Exception as e:
+                result = {
+                    "success": False,
+                    "error": f"Unexpected error in {operation}: {str(e)}",
+                }
+
+        sys.stdout.write(dumps_json(result) + "\n")
+        sys.stdout.flush()
+
+
 def main():
     """Main function to handle command line arguments"""
+    if len(sys.argv) == 2 and sys.argv[1] == "server":
+        run_server()
+        return
+
     if len(sys.argv) < 3:
         print(
-            json.dumps(
+            dumps_json(
                 {
                     "success": False,
-                    "error": "Usage: python hecras_processor.py <operation> <hdf_file> [additional_args...]",
+                    "error": "Usage: python hecras_processor.py <operation> <hdf_file> [additional_args...] | server",
                 }
             )
         )
@@ -1195,69 +1541,48 @@ def main():
     hdf_file = sys.argv[2]
 
     # Check if HDF file exists
-    if not os.path.exists(hdf_file):
+    try:
+        os.stat(hdf_file)
+    except FileNotFoundError:
         print(
-            json.dumps({"success": False, "error": f"HDF file not found: {hdf_file}"})
+            dumps_json({"success": False, "error": f"HDF file not found: {hdf_file}"})
         )
         sys.exit(1)
 
-    try:
-        if operation == "process":
-            terrain_file = (
-                sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != "null" else None
-            )
-            result = process_hec_ras_data(hdf_file, terrain_file)
-
-        elif operation == "hydrograph":
-            cell_id = int(sys.argv[3]) if len(sys.argv) > 3 else 0
-            terrain_file = (
-                sys.argv[4] if len(sys.argv) > 4 and sys.argv[4] != "null" else None
-            )
-            result = create_hydrograph(hdf_file, cell_id, terrain_file)
-
-        elif operation == "depth_map":
-            terrain_file = (
-                sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != "null" else None
-            )
-            result = create_depth_map(hdf_file, terrain_file)
+    def optional_arg(index):
+        return (
+            sys.argv[index]
+            if len(sys.argv) > index and sys.argv[index] != "null"
+            else None
+        )
 
-        elif operation == "profile":
-            terrain_file = (
-                sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != "null" else None
+    try:
+        if operation == "hydrograph":
+            result = run_operation(
+                operation,
+                hdf_file,
+                terrain_file=optional_arg(4),
+                cell_id=int(sys.argv[3]) if len(sys.argv) > 3 else 0,
             )
-            result = create_profile(hdf_file, terrain_file)
-
         elif operation == "export_vtk":
-            output_dir = sys.argv[3] if len(sys.argv) > 3 else tempfile.mkdtemp()
-            terrain_file = (
-                sys.argv[4] if len(sys.argv) > 4 and sys.argv[4] != "null" else None
+            result = run_operation(
+                operation,
+                hdf_file,
+                terrain_file=optional_arg(4),
+                output_directory=sys.argv[3] if len(sys.argv) > 3 else None,
+                export_type=sys.argv[5] if len(sys.argv) > 5 else "all_timesteps",
             )
-            export_type = sys.argv[5] if len(sys.argv) > 5 else "all_timesteps"
-            result = export_to_vtk(hdf_file, output_dir, terrain_file, export_type)
-
-        elif operation == "vtk_info":
-            terrain_file = (
-                sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != "null" else None
-            )
-            result = get_vtk_export_info(hdf_file, terrain_file)
-
-        elif operation == "manning":
-            terrain_file = (
-                sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != "null" else None
-            )
-            result = extract_manning_table(hdf_file, terrain_file)
-
         else:
-            result = {"success": False, "error": f"Unknown operation: {operation}"}
+            result = run_operation(operation, hdf_file, terrain_file=optional_arg(3))
 
-        print(json.dumps(result))
+        print(dumps_json(result))
 
     except Exception as e:
         error_result = {
             "success": False,
             "error": f"Unexpected error in {operation}: {str(e)}",
         }
-        print(json.dumps(error_result))
+        print(dumps_json(error_result))
         sys.exit(1)
 
 
@@ -48,6 +48,18 @@ __email__ = "team@eflood2.com"
 # Configurar logging para el paquete
 logger = logging.getLogger(__name__)
 
+# Módulos commander_* del paquete (lista estática durante todo el proceso)
+COMMANDER_MODULES = (
+    "commander_project",
+    "commander_geometry",
+    "commander_flow",
+    "commander_results",
+    "commander_infrastructure",
+    "commander_export",
+    "commander_analysis",
+    "commander_utils",
+)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # FUNCIONES DE UTILIDAD DEL PAQUETE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -57,6 +69,9 @@ def get_package_info() -> Dict[str, Any]:
     """
     Obtiene información sobre el paquete RAS Commander integration.
 
+    No importa ni recorre los módulos: sólo copia constantes del paquete, y
+    cada llamada devuelve un dict nuevo que el llamador puede modificar.
+
     Returns:
         Dict con información del paquete y estado de RAS Commander
     """
@@ -64,16 +79,7 @@ def get_package_info() -> Dict[str, Any]:
         "package_version": __version__,
         "ras_commander_available": RAS_COMMANDER_AVAILABLE,
         "ras_commander_version": RAS_COMMANDER_VERSION,
-        "modules": [
-            "commander_project",
-            "commander_geometry",
-            "commander_flow",
-            "commander_results",
-            "commander_infrastructure",
-            "commander_export",
-            "commander_analysis",
-            "commander_utils",
-        ],
+        "modules": list(COMMANDER_MODULES),
     }
 
 
@@ -129,6 +135,7 @@ __all__ = [
     "__email__",
     "get_package_info",
     "check_ras_commander_availability",
+    "COMMANDER_MODULES",
     "RAS_COMMANDER_AVAILABLE",
     "RAS_COMMANDER_VERSION",
     # Módulos commander_* (si están disponibles)
@@ -29,7 +29,7 @@ import sys
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 # Imports científicos
 import numpy as np
@@ -44,7 +44,12 @@ except ImportError:
     RAS_COMMANDER_AVAILABLE = False
 
 # eFlood2 utilities
-from ...utils.common import format_error_message, setup_logging, validate_file_path
+from ...utils.common import (
+    dumps_json,
+    format_error_message,
+    setup_logging,
+    validate_file_path,
+)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURACIÓN DE LOGGING
@@ -66,6 +71,13 @@ HECRAS_FILE_EXTENSIONS = {
     "unsteady": [".u01", ".u02", ".u03", ".u04", ".u05"],
 }
 
+# Tipo de archivo por extensión (búsqueda directa al recorrer proyectos)
+_FILE_TYPE_BY_EXTENSION = {
+    ext: file_type
+    for file_type, extensions in HECRAS_FILE_EXTENSIONS.items()
+    for ext in extensions
+}
+
 # Configuración por defecto para RAS Commander
 DEFAULT_RAS_CONFIG = {
     "ras_version": "6.5",
@@ -175,6 +187,37 @@ def validate_hdf_file(file_path: str) -> Dict[str, Any]:
         return {"success": False, "error": f"Error validando archivo HDF: {str(e)}"}
 
 
+def _iter_project_files(project_path: str) -> Iterator[str]:
+    """
+    Recorre los archivos de un directorio con os.scandir.
+
+    Mismo orden que os.walk (archivos de cada directorio y luego sus
+    subdirectorios en profundidad), sin seguir enlaces a directorios y
+    reutilizando el tipo de entrada que devuelve scandir.
+
+    Args:
+        project_path: Directorio raíz
+
+    Yields:
+        Ruta de cada archivo encontrado
+    """
+    stack = [project_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
 def validate_project_directory(project_path: str) -> Dict[str, Any]:
     """
     Valida un directorio de proyecto HEC-RAS.
@@ -200,16 +243,11 @@ def validate_project_directory(project_path: str) -> Dict[str, Any]:
 
         # Buscar archivos de proyecto HEC-RAS
         project_files = {}
-        for root, dirs, files in os.walk(project_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_ext = os.path.splitext(file)[1].lower()
-
-                for file_type, extensions in HECRAS_FILE_EXTENSIONS.items():
-                    if file_ext in extensions:
-                        if file_type not in project_files:
-                            project_files[file_type] = []
-                        project_files[file_type].append(file_path)
+        for file_path in _iter_project_files(project_path):
+            file_ext = os.path.splitext(file_path)[1].lower()
+            file_type = _FILE_TYPE_BY_EXTENSION.get(file_ext)
+            if file_type is not None:
+                project_files.setdefault(file_type, []).append(file_path)
 
         return {
             "success": True,
@@ -266,8 +304,7 @@ def safe_json_serialize(data: Any) -> str:
         String JSON
     """
     try:
-        converted_data = convert_numpy_types(data)
-        return json.dumps(converted_data, indent=2, ensure_ascii=False)
+        return dumps_json(data, indent=True)
     except Exception as e:
         logger.error(f"Error en serialización JSON: {e}")
         return json.dumps({"error": f"Error de serialización: {str(e)}"})
@@ -302,12 +302,13 @@ class RASCommanderProcessor:
                 # Fallback to basic Manning extraction
                 basic_result = analyzer.get_manning_values_table()
                 if basic_result.get("success", False):
+                    basic_data = basic_result.get("data", {})
                     return {
                         "success": True,
-                        "data": basic_result.get("data", {}),
+                        "data": basic_data,
                         "method": "RAS Commander Basic Manning",
-                        "zones_found": len(basic_result.get("data", {}).get("manning_zones", [])),
-                        "calibration_zones": len(basic_result.get("data", {}).get("calibration_zones", [])),
+                        "zones_found": len(basic_data.get("manning_zones", [])),
+                        "calibration_zones": len(basic_data.get("calibration_zones", [])),
                     }
                 else:
                     return basic_result
@@ -6,10 +6,217 @@ Implements hydraulic calculation algorithms for HEC-RAS 2D models
 import json
 import math
 import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from ..utils.common import dumps_json, encode_array
+from ..utils.jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def _manning_residual(depth, flow_rate, width, side_slope, k, conveyance_factor):
+    """Manning residual Q_calc(y) - Q, its derivative and the section properties"""
+    area = (width + side_slope * depth) * depth
+    wetted_perimeter = width + 2.0 * depth * k
+    hydraulic_radius = area / wetted_perimeter
+    r_two_thirds = hydraulic_radius ** (2.0 / 3.0)
+
+    f = conveyance_factor * area * r_two_thirds - flow_rate
+
+    # d/dy [A*R^(2/3)] = R^(2/3) * (5*dA/dy - 4*k*R) / 3, using A/R = P
+    dA_dy = width + 2.0 * side_slope * depth
+    df_dy = (
+        conveyance_factor * r_two_thirds * (5.0 * dA_dy - 4.0 * k * hydraulic_radius)
+    ) / 3.0
+    return f, df_dy, area, wetted_perimeter, hydraulic_radius
+
+
+@njit(cache=True, fastmath=True)
+def _normal_depth_newton(
+    flow_rate, slope, manning_n, width, side_slope, tolerance, max_iterations
+):
+    """
+    Solve normal depth using Newton-Raphson safeguarded by a bisection bracket
+
+    Q_calc(y) is monotonic in y, so every evaluated residual tightens the
+    bracket [low, high]; a Newton step that leaves it is replaced by bisection.
+
+    Returns:
+        Tuple (depth, area, wetted_perimeter, hydraulic_radius, velocity)
+    """
+    # Loop invariants
+    k = math.sqrt(1.0 + side_slope * side_slope)
+    conveyance_factor = math.sqrt(slope) / manning_n
+
+    # Initial guess (wide channel approximation)
+    depth = (flow_rate / (conveyance_factor * max(width, 1.0))) ** 0.6
+
+    # Bracket: residual is -Q at y = 0, grow the upper bound until positive
+    low = 0.0
+    f, df_dy, area, perimeter, radius = _manning_residual(
+        depth, flow_rate, width, side_slope, k, conveyance_factor
+    )
+    while f < 0:
+        low = depth
+        depth = 2.0 * depth
+        f, df_dy, area, perimeter, radius = _manning_residual(
+            depth, flow_rate, width, side_slope, k, conveyance_factor
+        )
+    high = depth
+
+    for _ in range(max_iterations):
+        if abs(f) < tolerance:
+            break
+
+        if f > 0:
+            high = depth
+        else:
+            low = depth
+
+        next_depth = depth - f / df_dy if df_dy > 0 else low
+        if not low < next_depth < high:
+            next_depth = 0.5 * (low + high)
+
+        depth = next_depth
+        f, df_dy, area, perimeter, radius = _manning_residual(
+            depth, flow_rate, width, side_slope, k, conveyance_factor
+        )
+
+    return depth, area, perimeter, radius, flow_rate / area
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _normal_depth_batch_parallel(
+    flow_rate, slope, manning_n, width, side_slope, tolerance, max_iterations
+):
+    """
+    Run _normal_depth_newton for every row of flat input arrays on all cores
+
+    The thread count follows numba's NUMBA_NUM_THREADS environment variable.
+
+    Returns:
+        Tuple of arrays (depth, area, wetted_perimeter, hydraulic_radius,
+        velocity, converged)
+    """
+    n = flow_rate.shape[0]
+    depth = np.empty(n)
+    area = np.empty(n)
+    perimeter = np.empty(n)
+    radius = np.empty(n)
+    velocity = np.empty(n)
+    converged = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        d, a, p, r, v = _normal_depth_newton(
+            flow_rate[i],
+            slope[i],
+            manning_n[i],
+            width[i],
+            side_slope[i],
+            tolerance,
+            max_iterations,
+        )
+        depth[i] = d
+        area[i] = a
+        perimeter[i] = p
+        radius[i] = r
+        velocity[i] = v
+        residual = a * r ** (2.0 / 3.0) * math.sqrt(slope[i]) / manning_n[i]
+        converged[i] = abs(residual - flow_rate[i]) <= tolerance
+    return depth, area, perimeter, radius, velocity, converged
+
+
+# Batches at least this large use the parallel kernel (when numba is
+# installed); below it thread dispatch costs more than the NumPy path
+PARALLEL_BATCH_MIN_SIZE = 10000
+
+
+@njit(cache=True, fastmath=True)
+def _critical_residual(depth, q2_over_g, width, side_slope):
+    """Critical-flow residual Q²T/(gA³) - 1, its derivative, area and top width"""
+    area = (width + side_slope * depth) * depth
+    top_width = width + 2.0 * side_slope * depth
+    area_cubed = area * area * area
+
+    f = q2_over_g * top_width / area_cubed - 1.0
+
+    # d/dy [T/A³] = (2z*A - 3T²) / A⁴, using dA/dy = T
+    df_dy = (
+        q2_over_g
+        * (2.0 * side_slope * area - 3.0 * top_width * top_width)
+        / (area_cubed * area)
+    )
+    return f, df_dy, area, top_width
+
+
+@njit(cache=True, fastmath=True)
+def _critical_depth_newton(
+    flow_rate, width, side_slope, gravity, tolerance, max_iterations
+):
+    """
+    Solve Q²T/(gA³) = 1 using Newton-Raphson safeguarded by a bisection bracket
+
+    Returns:
+        Tuple (depth, area, top_width)
+    """
+    q2_over_g = flow_rate * flow_rate / gravity
+
+    # Initial guess: rectangular critical depth, or triangular if width is zero
+    if width > 0:
+        depth = (q2_over_g / (width * width)) ** (1.0 / 3.0)
+    else:
+        depth = (2.0 * q2_over_g / (side_slope * side_slope)) ** 0.2
+
+    # Bracket: residual decreases with depth, grow the upper bound until negative
+    low = 0.0
+    f, df_dy, area, top_width = _critical_residual(depth, q2_over_g, width, side_slope)
+    while f > 0:
+        low = depth
+        depth = 2.0 * depth
+        f, df_dy, area, top_width = _critical_residual(
+            depth, q2_over_g, width, side_slope
+        )
+    high = depth
+
+    for _ in range(max_iterations):
+        if abs(f) < tolerance:
+            break
+
+        if f < 0:
+            high = depth
+        else:
+            low = depth
+
+        next_depth = depth - f / df_dy if df_dy < 0 else low
+        if not low < next_depth < high:
+            next_depth = 0.5 * (low + high)
+
+        depth = next_depth
+        f, df_dy, area, top_width = _critical_residual(
+            depth, q2_over_g, width, side_slope
+        )
+
+    return depth, area, top_width
+
+
+# Flow regime labels indexed by sign(Fr - 1) + 1
+FLOW_REGIMES = ("subcritical", "critical", "supercritical")
+
+
+# Memoized scalar solves: parameter sweeps (e.g. analyze_flow_conditions over a
+# grid of depths) repeat the same channel inputs many times
+@lru_cache(maxsize=4096)
+def _normal_depth_cached(flow_rate, slope, manning_n, width, side_slope):
+    return _normal_depth_newton(
+        flow_rate, slope, manning_n, width, side_slope, 1e-6, 20
+    )
+
+
+@lru_cache(maxsize=4096)
+def _critical_depth_cached(flow_rate, width, side_slope, gravity):
+    return _critical_depth_newton(flow_rate, width, side_slope, gravity, 1e-10, 20)
+
 
 class HydraulicCalculator:
     """Class for hydraulic calculations and flow analysis"""
@@ -25,6 +232,7 @@ class HydraulicCalculator:
         manning_n: float,
         channel_width: float,
         channel_shape: str = "rectangular",
+        side_slope: float = 0.0,
     ) -> Dict[str, Any]:
         """
         Calculate normal depth using Manning's equation
@@ -33,44 +241,35 @@ class HydraulicCalculator:
             flow_rate: Flow rate in m³/s
             slope: Channel slope (m/m)
             manning_n: Manning's roughness coefficient
-            channel_width: Channel width in meters
+            channel_width: Channel (bottom) width in meters
             channel_shape: Channel shape ("rectangular", "trapezoidal")
+            side_slope: Side slope z (horizontal:vertical), trapezoidal only
 
         Returns:
             Dictionary with normal depth results
         """
         try:
-            if channel_shape == "rectangular":
-                # For rectangular channel: Q = (1/n) * A * R^(2/3) * S^(1/2)
-                # Where A = b*y, R = (b*y)/(b+2*y), b = width, y = depth
-
-                # Iterative solution for normal depth
-                depth = self._solve_normal_depth_rectangular(
-                    flow_rate, slope, manning_n, channel_width
+            side_slope = self._get_side_slope(channel_shape, side_slope)
+            depth, area, wetted_perimeter, hydraulic_radius, velocity = (
+                self._solve_normal_depth(
+                    flow_rate, slope, manning_n, channel_width, side_slope
                 )
+            )
 
-                area = channel_width * depth
-                wetted_perimeter = channel_width + 2 * depth
-                hydraulic_radius = (
-                    area / wetted_perimeter if wetted_perimeter > 0 else 0
-                )
-                velocity = flow_rate / area if area > 0 else 0
-
-                return {
-                    "success": True,
-                    "normal_depth": depth,
-                    "area": area,
-                    "wetted_perimeter": wetted_perimeter,
-                    "hydraulic_radius": hydraulic_radius,
-                    "velocity": velocity,
-                    "flow_rate": flow_rate,
-                    "slope": slope,
-                    "manning_n": manning_n,
-                    "channel_width": channel_width,
-                    "channel_shape": channel_shape,
-                }
-            else:
-                raise ValueError(f"Channel shape '{channel_shape}' not implemented yet")
+            return {
+                "success": True,
+                "normal_depth": depth,
+                "area": area,
+                "wetted_perimeter": wetted_perimeter,
+                "hydraulic_radius": hydraulic_radius,
+                "velocity": velocity,
+                "flow_rate": flow_rate,
+                "slope": slope,
+                "manning_n": manning_n,
+                "channel_width": channel_width,
+                "channel_shape": channel_shape,
+                "side_slope": side_slope,
+            }
 
         except Exception as e:
             return {
@@ -83,47 +282,207 @@ class HydraulicCalculator:
                 "channel_width": channel_width,
             }
 
+    def calculate_normal_depth_batch(
+        self,
+        flow_rate: np.ndarray,
+        slope: np.ndarray,
+        manning_n: np.ndarray,
+        channel_width: np.ndarray,
+        side_slope: np.ndarray = 0.0,
+        max_iterations: int = 50,
+        tolerance: float = 1e-6,
+    ) -> Dict[str, Any]:
+        """
+        Calculate normal depth for many sections/scenarios at once
+
+        Runs the same safeguarded Newton-Raphson iteration as
+        calculate_normal_depth, vectorized over all inputs. Arguments are
+        broadcast against each other, so scalars can be mixed with arrays.
+        With numba installed, batches of PARALLEL_BATCH_MIN_SIZE or more are
+        solved in parallel (thread count set by NUMBA_NUM_THREADS).
+
+        Args:
+            flow_rate: Flow rates in m³/s
+            slope: Channel slopes (m/m)
+            manning_n: Manning's roughness coefficients
+            channel_width: Channel (bottom) widths in meters
+            side_slope: Side slopes z (horizontal:vertical), 0 for rectangular
+            max_iterations: Maximum Newton iterations
+            tolerance: Convergence tolerance on the discharge residual (m³/s)
+
+        Returns:
+            Dictionary with arrays of normal depth results
+        """
+        try:
+            arrays = [
+                np.asarray(value, dtype=np.float64)
+                for value in (flow_rate, slope, manning_n, channel_width, side_slope)
+            ]
+            # Read-only broadcast views (the inputs are never written to)
+            shape = np.broadcast_shapes(*(array.shape for array in arrays))
+            flow_rate, slope, manning_n, width, side_slope = (
+                np.broadcast_to(array, shape) for array in arrays
+            )
+            if np.any(flow_rate <= 0) or np.any(slope <= 0) or np.any(manning_n <= 0):
+                raise ValueError("Flow rate, slope and Manning's n must be positive")
+            if np.any(side_slope < 0):
+                raise ValueError("Side slope must be non-negative")
+            if np.any(width < 0) or np.any(width + side_slope <= 0):
+                raise ValueError("Channel needs a positive width or side slope")
+
+            # Work on flat arrays; results are reshaped to the broadcast shape
+            flow_rate, slope, manning_n, width, side_slope = (
+                value.ravel()
+                for value in (flow_rate, slope, manning_n, width, side_slope)
+            )
+
+            if NUMBA_AVAILABLE and flow_rate.size >= PARALLEL_BATCH_MIN_SIZE:
+                results = _normal_depth_batch_parallel(
+                    flow_rate,
+                    slope,
+                    manning_n,
+                    width,
+                    side_slope,
+                    tolerance,
+                    max_iterations,
+                )
+                keys = (
+                    "normal_depth",
+                    "area",
+                    "wetted_perimeter",
+                    "hydraulic_radius",
+                    "velocity",
+                    "converged",
+                )
+                return {
+                    "success": True,
+                    **{key: value.reshape(shape) for key, value in zip(keys, results)},
+                }
+
+            # Loop invariants
+            k = np.sqrt(1 + side_slope * side_slope)
+            conveyance_factor = np.sqrt(slope) / manning_n
+            four_k = 4 * k
+
+            def manning_residual(
+                y: np.ndarray, rows: Any = Ellipsis
+            ) -> Tuple[np.ndarray, np.ndarray]:
+                """Residual and derivative for the given rows only"""
+                b = width[rows]
+                z = side_slope[rows]
+                area = (b + z * y) * y
+                hydraulic_radius = area / (b + 2 * y * k[rows])
+                r_two_thirds = hydraulic_radius ** (2 / 3)
+                scaled = conveyance_factor[rows] * r_two_thirds
+
+                f = scaled * area - flow_rate[rows]
+
+                # d/dy [A*R^(2/3)] = R^(2/3) * (5*dA/dy - 4*k*R) / 3
+                dA_dy = b + 2 * z * y
+                df_dy = scaled * (5 * dA_dy - four_k[rows] * hydraulic_radius) / 3
+                return f, df_dy
+
+            # Initial guess (wide channel approximation)
+            depth = (flow_rate / (conveyance_factor * np.maximum(width, 1.0))) ** (
+                3 / 5
+            )
+
+            # Bracket: grow the upper bound of every row until its residual is
+            # positive, re-evaluating only the rows still below the target
+            low = np.zeros_like(depth)
+            f, df_dy = manning_residual(depth)
+            rows = np.flatnonzero(f < 0)
+            while rows.size:
+                low[rows] = depth[rows]
+                depth[rows] *= 2
+                f[rows], df_dy[rows] = manning_residual(depth[rows], rows)
+                rows = rows[f[rows] < 0]
+            high = depth.copy()
+
+            # Newton iterations over the rows that have not converged yet
+            rows = np.arange(depth.size)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                for _ in range(max_iterations):
+                    rows = rows[np.abs(f[rows]) > tolerance]
+                    if not rows.size:
+                        break
+
+                    y = depth[rows]
+                    f_rows = f[rows]
+                    positive = f_rows > 0
+                    y_high = np.where(positive, y, high[rows])
+                    y_low = np.where(positive, low[rows], y)
+                    high[rows] = y_high
+                    low[rows] = y_low
+
+                    next_depth = y - f_rows / df_dy[rows]
+                    outside = ~((y_low < next_depth) & (next_depth < y_high))
+                    next_depth[outside] = 0.5 * (y_low[outside] + y_high[outside])
+
+                    depth[rows] = next_depth
+                    f[rows], df_dy[rows] = manning_residual(next_depth, rows)
+
+            area = (width + side_slope * depth) * depth
+            wetted_perimeter = width + 2 * depth * k
+
+            return {
+                "success": True,
+                "normal_depth": depth.reshape(shape),
+                "area": area.reshape(shape),
+                "wetted_perimeter": wetted_perimeter.reshape(shape),
+                "hydraulic_radius": (area / wetted_perimeter).reshape(shape),
+                "velocity": (flow_rate / area).reshape(shape),
+                "converged": (np.abs(f) <= tolerance).reshape(shape),
+            }
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     def calculate_critical_depth(
-        self, flow_rate: float, channel_width: float, channel_shape: str = "rectangular"
+        self,
+        flow_rate: float,
+        channel_width: float,
+        channel_shape: str = "rectangular",
+        side_slope: float = 0.0,
     ) -> Dict[str, Any]:
         """
         Calculate critical depth
 
         Args:
             flow_rate: Flow rate in m³/s
-            channel_width: Channel width in meters
-            channel_shape: Channel shape
+            channel_width: Channel (bottom) width in meters
+            channel_shape: Channel shape ("rectangular", "trapezoidal")
+            side_slope: Side slope z (horizontal:vertical), trapezoidal only
 
         Returns:
             Dictionary with critical depth results
         """
         try:
-            if channel_shape == "rectangular":
-                # For rectangular channel: yc = (Q²/(g*b²))^(1/3)
-                critical_depth = (
-                    flow_rate**2 / (self.gravity * channel_width**2)
-                ) ** (1 / 3)
-
-                area = channel_width * critical_depth
-                velocity = flow_rate / area if area > 0 else 0
-                froude_number = (
-                    velocity / math.sqrt(self.gravity * critical_depth)
-                    if critical_depth > 0
-                    else 0
-                )
+            side_slope = self._get_side_slope(channel_shape, side_slope)
+            gravity = self.gravity
+            critical_depth, area, top_width = self._solve_critical_depth(
+                flow_rate, channel_width, side_slope
+            )
 
-                return {
-                    "success": True,
-                    "critical_depth": critical_depth,
-                    "area": area,
-                    "velocity": velocity,
-                    "froude_number": froude_number,
-                    "flow_rate": flow_rate,
-                    "channel_width": channel_width,
-                    "channel_shape": channel_shape,
-                }
-            else:
-                raise ValueError(f"Channel shape '{channel_shape}' not implemented yet")
+            velocity = flow_rate / area if area > 0 else 0
+            # Froude number uses the hydraulic depth D = A/T
+            froude_number = (
+                velocity / math.sqrt(gravity * area / top_width)
+                if critical_depth > 0
+                else 0
+            )
+
+            return {
+                "success": True,
+                "critical_depth": critical_depth,
+                "area": area,
+                "velocity": velocity,
+                "froude_number": froude_number,
+                "flow_rate": flow_rate,
+                "channel_width": channel_width,
+                "channel_shape": channel_shape,
+                "side_slope": side_slope,
+            }
 
         except Exception as e:
             return {
@@ -142,6 +501,7 @@ class HydraulicCalculator:
         slope: float,
         manning_n: float,
         channel_shape: str = "rectangular",
+        side_slope: float = 0.0,
     ) -> Dict[str, Any]:
         """
         Analyze flow conditions (subcritical, critical, supercritical)
@@ -153,39 +513,44 @@ class HydraulicCalculator:
             slope: Channel slope
             manning_n: Manning's coefficient
             channel_shape: Channel shape
+            side_slope: Side slope z (horizontal:vertical), trapezoidal only
 
         Returns:
             Dictionary with flow analysis results
         """
         try:
-            # Calculate critical depth
-            critical_result = self.calculate_critical_depth(
-                flow_rate, channel_width, channel_shape
-            )
-            critical_depth = critical_result.get("critical_depth", 0)
-
-            # Calculate normal depth
-            normal_result = self.calculate_normal_depth(
-                flow_rate, slope, manning_n, channel_width, channel_shape
-            )
-            normal_depth = normal_result.get("normal_depth", 0)
+            side_slope = self._get_side_slope(channel_shape, side_slope)
+
+            # Reference depths (reported as 0 when they cannot be computed);
+            # solved directly instead of building the full sub-result dicts
+            try:
+                critical_depth = self._solve_critical_depth(
+                    flow_rate, channel_width, side_slope
+                )[0]
+            except (ArithmeticError, ValueError):
+                critical_depth = 0
+
+            try:
+                normal_depth = self._solve_normal_depth(
+                    flow_rate, slope, manning_n, channel_width, side_slope
+                )[0]
+            except (ArithmeticError, ValueError):
+                normal_depth = 0
 
             # Calculate current flow properties
-            area = channel_width * actual_depth
+            area = (channel_width + side_slope * actual_depth) * actual_depth
+            top_width = channel_width + 2 * side_slope * actual_depth
             velocity = flow_rate / area if area > 0 else 0
             froude_number = (
-                velocity / math.sqrt(self.gravity * actual_depth)
-                if actual_depth > 0
+                velocity / math.sqrt(self.gravity * area / top_width)
+                if area > 0 and top_width > 0
                 else 0
             )
 
-            # Determine flow regime
-            if froude_number < 1.0:
-                flow_regime = "subcritical"
-            elif froude_number > 1.0:
-                flow_regime = "supercritical"
-            else:
-                flow_regime = "critical"
+            # Determine flow regime (code 0/1/2 for Fr < 1, Fr = 1, Fr > 1)
+            flow_regime = FLOW_REGIMES[
+                int(froude_number > 1.0) - int(froude_number < 1.0) + 1
+            ]
 
             return {
                 "success": True,
@@ -210,63 +575,60 @@ class HydraulicCalculator:
                 "froude_number": 0,
             }
 
-    def _solve_normal_depth_rectangular(
+    def _solve_normal_depth(
         self,
         flow_rate: float,
         slope: float,
         manning_n: float,
-        width: float,
-        max_iterations: int = 100,
-        tolerance: float = 1e-6,
-    ) -> float:
-        """
-        Solve normal depth for rectangular channel using Newton-Raphson method
-        """
-        # Initial guess
-        depth = (flow_rate * manning_n / (width * math.sqrt(slope))) ** (3 / 5)
-
-        for _ in range(max_iterations):
-            area = width * depth
-            wetted_perimeter = width + 2 * depth
-            hydraulic_radius = area / wetted_perimeter
-
-            # Manning's equation: Q = (1/n) * A * R^(2/3) * S^(1/2)
-            calculated_flow = (
-                (1 / manning_n)
-                * area
-                * (hydraulic_radius ** (2 / 3))
-                * math.sqrt(slope)
-            )
-
-            # Function and derivative for Newton-Raphson
-            f = calculated_flow - flow_rate
-
-            if abs(f) < tolerance:
-                break
-
-            # Derivative calculation
-            dA_dy = width
-            dP_dy = 2
-            dR_dy = (dA_dy * wetted_perimeter - area * dP_dy) / (wetted_perimeter**2)
-
-            df_dy = (
-                (1 / manning_n)
-                * math.sqrt(slope)
-                * (
-                    dA_dy * (hydraulic_radius ** (2 / 3))
-                    + area * (2 / 3) * (hydraulic_radius ** (-1 / 3)) * dR_dy
-                )
-            )
-
-            if abs(df_dy) < 1e-12:
-                break
-
-            depth = depth - f / df_dy
+        channel_width: float,
+        side_slope: float,
+    ) -> Tuple[float, float, float, float, float]:
+        """Normal depth and section properties (depth, A, P, R, V)"""
+        if flow_rate <= 0 or slope <= 0 or manning_n <= 0:
+            raise ValueError("Flow rate, slope and Manning's n must be positive")
+        if channel_width < 0 or channel_width + side_slope <= 0:
+            raise ValueError("Channel needs a positive width or side slope")
+
+        # Q = (1/n) * A * R^(2/3) * S^(1/2)
+        # Where A = (b + z*y)*y, P = b + 2*y*sqrt(1 + z²), R = A/P
+        return _normal_depth_cached(
+            float(flow_rate),
+            float(slope),
+            float(manning_n),
+            float(channel_width),
+            side_slope,
+        )
 
-            # Ensure positive depth
-            depth = max(depth, 0.001)
+    def _solve_critical_depth(
+        self, flow_rate: float, channel_width: float, side_slope: float
+    ) -> Tuple[float, float, float]:
+        """Critical depth, area and top width (rectangular or trapezoidal section)"""
+        if side_slope == 0:
+            # For rectangular channel: yc = (Q²/(g*b²))^(1/3)
+            depth = (
+                flow_rate * flow_rate / (self.gravity * channel_width * channel_width)
+            ) ** (1 / 3)
+            return depth, channel_width * depth, channel_width
+
+        # Q²T/(gA³) = 1 has no closed form for trapezoidal sections
+        if flow_rate <= 0:
+            raise ValueError("Flow rate must be positive")
+        if channel_width < 0:
+            raise ValueError("Channel width must be non-negative")
+        return _critical_depth_cached(
+            float(flow_rate), float(channel_width), side_slope, self.gravity
+        )
 
-        return depth
+    @staticmethod
+    def _get_side_slope(channel_shape: str, side_slope: float) -> float:
+        """Validate channel shape and return the side slope to use"""
+        if channel_shape == "rectangular":
+            return 0.0
+        if channel_shape == "trapezoidal":
+            if side_slope < 0:
+                raise ValueError("Side slope must be non-negative")
+            return float(side_slope)
+        raise ValueError(f"Channel shape '{channel_shape}' not implemented yet")
 
 
 def main():
@@ -279,6 +641,10 @@ def main():
         print(
             "  analyze <flow> <depth> <width> <slope> <manning_n> - Analyze flow conditions"
         )
+        print(
+            "  normal_batch <data_file> - Calculate normal depths from a JSON file"
+            " (arrays returned base64 encoded)"
+        )
         sys.exit(1)
 
     command = sys.argv[1]
@@ -293,14 +659,14 @@ def main():
             width = float(sys.argv[5])
 
             result = calc.calculate_normal_depth(flow, slope, manning_n, width)
-            print(json.dumps(result, indent=2))
+            print(dumps_json(result, indent=True))
 
         elif command == "critical" and len(sys.argv) >= 4:
             flow = float(sys.argv[2])
             width = float(sys.argv[3])
 
             result = calc.calculate_critical_depth(flow, width)
-            print(json.dumps(result, indent=2))
+            print(dumps_json(result, indent=True))
 
         elif command == "analyze" and len(sys.argv) >= 7:
             flow = float(sys.argv[2])
@@ -310,7 +676,26 @@ def main():
             manning_n = float(sys.argv[6])
 
             result = calc.analyze_flow_conditions(flow, depth, width, slope, manning_n)
-            print(json.dumps(result, indent=2))
+            print(dumps_json(result, indent=True))
+
+        elif command == "normal_batch" and len(sys.argv) >= 3:
+            # JSON file with arrays (or scalars) for each input
+            with open(sys.argv[2], "r") as f:
+                data_dict = json.load(f)
+
+            result = calc.calculate_normal_depth_batch(
+                data_dict["flow_rate"],
+                data_dict["slope"],
+                data_dict["manning_n"],
+                data_dict["channel_width"],
+                data_dict.get("side_slope", 0.0),
+            )
+            # Arrays are sent as base64 raw bytes (see encode_array)
+            result = {
+                key: encode_array(value) if isinstance(value, np.ndarray) else value
+                for key, value in result.items()
+            }
+            print(dumps_json(result, indent=True))
 
         else:
             print(f"Unknown command or insufficient arguments: {command}")
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
@@ -20,7 +21,14 @@ from matplotlib.colors import LinearSegmentedColormap
 from matplotlib.patches import Rectangle
 
 # Import utilities
-from ..utils.common import format_error_message, setup_logging, validate_file_path
+from ..utils.common import (
+    format_error_message,
+    setup_logging,
+    validate_file_path,
+)
+from ..utils.jit import NUMBA_AVAILABLE, njit
+
+matplotlib.use("Agg")  # Use non-interactive backend
 
 # Configure matplotlib for better hydraulic plots
 plt.style.use("default")
@@ -30,6 +38,43 @@ plt.rcParams["axes.grid"] = True
 plt.rcParams["grid.alpha"] = 0.3
 
 
+@njit(cache=True)
+def _summary_stats_kernel(data):
+    """Min, max and mean of a 1D float array in a single pass"""
+    minimum = data[0]
+    maximum = data[0]
+    total = 0.0
+    for value in data:
+        if value < minimum:
+            minimum = value
+        if value > maximum:
+            maximum = value
+        total += value
+    return minimum, maximum, total / data.size
+
+
+def summary_stats(data: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Compute min, max and mean of an array
+
+    Uses a single fused pass over memory when numba is available, otherwise
+    falls back to NumPy reductions. NaN values are ignored.
+
+    Args:
+        data: Input data (flattened)
+
+    Returns:
+        Tuple (min, max, mean), all NaN if there is no valid value
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64).ravel()
+    data = data[~np.isnan(data)]
+    if data.size == 0:
+        return np.nan, np.nan, np.nan
+    if NUMBA_AVAILABLE:
+        return _summary_stats_kernel(data)
+    return float(data.min()), float(data.max()), float(data.mean())
+
+
 class HydraulicPlotter:
     """Class for creating specialized hydraulic plots"""
 
@@ -74,9 +119,7 @@ class HydraulicPlotter:
             ax.plot(time_hours, data, linewidth=2, color=self.water_colors[1])
 
             # Add statistics
-            max_wse = np.max(data)
-            min_wse = np.min(data)
-            mean_wse = np.mean(data)
+            min_wse, max_wse, mean_wse = summary_stats(data)
 
             # Add horizontal lines for statistics
             ax.axhline(
@@ -136,6 +179,9 @@ class HydraulicPlotter:
             if time_hours is None:
                 time_hours = np.arange(len(data))
 
+            # Statistics
+            _, max_vel, mean_vel = summary_stats(data)
+
             # Plot velocity
             ax.plot(time_hours, data, linewidth=2, color=self.velocity_colors[0])
             ax.fill_between(time_hours, data, alpha=0.3, color=self.velocity_colors[1])
@@ -157,16 +203,12 @@ class HydraulicPlotter:
             )
             ax.axhspan(
                 high_velocity,
-                np.max(data) * 1.1,
+                max_vel * 1.1,
                 alpha=0.1,
                 color="red",
                 label="Flujo Supercrítico",
             )
 
-            # Statistics
-            max_vel = np.max(data)
-            mean_vel = np.mean(data)
-
             ax.set_xlabel("Tiempo (horas)", fontsize=12)
             ax.set_ylabel("Velocidad (m/s)", fontsize=12)
             ax.set_title(title, fontsize=16, fontweight="bold")
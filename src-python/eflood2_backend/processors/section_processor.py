@@ -4,17 +4,29 @@ Handles cross-section extraction, terrain interpolation, and profile visualizati
 """
 
 import json
+import math
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.interpolate import griddata, interp1d
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from scipy.interpolate import (
+    CloughTocher2DInterpolator,
+    LinearNDInterpolator,
+)
+from scipy.spatial import Delaunay, cKDTree
 
 # Import utilities
-from ..utils.common import format_error_message, setup_logging, validate_file_path
+from ..utils.common import (
+    dumps_json,
+    format_error_message,
+    setup_logging,
+    validate_file_path,
+)
+from ..utils.jit import NUMBA_AVAILABLE, njit
 
 matplotlib.use("Agg")  # Use non-interactive backend
 
@@ -22,6 +34,94 @@ matplotlib.use("Agg")  # Use non-interactive backend
 logger = setup_logging()
 
 
+# No fastmath here: it would let numba assume the NaN checks are always false
+@njit(cache=True)
+def _wetted_section(distances, elevations, water_level):
+    """
+    Single pass over a section profile accumulating its wetted geometry
+
+    NaN elevations are skipped; consecutive wetted points (elevation at or
+    below the water level) are joined by straight segments.
+
+    Returns:
+        Tuple (valid_points, wetted_points, area, perimeter, first_distance,
+        last_distance, max_depth)
+    """
+    valid_points = 0
+    wetted_points = 0
+    area = 0.0
+    perimeter = 0.0
+    first_distance = 0.0
+    last_distance = 0.0
+    max_depth = 0.0
+    last_elevation = 0.0
+    last_depth = 0.0
+
+    for i in range(len(distances)):
+        elevation = elevations[i]
+        if math.isnan(elevation):
+            continue
+        valid_points += 1
+        if elevation > water_level:
+            continue
+
+        distance = distances[i]
+        depth = water_level - elevation
+        if wetted_points == 0:
+            first_distance = distance
+            max_depth = depth
+        else:
+            dx = distance - last_distance
+            area += dx * (depth + last_depth) / 2.0
+            perimeter += math.sqrt(dx * dx + (elevation - last_elevation) ** 2)
+            max_depth = max(max_depth, depth)
+
+        wetted_points += 1
+        last_distance = distance
+        last_elevation = elevation
+        last_depth = depth
+
+    return (
+        valid_points,
+        wetted_points,
+        area,
+        perimeter,
+        first_distance,
+        last_distance,
+        max_depth,
+    )
+
+
+def _wetted_section_vectorized(distances, elevations, water_level):
+    """
+    NumPy equivalent of _wetted_section, used when numba is not installed
+
+    Returns:
+        Tuple with the same fields as _wetted_section
+    """
+    valid_mask = ~np.isnan(elevations)
+    wetted_mask = valid_mask & (elevations <= water_level)
+    wetted_distances = distances[wetted_mask]
+    wetted_elevations = elevations[wetted_mask]
+    if len(wetted_distances) == 0:
+        return int(valid_mask.sum()), 0, 0.0, 0.0, 0.0, 0.0, 0.0
+
+    depths = water_level - wetted_elevations
+    dx = np.diff(wetted_distances)
+    area = np.sum(dx * (depths[:-1] + depths[1:]) / 2.0)
+    perimeter = np.sum(np.hypot(dx, np.diff(wetted_elevations)))
+
+    return (
+        int(valid_mask.sum()),
+        len(wetted_distances),
+        area,
+        perimeter,
+        wetted_distances[0],
+        wetted_distances[-1],
+        depths.max(),
+    )
+
+
 class SectionProcessor:
     """Class for handling cross-section operations and terrain analysis"""
 
@@ -30,6 +130,10 @@ class SectionProcessor:
         self.terrain_data = None
         self.mesh_points = None
         self.mesh_values = None
+        self._triangulation = None
+        self._interpolators = {}
+        self._tree = None
+        self._figure = None
 
     def load_terrain_data(self, points: np.ndarray, elevations: np.ndarray) -> None:
         """
@@ -41,6 +145,128 @@ class SectionProcessor:
         """
         self.mesh_points = points
         self.mesh_values = elevations
+        self._triangulation = None
+        self._interpolators = {}
+        self._tree = None
+
+    def get_triangulation(self) -> Delaunay:
+        """
+        Delaunay triangulation of the terrain points, built once per terrain
+
+        The triangulation can be passed to RasterExporter.create_mesh_raster
+        to rasterize the same terrain without triangulating it again.
+        """
+        if self.mesh_points is None:
+            raise ValueError("Terrain data must be loaded first")
+        if self._triangulation is None:
+            self._triangulation = Delaunay(self.mesh_points)
+        return self._triangulation
+
+    def _get_tree(self) -> cKDTree:
+        """KD-tree of the terrain points for 'idw' and 'nearest', built once"""
+        if self.mesh_points is None:
+            raise ValueError("Terrain data must be loaded first")
+        if self._tree is None:
+            self._tree = cKDTree(self.mesh_points)
+        return self._tree
+
+    def _interpolate_batch(self, query_points: np.ndarray, k: int = 16) -> np.ndarray:
+        """
+        Inverse-distance weighted elevations from the k nearest terrain points
+
+        The KD-tree is built on first use and kept for the loaded terrain, so
+        repeated sampling of a fixed terrain avoids rebuilding it.
+
+        Args:
+            query_points: Array of (x, y) coordinates
+            k: Number of neighbours used for each query point
+
+        Returns:
+            Elevations at each query point
+        """
+        tree = self._get_tree()
+        k = min(k, len(self.mesh_values))
+        distances, indices = tree.query(query_points, k=k)
+        if k == 1:
+            return np.asarray(self.mesh_values)[indices]
+
+        weights = 1.0 / (distances + 1e-12) ** 2
+        weights /= weights.sum(axis=1, keepdims=True)
+        return np.einsum("ij,ij->i", weights, np.asarray(self.mesh_values)[indices])
+
+    def _interpolate_elevations(
+        self, query_points: np.ndarray, interpolation_method: str = "linear"
+    ) -> np.ndarray:
+        """
+        Interpolate terrain elevations at arbitrary points
+
+        Equivalent to griddata, but the triangulation is reused across calls.
+        'idw' uses inverse-distance weighting of the nearest terrain points.
+
+        Args:
+            query_points: Array of (x, y) coordinates
+            interpolation_method: Interpolation method ('linear', 'cubic',
+                'nearest', 'idw')
+
+        Returns:
+            Elevations at each query point (NaN outside the terrain for
+            'linear' and 'cubic')
+        """
+        if self.mesh_points is None or self.mesh_values is None:
+            raise ValueError("Terrain data must be loaded first")
+
+        if interpolation_method == "idw":
+            return self._interpolate_batch(query_points)
+        if interpolation_method == "nearest":
+            _, indices = self._get_tree().query(query_points)
+            return np.asarray(self.mesh_values)[indices]
+
+        # Interpolators are cached per terrain (Clough-Tocher also estimates
+        # the gradients at every terrain point when built)
+        interpolator = self._interpolators.get(interpolation_method)
+        if interpolator is None:
+            if interpolation_method == "linear":
+                interpolator_class = LinearNDInterpolator
+            elif interpolation_method == "cubic":
+                interpolator_class = CloughTocher2DInterpolator
+            else:
+                raise ValueError(
+                    f"Unknown interpolation method: {interpolation_method}"
+                )
+            interpolator = interpolator_class(
+                self.get_triangulation(), self.mesh_values, fill_value=np.nan
+            )
+            self._interpolators[interpolation_method] = interpolator
+
+        return interpolator(query_points)
+
+    @staticmethod
+    def _build_profile(
+        x_section: np.ndarray,
+        y_section: np.ndarray,
+        elevations: np.ndarray,
+        start_point: Tuple[float, float],
+        end_point: Tuple[float, float],
+        interpolation_method: str,
+    ) -> Dict[str, Any]:
+        """Assemble the profile dictionary for points along a straight section"""
+        num_points = len(x_section)
+        x_start, y_start = start_point
+        x_end, y_end = end_point
+
+        # Calculate distances along section (points are evenly spaced)
+        total_length = float(np.hypot(x_end - x_start, y_end - y_start))
+        distances = np.arange(num_points) * (total_length / max(num_points - 1, 1))
+
+        return {
+            "coordinates": {"x": x_section, "y": y_section},
+            "elevations": elevations,
+            "distances": distances,
+            "start_point": start_point,
+            "end_point": end_point,
+            "total_length": total_length,
+            "interpolation_method": interpolation_method,
+        }
 
     def extract_section_profile(
         self,
@@ -56,7 +282,8 @@ class SectionProcessor:
             start_point: (x, y) coordinates of section start
             end_point: (x, y) coordinates of section end
             num_points: Number of points along the section
-            interpolation_method: Interpolation method ('linear', 'cubic', 'nearest')
+            interpolation_method: Interpolation method ('linear', 'cubic',
+                'nearest', 'idw')
 
         Returns:
             Dictionary with section profile data
@@ -73,31 +300,17 @@ class SectionProcessor:
         section_points = np.column_stack((x_section, y_section))
 
         # Interpolate elevations at section points
-        elevations = griddata(
-            self.mesh_points,
-            self.mesh_values,
-            section_points,
-            method=interpolation_method,
-            fill_value=np.nan,
+        elevations = self._interpolate_elevations(section_points, interpolation_method)
+
+        return self._build_profile(
+            x_section,
+            y_section,
+            elevations,
+            start_point,
+            end_point,
+            interpolation_method,
         )
 
-        # Calculate distances along section
-        distances = np.zeros(num_points)
-        for i in range(1, num_points):
-            dx = x_section[i] - x_section[i - 1]
-            dy = y_section[i] - y_section[i - 1]
-            distances[i] = distances[i - 1] + np.sqrt(dx**2 + dy**2)
-
-        return {
-            "coordinates": {"x": x_section.tolist(), "y": y_section.tolist()},
-            "elevations": elevations.tolist(),
-            "distances": distances.tolist(),
-            "start_point": start_point,
-            "end_point": end_point,
-            "total_length": distances[-1],
-            "interpolation_method": interpolation_method,
-        }
-
     def generate_multiple_sections(
         self,
         axis_data: Dict[str, Any],
@@ -124,59 +337,109 @@ class SectionProcessor:
         stations = axis_data["stations"]
         bearings = axis_data["bearings"]
 
-        # Interpolate axis data
-        interp_x = interp1d(stations, x_coords, kind="linear")
-        interp_y = interp1d(stations, y_coords, kind="linear")
-        interp_bearing = interp1d(stations, bearings, kind="linear")
-
-        current_station = 0.0
-        section_id = 1
-
-        while current_station <= stations[-1]:
-            # Get point and bearing at current station
-            x_center = float(interp_x(current_station))
-            y_center = float(interp_y(current_station))
-            bearing = float(interp_bearing(current_station))
-
-            # Calculate perpendicular bearing for cross-section
-            perp_bearing = bearing + 90.0
-            perp_rad = np.radians(perp_bearing)
+        # Sample every station at once (linear interpolation along the axis).
+        # Stations outside the axis get NaN instead of being clamped to its ends
+        num_sections = int(np.floor(stations[-1] / section_spacing + 1e-9)) + 1
+        section_stations = np.minimum(
+            np.arange(num_sections) * section_spacing, stations[-1]
+        )
+        x_centers = np.interp(
+            section_stations, stations, x_coords, left=np.nan, right=np.nan
+        )
+        y_centers = np.interp(
+            section_stations, stations, y_coords, left=np.nan, right=np.nan
+        )
 
-            # Calculate section endpoints
-            half_width = section_width / 2.0
-            dx = half_width * np.sin(perp_rad)
-            dy = half_width * np.cos(perp_rad)
+        # Calculate perpendicular bearing and endpoints for every cross-section
+        perp_bearings = (
+            np.interp(section_stations, stations, bearings, left=np.nan, right=np.nan)
+            + 90.0
+        )
+        perp_rad = np.radians(perp_bearings)
+        half_width = section_width / 2.0
+        dx = half_width * np.sin(perp_rad)
+        dy = half_width * np.cos(perp_rad)
+
+        valid = ~(np.isnan(x_centers) | np.isnan(y_centers) | np.isnan(dx))
+        for station in section_stations[~valid]:
+            print(
+                f"Warning: Failed to extract section at station {station}: "
+                "station outside the axis"
+            )
 
-            start_point = (x_center - dx, y_center - dy)
-            end_point = (x_center + dx, y_center + dy)
+        # Points along all sections, shape (num_sections, num_points_per_section)
+        t = np.linspace(0.0, 1.0, num_points_per_section)
+        x_sections = (x_centers - dx)[:, None] + (2 * dx)[:, None] * t
+        y_sections = (y_centers - dy)[:, None] + (2 * dy)[:, None] * t
 
-            # Extract section profile
+        # Interpolate all valid sections in a single call on the cached
+        # triangulation; if that fails, retry section by section so a bad
+        # section only skips itself
+        elevations = np.full(x_sections.shape, np.nan)
+        if valid.any():
             try:
-                profile = self.extract_section_profile(
-                    start_point, end_point, num_points_per_section
-                )
+                elevations[valid] = self._interpolate_elevations(
+                    np.column_stack(
+                        (x_sections[valid].ravel(), y_sections[valid].ravel())
+                    )
+                ).reshape(-1, num_points_per_section)
+            except Exception:
+                for i in np.flatnonzero(valid):
+                    try:
+                        elevations[i] = self._interpolate_elevations(
+                            np.column_stack((x_sections[i], y_sections[i]))
+                        )
+                    except Exception as e:
+                        print(
+                            "Warning: Failed to extract section at station "
+                            f"{section_stations[i]}: {e}"
+                        )
+                        valid[i] = False
+
+        axis_name = axis_data.get("name", "Unknown")
+        for i in np.flatnonzero(valid):
+            x_center = float(x_centers[i])
+            y_center = float(y_centers[i])
+            start_point = (x_center - float(dx[i]), y_center - float(dy[i]))
+            end_point = (x_center + float(dx[i]), y_center + float(dy[i]))
+
+            profile = self._build_profile(
+                x_sections[i],
+                y_sections[i],
+                elevations[i],
+                start_point,
+                end_point,
+                "linear",
+            )
+            profile.update(
+                {
+                    "section_id": int(i) + 1,
+                    "station": float(section_stations[i]),
+                    "center_point": (x_center, y_center),
+                    "bearing": float(perp_bearings[i]),
+                    "axis_name": axis_name,
+                }
+            )
+            sections.append(profile)
 
-                profile.update(
-                    {
-                        "section_id": section_id,
-                        "station": current_station,
-                        "center_point": (x_center, y_center),
-                        "bearing": perp_bearing,
-                        "axis_name": axis_data.get("name", "Unknown"),
-                    }
-                )
+        return sections
 
-                sections.append(profile)
+    @staticmethod
+    def to_json(section_data: Dict[str, Any], indent: bool = False) -> str:
+        """
+        Serialize a section (or list of sections) to JSON
 
-            except Exception as e:
-                print(
-                    f"Warning: Failed to extract section at station {current_station}: {e}"
-                )
+        Profiles keep their coordinates, elevations and distances as numpy
+        arrays; they are only converted here, at the serialization boundary.
 
-            current_station += section_spacing
-            section_id += 1
+        Args:
+            section_data: Section profile data or list of sections
+            indent: Pretty-print with 2-space indentation
 
-        return sections
+        Returns:
+            JSON string
+        """
+        return dumps_json(section_data, indent=indent)
 
     def plot_section_profile(
         self,
@@ -184,42 +447,55 @@ class SectionProcessor:
         output_path: str,
         title: Optional[str] = None,
         show_water_level: Optional[float] = None,
+        dpi: int = 150,
     ) -> None:
         """
         Create a plot of the section profile
 
+        The figure is created once per SectionProcessor and cleared for each
+        plot, so batches of sections skip building a new figure every time.
+        It is built outside pyplot, so it is not kept in pyplot's global
+        figure registry and is freed with the processor.
+
         Args:
             section_data: Section profile data
             output_path: Path for output image file
             title: Plot title (optional)
             show_water_level: Water level to show on plot (optional)
+            dpi: Output resolution
         """
-        distances = section_data["distances"]
-        elevations = section_data["elevations"]
+        distances = np.asarray(section_data["distances"], dtype=np.float64)
+        elevations = np.asarray(section_data["elevations"], dtype=np.float64)
 
         # Filter out NaN values
         valid_mask = ~np.isnan(elevations)
-        distances_clean = np.array(distances)[valid_mask]
-        elevations_clean = np.array(elevations)[valid_mask]
+        distances_clean = distances[valid_mask]
+        elevations_clean = elevations[valid_mask]
 
         if len(distances_clean) == 0:
             raise ValueError("No valid elevation data for plotting")
 
-        plt.figure(figsize=(12, 6))
+        if self._figure is None:
+            self._figure = Figure(figsize=(12, 6))
+            FigureCanvasAgg(self._figure)
+        else:
+            self._figure.clear()
+        fig = self._figure
+        ax = fig.add_subplot()
 
         # Plot terrain profile
-        plt.plot(distances_clean, elevations_clean, "b-", linewidth=2, label="Terrain")
-        plt.fill_between(
+        ax.plot(distances_clean, elevations_clean, "b-", linewidth=2, label="Terrain")
+        ax.fill_between(
             distances_clean,
             elevations_clean,
-            min(elevations_clean) - 1,
+            elevations_clean.min() - 1,
             alpha=0.3,
             color="brown",
         )
 
         # Plot water level if provided
         if show_water_level is not None:
-            plt.axhline(
+            ax.axhline(
                 y=show_water_level,
                 color="cyan",
                 linestyle="--",
@@ -227,32 +503,31 @@ class SectionProcessor:
                 label=f"Water Level: {show_water_level:.2f}m",
             )
 
-        plt.xlabel("Distance (m)")
-        plt.ylabel("Elevation (m)")
-        plt.title(
+        ax.set_xlabel("Distance (m)")
+        ax.set_ylabel("Elevation (m)")
+        ax.set_title(
             title
             or f"Cross-Section Profile (Station: {section_data.get('station', 'N/A')})"
         )
-        plt.grid(True, alpha=0.3)
-        plt.legend()
+        ax.grid(True, alpha=0.3)
+        ax.legend()
 
         # Add section info as text
         info_text = f"Length: {section_data['total_length']:.1f}m\n"
-        info_text += f"Min Elev: {min(elevations_clean):.2f}m\n"
-        info_text += f"Max Elev: {max(elevations_clean):.2f}m"
+        info_text += f"Min Elev: {elevations_clean.min():.2f}m\n"
+        info_text += f"Max Elev: {elevations_clean.max():.2f}m"
 
-        plt.text(
+        ax.text(
             0.02,
             0.98,
             info_text,
-            transform=plt.gca().transAxes,
+            transform=ax.transAxes,
             verticalalignment="top",
             bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
         )
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches="tight")
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=dpi, bbox_inches="tight")
 
     def calculate_hydraulic_properties(
         self, section_data: Dict[str, Any], water_level: float
@@ -267,21 +542,27 @@ class SectionProcessor:
         Returns:
             Dictionary with hydraulic properties
         """
-        distances = np.array(section_data["distances"])
-        elevations = np.array(section_data["elevations"])
+        distances = np.asarray(section_data["distances"], dtype=np.float64)
+        elevations = np.asarray(section_data["elevations"], dtype=np.float64)
 
-        # Filter out NaN values
-        valid_mask = ~np.isnan(elevations)
-        distances_clean = distances[valid_mask]
-        elevations_clean = elevations[valid_mask]
-
-        if len(distances_clean) == 0:
+        # Compiled single-pass kernel, or whole-array NumPy ops without numba
+        wetted_section = (
+            _wetted_section if NUMBA_AVAILABLE else _wetted_section_vectorized
+        )
+        (
+            valid_points,
+            wetted_points,
+            wetted_area,
+            wetted_perimeter,
+            first_distance,
+            last_distance,
+            max_depth,
+        ) = wetted_section(distances, elevations, float(water_level))
+
+        if valid_points == 0:
             return {"error": "No valid elevation data"}
 
-        # Find wetted area
-        wetted_mask = elevations_clean <= water_level
-
-        if not np.any(wetted_mask):
+        if wetted_points == 0:
             return {
                 "wetted_area": 0.0,
                 "wetted_perimeter": 0.0,
@@ -290,36 +571,11 @@ class SectionProcessor:
                 "max_depth": 0.0,
             }
 
-        # Calculate wetted area using trapezoidal rule
-        wetted_distances = distances_clean[wetted_mask]
-        wetted_elevations = elevations_clean[wetted_mask]
-        depths = water_level - wetted_elevations
-
-        # Simple trapezoidal integration for area
-        if len(wetted_distances) > 1:
-            dx = np.diff(wetted_distances)
-            avg_depths = (depths[:-1] + depths[1:]) / 2
-            wetted_area = np.sum(dx * avg_depths)
-        else:
-            wetted_area = 0.0
-
-        # Calculate wetted perimeter
-        wetted_perimeter = 0.0
-        for i in range(1, len(wetted_distances)):
-            dx = wetted_distances[i] - wetted_distances[i - 1]
-            dy = wetted_elevations[i] - wetted_elevations[i - 1]
-            wetted_perimeter += np.sqrt(dx**2 + dy**2)
-
         # Calculate other properties
         hydraulic_radius = (
             wetted_area / wetted_perimeter if wetted_perimeter > 0 else 0.0
         )
-        top_width = (
-            wetted_distances[-1] - wetted_distances[0]
-            if len(wetted_distances) > 1
-            else 0.0
-        )
-        max_depth = np.max(depths) if len(depths) > 0 else 0.0
+        top_width = last_distance - first_distance
 
         return {
             "wetted_area": float(wetted_area),
@@ -362,7 +618,8 @@ class SectionProcessor:
 
             # Write data
             for section in sections:
-                elevations = [e for e in section["elevations"] if not np.isnan(e)]
+                elevations = np.asarray(section["elevations"], dtype=np.float64)
+                elevations = elevations[~np.isnan(elevations)]
 
                 writer.writerow(
                     [
@@ -371,8 +628,8 @@ class SectionProcessor:
                         section.get("center_point", [0, 0])[0],
                         section.get("center_point", [0, 0])[1],
                         section.get("total_length", ""),
-                        min(elevations) if elevations else "",
-                        max(elevations) if elevations else "",
+                        elevations.min() if elevations.size else "",
+                        elevations.max() if elevations.size else "",
                         section.get("bearing", ""),
                         section.get("axis_name", ""),
                     ]
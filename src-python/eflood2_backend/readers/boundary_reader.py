@@ -8,7 +8,8 @@ import json
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 import h5py
 import numpy as np
@@ -19,6 +20,52 @@ from ..utils.common import format_error_message, setup_logging, validate_file_pa
 # Configure logging
 logger = setup_logging()
 
+# Name fragments that mark an HDF item as a boundary condition
+_BC_INDICATORS = (
+    "entrada",
+    "salida",
+    "inflow",
+    "outflow",
+    "inlet",
+    "outlet",
+    "rio",
+    "river",
+    "boundary",
+    "condition",
+    "hydrograph",
+    "stage",
+    "flow",
+    "discharge",
+    "caudal",
+    "nivel",
+)
+
+# Name fragments of items that are never boundary conditions
+_AVOID_INDICATORS = (
+    "geometry",
+    "mesh",
+    "terrain",
+    "material",
+    "manning",
+    "results",
+    "output",
+    "time",
+    "coordinates",
+)
+
+# Generic group names that contain boundary conditions rather than being one
+_BC_GROUP_NAMES = frozenset(
+    ("boundary conditions", "flow hydrographs", "stage hydrographs")
+)
+
+# Boundary condition types, checked in order against the lowercased name
+_BC_TYPE_KEYWORDS = (
+    ("Caudal de Entrada", ("entrada", "inflow", "inlet", "rio")),
+    ("Nivel de Salida", ("salida", "outflow", "outlet", "stage")),
+    ("Hidrograma de Caudal", ("flow", "discharge", "caudal")),
+    ("Hidrograma de Nivel", ("stage", "level", "nivel")),
+)
+
 
 class BoundaryReader:
     """
@@ -26,14 +73,49 @@ class BoundaryReader:
     Combines basic and enhanced boundary condition extraction capabilities
     """
 
-    def __init__(self, hdf_file_path: str):
+    def __init__(
+        self, hdf_file_path: str, h5_file: Optional[h5py.File] = None, **h5_kwargs
+    ):
         """
         Initialize the boundary conditions reader
 
         Args:
             hdf_file_path (str): Path to the HDF5 file
+            h5_file (h5py.File): Already open file to read from instead of
+                opening hdf_file_path (optional)
+            **h5_kwargs: Extra h5py.File options used when opening the file,
+                e.g. chunk cache sizing (rdcc_nbytes, rdcc_nslots, rdcc_w0)
+        """
+        self._h5_file = h5_file
+        self._h5_kwargs = h5_kwargs
+        if h5_file is not None:
+            self.hdf_file_path = hdf_file_path
+        else:
+            self.hdf_file_path = validate_file_path(
+                hdf_file_path, [".hdf", ".h5", ".hdf5"]
+            )
+
+    @classmethod
+    def from_handle(cls, h5_file: h5py.File) -> "BoundaryReader":
         """
-        self.hdf_file_path = validate_file_path(hdf_file_path, [".hdf", ".h5", ".hdf5"])
+        Create a reader sharing an already open HDF5 file (owned by the caller)
+
+        Args:
+            h5_file (h5py.File): Open HDF5 file
+
+        Returns:
+            BoundaryReader reading from h5_file
+        """
+        return cls(h5_file.filename, h5_file=h5_file)
+
+    @contextmanager
+    def _open(self) -> Iterator[h5py.File]:
+        """Yield the shared HDF5 handle, or open (and close) the file"""
+        if self._h5_file is not None:
+            yield self._h5_file
+        else:
+            with h5py.File(self.hdf_file_path, "r", **self._h5_kwargs) as hf:
+                yield hf
 
     def extract_boundary_conditions(self, enhanced_mode: bool = True) -> Dict[str, Any]:
         """
@@ -46,7 +128,7 @@ class BoundaryReader:
             Dict containing boundary conditions data
         """
         try:
-            with h5py.File(self.hdf_file_path, "r") as hf:
+            with self._open() as hf:
                 logger.info(f"Reading boundary conditions from: {self.hdf_file_path}")
 
                 # Search for boundary condition groups
@@ -189,11 +271,7 @@ class BoundaryReader:
                         bc_item = bc_group[bc_name]
 
                         # Skip if this looks like a generic group name
-                        if bc_name.lower() in [
-                            "boundary conditions",
-                            "flow hydrographs",
-                            "stage hydrographs",
-                        ]:
+                        if bc_name.lower() in _BC_GROUP_NAMES:
                             # This is a group, search inside it
                             if hasattr(bc_item, "keys"):
                                 for sub_bc_name in bc_item.keys():
@@ -353,49 +431,16 @@ class BoundaryReader:
         name_lower = name.lower()
         path_lower = path.lower()
 
-        # Positive indicators
-        bc_indicators = [
-            "entrada",
-            "salida",
-            "inflow",
-            "outflow",
-            "inlet",
-            "outlet",
-            "rio",
-            "river",
-            "boundary",
-            "condition",
-            "hydrograph",
-            "stage",
-            "flow",
-            "discharge",
-            "caudal",
-            "nivel",
-        ]
-
-        # Negative indicators (things to avoid)
-        avoid_indicators = [
-            "geometry",
-            "mesh",
-            "terrain",
-            "material",
-            "manning",
-            "results",
-            "output",
-            "time",
-            "coordinates",
-        ]
-
         # Check for positive indicators
         has_positive = any(
             indicator in name_lower or indicator in path_lower
-            for indicator in bc_indicators
+            for indicator in _BC_INDICATORS
         )
 
         # Check for negative indicators
         has_negative = any(
             indicator in name_lower or indicator in path_lower
-            for indicator in avoid_indicators
+            for indicator in _AVOID_INDICATORS
         )
 
         return has_positive and not has_negative
@@ -437,21 +482,10 @@ class BoundaryReader:
         """
         name_lower = bc_name.lower()
 
-        if any(
-            keyword in name_lower for keyword in ["entrada", "inflow", "inlet", "rio"]
-        ):
-            return "Caudal de Entrada"
-        elif any(
-            keyword in name_lower
-            for keyword in ["salida", "outflow", "outlet", "stage"]
-        ):
-            return "Nivel de Salida"
-        elif any(keyword in name_lower for keyword in ["flow", "discharge", "caudal"]):
-            return "Hidrograma de Caudal"
-        elif any(keyword in name_lower for keyword in ["stage", "level", "nivel"]):
-            return "Hidrograma de Nivel"
-        else:
-            return "Condición de Contorno"
+        for bc_type, keywords in _BC_TYPE_KEYWORDS:
+            if any(keyword in name_lower for keyword in keywords):
+                return bc_type
+        return "Condición de Contorno"
 
     def _generate_description(self, bc_name: str) -> str:
         """
@@ -559,7 +593,7 @@ def main():
     try:
         reader = BoundaryReader(hdf_file_path)
         result = reader.extract_boundary_conditions(enhanced_mode=enhanced_mode)
-        print(json.dumps(result, indent=2))
+        print(json.dumps(result, separators=(",", ":")))
 
     except Exception as e:
         error_result = {
@@ -8,11 +8,13 @@ import csv
 import io
 import json
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import h5py
+import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
@@ -21,6 +23,8 @@ import pandas as pd
 # Import utilities
 from ..utils.common import format_error_message, setup_logging, validate_file_path
 
+matplotlib.use("Agg")  # Use non-interactive backend
+
 # Configure matplotlib for better plots
 plt.style.use("default")
 
@@ -31,19 +35,57 @@ logger = setup_logging()
 class DataExtractor:
     """Class for extracting and visualizing data from HEC-RAS HDF files"""
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self, file_path: str, h5_file: Optional[h5py.File] = None, **h5_kwargs
+    ):
         """
         Initialize HDF data extractor with file path
 
         Args:
             file_path (str): Path to the HDF file
+            h5_file (h5py.File): Already open file to read from instead of
+                opening file_path for every call (optional)
+            **h5_kwargs: Extra h5py.File options used when opening the file,
+                e.g. chunk cache sizing (rdcc_nbytes, rdcc_nslots, rdcc_w0)
         """
         self.file_path = Path(file_path)
+        self._h5_file = h5_file
+        self._h5_kwargs = h5_kwargs
+        self._extracted = {}
+
+        if h5_file is not None:
+            return
 
         # Validate file exists
         if not self.file_path.exists():
             raise FileNotFoundError(f"HDF file not found: {file_path}")
 
+    @classmethod
+    def from_handle(cls, h5_file: h5py.File) -> "DataExtractor":
+        """
+        Create an extractor sharing an already open HDF file
+
+        The handle stays owned by the caller, which must keep it open while
+        the extractor is used; repeated reads of the same datasets then hit
+        the handle's chunk cache instead of reopening the file.
+
+        Args:
+            h5_file (h5py.File): Open HDF file
+
+        Returns:
+            DataExtractor reading from h5_file
+        """
+        return cls(h5_file.filename, h5_file=h5_file)
+
+    @contextmanager
+    def _open(self) -> Iterator[h5py.File]:
+        """Yield the shared HDF handle, or open (and close) the file"""
+        if self._h5_file is not None:
+            yield self._h5_file
+        else:
+            with h5py.File(self.file_path, "r", **self._h5_kwargs) as f:
+                yield f
+
     def clean_hydrograph_data(self, data: np.ndarray) -> Dict[str, Any]:
         """
         Clean and format data for hydrograph visualization
@@ -97,6 +139,9 @@ class DataExtractor:
         """
         Extract data from a specific dataset with metadata and optional cleaning
 
+        The result is cached per dataset and options, so the plotting and
+        export methods reuse one read of the dataset.
+
         Args:
             dataset_path (str): Path to the dataset within the HDF file
             max_rows (int): Maximum number of rows to extract for preview
@@ -105,8 +150,12 @@ class DataExtractor:
         Returns:
             Dict containing data, metadata, and summary statistics
         """
+        key = (dataset_path, max_rows, clean_for_hydrograph)
+        if key in self._extracted:
+            return self._extracted[key]
+
         try:
-            with h5py.File(self.file_path, "r") as f:
+            with self._open() as f:
                 if dataset_path not in f:
                     raise KeyError(f"Dataset not found: {dataset_path}")
 
@@ -157,12 +206,17 @@ class DataExtractor:
 
                     # Calculate summary statistics from cleaned data
                     if data_list:
-                        values = [item["column_2"] for item in data_list]
+                        # One array conversion shared by every statistic
+                        values = np.fromiter(
+                            (item["column_2"] for item in data_list),
+                            dtype=np.float64,
+                            count=len(data_list),
+                        )
                         summary_stats = {
-                            "min": float(min(values)),
-                            "max": float(max(values)),
-                            "mean": float(np.mean(values)),
-                            "std": float(np.std(values)),
+                            "min": float(values.min()),
+                            "max": float(values.max()),
+                            "mean": float(values.mean()),
+                            "std": float(values.std()),
                             "count": len(values),
                         }
                     else:
@@ -200,12 +254,13 @@ class DataExtractor:
                 metadata["is_truncated"] = is_truncated
                 metadata["truncated_at"] = truncated_at
 
-                return {
+                self._extracted[key] = {
                     "data": data_list,
                     "metadata": metadata,
                     "summary_stats": summary_stats,
                     "dataset_path": dataset_path,
                 }
+                return self._extracted[key]
 
         except Exception as e:
             raise Exception(f"Error extracting dataset {dataset_path}: {str(e)}")
@@ -224,7 +279,7 @@ class DataExtractor:
             Base64 encoded PNG image of the plot
         """
         try:
-            with h5py.File(self.file_path, "r") as f:
+            with self._open() as f:
                 if dataset_path not in f:
                     raise KeyError(f"Dataset not found: {dataset_path}")
 
@@ -346,8 +401,8 @@ class DataExtractor:
             ax.spines["right"].set_visible(False)
 
             # Add statistics text box using cleaned data
-            if y_values:
-                stats_text = f"Max: {max(y_values):.2f}\nMin: {min(y_values):.2f}\nMean: {np.mean(y_values):.2f}"
+            if y_values.size:
+                stats_text = f"Max: {y_values.max():.2f}\nMin: {y_values.min():.2f}\nMean: {y_values.mean():.2f}"
                 ax.text(
                     0.02,
                     0.98,
@@ -530,7 +585,7 @@ def main():
     command = sys.argv[2]
 
     try:
-        extractor = HDFDataExtractor(file_path)
+        extractor = DataExtractor(file_path)
 
         if command == "extract" and len(sys.argv) >= 4:
             dataset_path = sys.argv[3]
@@ -5,8 +5,9 @@ Handles reading, parsing, and extracting metadata from HDF files
 
 import json
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import h5py
 import numpy as np
@@ -15,16 +16,28 @@ import numpy as np
 class HDFReader:
     """Class for reading and analyzing HDF files from HEC-RAS 2D models"""
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self, file_path: str, h5_file: Optional[h5py.File] = None, **h5_kwargs
+    ):
         """
         Initialize HDF reader with file path
 
         Args:
             file_path (str): Path to the HDF file
+            h5_file (h5py.File): Already open file to read from instead of
+                opening file_path for every call (optional)
+            **h5_kwargs: Extra h5py.File options used when opening the file,
+                e.g. chunk cache sizing (rdcc_nbytes, rdcc_nslots, rdcc_w0)
         """
         self.file_path = Path(file_path)
         self.file_info = {}
         self.structure = {}
+        self._detailed_metadata = None
+        self._h5_file = h5_file
+        self._h5_kwargs = h5_kwargs
+
+        if h5_file is not None:
+            return
 
         # Validate file exists
         if not self.file_path.exists():
@@ -36,6 +49,32 @@ class HDFReader:
                 f"Invalid file type. Expected .hdf, .h5, or .hdf5, got: {self.file_path.suffix}"
             )
 
+    @classmethod
+    def from_handle(cls, h5_file: h5py.File) -> "HDFReader":
+        """
+        Create a reader sharing an already open HDF file
+
+        The handle stays owned by the caller, which must keep it open while
+        the reader is used; the HDF superblock and group tree are then parsed
+        once for every reader built on it.
+
+        Args:
+            h5_file (h5py.File): Open HDF file
+
+        Returns:
+            HDFReader reading from h5_file
+        """
+        return cls(h5_file.filename, h5_file=h5_file)
+
+    @contextmanager
+    def _open(self) -> Iterator[h5py.File]:
+        """Yield the shared HDF handle, or open (and close) the file"""
+        if self._h5_file is not None:
+            yield self._h5_file
+        else:
+            with h5py.File(self.file_path, "r", **self._h5_kwargs) as f:
+                yield f
+
     def get_file_info(self) -> Dict[str, Any]:
         """
         Get basic file information including size, modification date, etc.
@@ -67,7 +106,7 @@ class HDFReader:
         structure = {}
 
         try:
-            with h5py.File(self.file_path, "r") as f:
+            with self._open() as f:
 
                 def visit_func(name, obj):
                     # Store the full path information for each item
@@ -105,16 +144,37 @@ class HDFReader:
             numpy array containing the dataset data
         """
         try:
-            with h5py.File(self.file_path, "r") as f:
+            with self._open() as f:
                 if dataset_path not in f:
                     raise KeyError(f"Dataset not found: {dataset_path}")
 
-                dataset = f[dataset_path]
-                return dataset[:]
+                return self._read_dataset_bulk(f[dataset_path])
 
         except Exception as e:
             raise Exception(f"Error reading dataset {dataset_path}: {str(e)}")
 
+    @staticmethod
+    def _read_dataset_bulk(dataset: h5py.Dataset) -> np.ndarray:
+        """
+        Read a whole dataset into a preallocated array with read_direct
+
+        HDF5 decodes the chunks straight into the output buffer, avoiding the
+        intermediate selection machinery of dataset[...] indexing.
+
+        Args:
+            dataset (h5py.Dataset): Dataset to read
+
+        Returns:
+            numpy array containing the dataset data
+        """
+        if dataset.size == 0 or dataset.dtype.kind == "O":
+            # Empty selections and variable-length data use regular indexing
+            return dataset[()]
+
+        out = np.empty(dataset.shape, dtype=dataset.dtype)
+        dataset.read_direct(out)
+        return out
+
     def find_hydraulic_results(self) -> Dict[str, List[str]]:
         """
         Find common hydraulic result datasets (depth, velocity, etc.)
@@ -149,13 +209,45 @@ class HDFReader:
 
         return hydraulic_datasets
 
+    def _dataset_shapes(self) -> List[Tuple[str, Tuple[int, ...]]]:
+        """
+        List (path, shape) for every dataset in the file
+
+        Reuses the structure from get_file_structure when it has already been
+        read, so the file is not traversed a second time.
+
+        Returns:
+            List of (dataset path, shape) tuples in traversal order
+        """
+        if self.structure:
+            return [
+                (name, info["shape"])
+                for name, info in self.structure.items()
+                if info["type"] == "dataset"
+            ]
+
+        shapes = []
+        with self._open() as f:
+
+            def collect(name, obj):
+                if isinstance(obj, h5py.Dataset):
+                    shapes.append((name, obj.shape))
+
+            f.visititems(collect)
+        return shapes
+
     def get_detailed_metadata(self) -> Dict[str, Any]:
         """
         Extract detailed metadata including dimensions, time steps, and cell counts
 
+        The result is computed once per reader and cached.
+
         Returns:
             Dict with detailed metadata
         """
+        if self._detailed_metadata is not None:
+            return self._detailed_metadata
+
         metadata = {
             "total_datasets": 0,
             "time_steps": 0,
@@ -169,56 +261,40 @@ class HDFReader:
         }
 
         try:
-            with h5py.File(self.file_path, "r") as f:
-
-                def analyze_dataset(name, obj):
-                    if isinstance(obj, h5py.Dataset):
-                        metadata["total_datasets"] += 1
-                        shape = obj.shape
-                        name_lower = name.lower()
-
-                        # Extraer dimensiones máximas
-                        if len(shape) >= 2:
-                            time_steps = shape[0]
-                            cells = shape[1]
-                            metadata["time_steps"] = max(
-                                metadata["time_steps"], time_steps
-                            )
-                            metadata["cell_count"] = max(metadata["cell_count"], cells)
-
-                        # Contar áreas de flujo
-                        if "2d flow area" in name_lower:
-                            metadata["flow_areas"] += 1
-
-                        # Categorizar variables
-                        if "depth" in name_lower:
-                            metadata["variables"]["depth"]["count"] += 1
-                            if len(shape) > len(
-                                metadata["variables"]["depth"]["max_shape"]
-                            ):
-                                metadata["variables"]["depth"]["max_shape"] = list(
-                                    shape
-                                )
-                        elif "velocity" in name_lower:
-                            metadata["variables"]["velocity"]["count"] += 1
-                            if len(shape) > len(
-                                metadata["variables"]["velocity"]["max_shape"]
-                            ):
-                                metadata["variables"]["velocity"]["max_shape"] = list(
-                                    shape
-                                )
-                        elif "wse" in name_lower or "water surface" in name_lower:
-                            metadata["variables"]["wse"]["count"] += 1
-                            if len(shape) > len(
-                                metadata["variables"]["wse"]["max_shape"]
-                            ):
-                                metadata["variables"]["wse"]["max_shape"] = list(shape)
-
-                f.visititems(analyze_dataset)
-
-                # Asegurar valores mínimos
-                if metadata["flow_areas"] == 0:
-                    metadata["flow_areas"] = 1
+            for name, shape in self._dataset_shapes():
+                metadata["total_datasets"] += 1
+                name_lower = name.lower()
+
+                # Extraer dimensiones máximas
+                if len(shape) >= 2:
+                    time_steps = shape[0]
+                    cells = shape[1]
+                    metadata["time_steps"] = max(metadata["time_steps"], time_steps)
+                    metadata["cell_count"] = max(metadata["cell_count"], cells)
+
+                # Contar áreas de flujo
+                if "2d flow area" in name_lower:
+                    metadata["flow_areas"] += 1
+
+                # Categorizar variables
+                if "depth" in name_lower:
+                    metadata["variables"]["depth"]["count"] += 1
+                    if len(shape) > len(metadata["variables"]["depth"]["max_shape"]):
+                        metadata["variables"]["depth"]["max_shape"] = list(shape)
+                elif "velocity" in name_lower:
+                    metadata["variables"]["velocity"]["count"] += 1
+                    if len(shape) > len(metadata["variables"]["velocity"]["max_shape"]):
+                        metadata["variables"]["velocity"]["max_shape"] = list(shape)
+                elif "wse" in name_lower or "water surface" in name_lower:
+                    metadata["variables"]["wse"]["count"] += 1
+                    if len(shape) > len(metadata["variables"]["wse"]["max_shape"]):
+                        metadata["variables"]["wse"]["max_shape"] = list(shape)
+
+            # Asegurar valores mínimos
+            if metadata["flow_areas"] == 0:
+                metadata["flow_areas"] = 1
+
+            self._detailed_metadata = metadata
 
         except Exception as e:
             print(f"Error extracting detailed metadata: {str(e)}")
@@ -245,34 +321,46 @@ class HDFReader:
             json.dump(export_data, f, indent=2, default=str)
 
 
+# CLI commands and the reader method that answers each one
+CLI_COMMANDS = {
+    "info": "get_file_info",
+    "structure": "get_file_structure",
+    "hydraulic": "find_hydraulic_results",
+    "metadata": "get_detailed_metadata",
+}
+
+
 def main():
     """Command line interface for HDF reader"""
     if len(sys.argv) < 2:
-        print("Usage: python hdf_reader.py <hdf_file_path> [command]")
-        print("Commands: structure, info, hydraulic")
+        print("Usage: python hdf_reader.py <hdf_file_path> [command ...]")
+        print(f"Commands: {', '.join(CLI_COMMANDS)}")
         sys.exit(1)
 
     file_path = sys.argv[1]
-    command = sys.argv[2] if len(sys.argv) > 2 else "structure"
+    commands = sys.argv[2:] or ["structure"]
+
+    for command in commands:
+        if command not in CLI_COMMANDS:
+            print(f"Unknown command: {command}")
+            sys.exit(1)
 
     try:
         reader = HDFReader(file_path)
 
-        if command == "info":
-            info = reader.get_file_info()
-            print(json.dumps(info, indent=2, default=str))
-        elif command == "structure":
-            structure = reader.get_file_structure()
-            print(json.dumps(structure, indent=2, default=str))
-        elif command == "hydraulic":
-            hydraulic = reader.find_hydraulic_results()
-            print(json.dumps(hydraulic, indent=2))
-        elif command == "metadata":
-            metadata = reader.get_detailed_metadata()
-            print(json.dumps(metadata, indent=2, default=str))
+        if len(commands) == 1:
+            result = getattr(reader, CLI_COMMANDS[commands[0]])()
         else:
-            print(f"Unknown command: {command}")
-            sys.exit(1)
+            # Several commands share one open handle and print one JSON
+            # object keyed by command
+            with h5py.File(reader.file_path, "r") as f:
+                shared = HDFReader(file_path, h5_file=f)
+                result = {
+                    command: getattr(shared, CLI_COMMANDS[command])()
+                    for command in commands
+                }
+
+        print(json.dumps(result, separators=(",", ":"), default=str))
 
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
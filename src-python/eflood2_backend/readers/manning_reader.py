@@ -25,14 +25,18 @@ class ManningReader:
     🔍 Extractor for Manning's n values from HEC-RAS HDF5 files
     """
 
-    def __init__(self, hdf_file_path: str):
+    def __init__(self, hdf_file_path: str, **h5_kwargs):
         """
         Initialize the Manning extractor
 
         Args:
             hdf_file_path (str): Path to the HDF5 file
+            **h5_kwargs: Extra h5py.File options used when opening the model
+                and LandCover files, e.g. chunk cache sizing (rdcc_nbytes,
+                rdcc_nslots, rdcc_w0)
         """
         self.hdf_file_path = hdf_file_path
+        self._h5_kwargs = h5_kwargs
 
     def extract_manning_values(self) -> Dict[str, Any]:
         """
@@ -42,7 +46,7 @@ class ManningReader:
             Dict containing Manning values data
         """
         try:
-            with h5py.File(self.hdf_file_path, "r") as hf:
+            with h5py.File(self.hdf_file_path, "r", **self._h5_kwargs) as hf:
                 logger.info(f"Reading Manning values from: {self.hdf_file_path}")
 
                 # First, try to find Manning data in the main HDF file
@@ -269,7 +273,7 @@ class ManningReader:
                 if os.path.exists(landcover_path):
                     logger.info(f"Found potential LandCover file: {landcover_path}")
                     try:
-                        with h5py.File(landcover_path, "r") as lc_hf:
+                        with h5py.File(landcover_path, "r", **self._h5_kwargs) as lc_hf:
                             manning_data = self._extract_from_landcover_file(lc_hf)
                             if manning_data is not None:
                                 logger.info(
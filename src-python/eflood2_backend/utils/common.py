@@ -2,10 +2,23 @@
 Common utilities and helper functions for eFlood2 backend
 """
 
+import base64
+import json
 import logging
+import math
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+# Optional fast JSON encoder (Rust extension, serializes numpy natively)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # Configure logging
@@ -101,3 +114,99 @@ def format_error_message(error: Exception, context: str = "") -> str:
     if context:
         return f"{context}: {str(error)}"
     return str(error)
+
+
+def encode_array(array: Any, dtype: Any = None) -> Dict[str, Any]:
+    """
+    Encode a numeric array as base64 raw little-endian bytes for JSON output
+
+    Much smaller and faster than a JSON list of numbers; the frontend decodes
+    it with a single typed array view (e.g. Float64Array).
+
+    Args:
+        array: Array-like numeric data
+        dtype: Optional dtype to cast to (e.g. np.float32)
+
+    Returns:
+        Dictionary with dtype, shape and base64 data
+    """
+    data = np.asarray(array, dtype=dtype)
+    data = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("<"))
+    return {
+        "dtype": data.dtype.str,
+        "shape": list(data.shape),
+        "data": base64.b64encode(data.tobytes()).decode("ascii"),
+    }
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback conversion for objects the JSON encoder cannot handle"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Copy of a payload with NaN and infinite floats replaced by None"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return _replace_non_finite(obj.tolist())
+    return obj
+
+
+def dumps_json(
+    obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """
+    Serialize a result payload to a JSON string
+
+    Uses orjson when installed (numpy arrays and scalars are serialized
+    directly), otherwise the standard library encoder. Both produce the same
+    output: compact separators, non-ASCII text kept as is and NaN or infinite
+    floats written as null.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        default: Conversion for other unsupported types (e.g. str for
+            reports); without it they raise TypeError
+
+    Returns:
+        JSON string
+    """
+    fallback = _json_default
+    if default is not None:
+
+        def fallback(value: Any) -> Any:
+            if isinstance(value, (np.ndarray, np.generic)):
+                return _json_default(value)
+            return default(value)
+
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=fallback, option=option).decode()
+
+    def dumps(payload: Any) -> str:
+        return json.dumps(
+            payload,
+            indent=2 if indent else None,
+            separators=(",", ": ") if indent else (",", ":"),
+            ensure_ascii=False,
+            allow_nan=False,
+            default=fallback,
+        )
+
+    try:
+        return dumps(obj)
+    except ValueError:
+        # Only payloads with NaN or infinite floats pay for the extra copy
+        return dumps(_replace_non_finite(obj))
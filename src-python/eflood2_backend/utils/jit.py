@@ -0,0 +1,20 @@
+"""
+Optional numba JIT compilation for eFlood2 numerical kernels
+
+Kept apart from common.py so that modules without compiled kernels do not
+pay for importing numba.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
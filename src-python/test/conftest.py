@@ -0,0 +1,24 @@
+"""
+🧪 Configuración compartida de pytest
+=====================================
+
+Agrega el directorio del proyecto al path una sola vez para todos los
+módulos de test.
+
+Autor: eFlood2 Technologies
+Versión: 0.1.0
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Scripts de verificación manual sobre un HDF real: se ejecutan con
+# `python test/<script>.py <archivo.hdf>`, no con pytest (sus funciones
+# test_* devuelven diccionarios de resultados en lugar de usar assert)
+collect_ignore = [
+    "test_analyzer_backend.py",
+    "test_complete_integration.py",
+    "test_hdf_extraction.py",
+]
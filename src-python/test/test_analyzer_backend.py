@@ -4,12 +4,14 @@
 """
 
 import sys
-import json
 from pathlib import Path
 
 # Agregar el directorio del backend al path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Serializador JSON del backend (orjson con soporte numpy si está instalado)
+from eflood2_backend.utils.common import dumps_json
+
 def test_manning_extraction(hdf_file_path: str):
     """Test de extracción de valores de Manning"""
     print("🌿 Testing Manning values extraction...")
@@ -20,7 +22,7 @@ def test_manning_extraction(hdf_file_path: str):
         processor = RASCommanderProcessor(hdf_file_path, None)
         result = processor.get_manning_values_enhanced()
         
-        print(f"Manning result: {json.dumps(result, indent=2)}")
+        print(f"Manning result: {dumps_json(result, indent=True)}")
         
         if result.get("success", False):
             data = result.get("data", {})
@@ -45,7 +47,7 @@ def test_mesh_info(hdf_file_path: str):
         processor = RASCommanderProcessor(hdf_file_path, None)
         result = processor.get_comprehensive_mesh_info()
         
-        print(f"Mesh result: {json.dumps(result, indent=2)}")
+        print(f"Mesh result: {dumps_json(result, indent=True)}")
         
         if result.get("success", False):
             data = result.get("data", {})
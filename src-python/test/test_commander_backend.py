@@ -10,19 +10,14 @@ Autor: eFlood2 Technologies
 Versión: 0.1.0
 """
 
+import importlib
 import json
 import os
-import sys
-import tempfile
-from pathlib import Path
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-# Agregar el directorio del proyecto al path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURACIÓN DE TESTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -36,26 +31,38 @@ MOCK_BOUNDARY_DATA = {
     "has_geometry": True,
 }
 
+# Módulos commander_* del paquete ras_commander
+COMMANDER_MODULES = [
+    "commander_project",
+    "commander_geometry",
+    "commander_flow",
+    "commander_results",
+    "commander_infrastructure",
+    "commander_export",
+    "commander_analysis",
+    "commander_utils",
+]
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # FIXTURES PARA TESTS
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
 @pytest.fixture
-def mock_hdf_file():
+def mock_hdf_file(tmp_path):
     """Fixture que proporciona un archivo HDF mock."""
-    with tempfile.NamedTemporaryFile(suffix=".hdf", delete=False) as f:
-        # Crear un archivo HDF vacío para tests
-        f.write(b"mock_hdf_content")
-        yield f.name
-    os.unlink(f.name)
+    # tmp_path lo crea y limpia pytest (sin unlink manual ni carreras en Windows)
+    path = tmp_path / MOCK_HDF_FILE
+    path.write_bytes(b"mock_hdf_content")
+    return str(path)
 
 
 @pytest.fixture
-def mock_output_directory():
+def mock_output_directory(tmp_path):
     """Fixture que proporciona un directorio temporal para outputs."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    return str(output_dir)
 
 
 @pytest.fixture
@@ -68,6 +75,20 @@ def mock_ras_commander():
         yield
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS DE IMPORTACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.mark.parametrize("name", COMMANDER_MODULES)
+def test_import_commander(name):
+    """Test de importación de cada módulo commander_*."""
+    module = importlib.import_module(
+        f"eflood2_backend.integrations.ras_commander.{name}"
+    )
+    assert module is not None
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TESTS PARA COMMANDER_UTILS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -76,15 +97,6 @@ def mock_ras_commander():
 class TestCommanderUtils:
     """Tests para el módulo commander_utils."""
 
-    def test_import_commander_utils(self):
-        """Test de importación del módulo commander_utils."""
-        try:
-            from eflood2_backend.integrations.ras_commander import commander_utils
-
-            assert commander_utils is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_utils: {e}")
-
     def test_validate_hdf_file_valid(self, mock_hdf_file):
         """Test de validación de archivo HDF válido."""
         from eflood2_backend.integrations.ras_commander.commander_utils import (
@@ -142,6 +154,62 @@ class TestCommanderUtils:
         assert isinstance(converted["array"], list)
         assert isinstance(converted["nested"]["inner"], int)
 
+    def test_safe_json_serialize(self):
+        """Test de serialización JSON directa de tipos numpy."""
+        import numpy as np
+
+        from eflood2_backend.integrations.ras_commander.commander_utils import (
+            safe_json_serialize,
+        )
+
+        test_data = {
+            "int": np.int64(42),
+            "float": np.float64(3.14),
+            "array": np.array([1, 2, 3]),
+            "nested": {"inner": np.int32(10)},
+        }
+
+        assert json.loads(safe_json_serialize(test_data)) == {
+            "int": 42,
+            "float": 3.14,
+            "array": [1, 2, 3],
+            "nested": {"inner": 10},
+        }
+
+        # Los tipos no soportados se reportan como error, no se convierten
+        error = json.loads(safe_json_serialize({"value": object()}))
+        assert "Error de serialización" in error["error"]
+
+    def test_validate_project_directory(self, tmp_path):
+        """Test de clasificación de archivos de proyecto (orden de os.walk)."""
+        from eflood2_backend.integrations.ras_commander.commander_utils import (
+            HECRAS_FILE_EXTENSIONS,
+            validate_project_directory,
+        )
+
+        for name in ["model.prj", "model.p01", "model.g01", "notes.txt"]:
+            (tmp_path / name).write_text("x")
+        for sub in ["results", "results/old", "backup"]:
+            (tmp_path / sub).mkdir()
+            (tmp_path / sub / "model.p01.hdf").write_text("x")
+            (tmp_path / sub / "model.u01").write_text("x")
+
+        result = validate_project_directory(str(tmp_path))
+
+        expected = {}
+        for root, _, files in os.walk(tmp_path):
+            for name in files:
+                ext = os.path.splitext(name)[1].lower()
+                for file_type, extensions in HECRAS_FILE_EXTENSIONS.items():
+                    if ext in extensions:
+                        expected.setdefault(file_type, []).append(
+                            os.path.join(root, name)
+                        )
+        assert result["success"]
+        assert result["has_hdf"] and result["has_project"]
+        assert len(result["project_files"]["hdf"]) == 3
+        assert result["project_files"] == expected
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TESTS PARA COMMANDER_PROJECT
@@ -151,15 +219,6 @@ class TestCommanderUtils:
 class TestCommanderProject:
     """Tests para el módulo commander_project."""
 
-    def test_import_commander_project(self):
-        """Test de importación del módulo commander_project."""
-        try:
-            from eflood2_backend.integrations.ras_commander import commander_project
-
-            assert commander_project is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_project: {e}")
-
     @patch(
         "eflood2_backend.integrations.ras_commander.commander_project.RAS_COMMANDER_AVAILABLE",
         False,
@@ -186,15 +245,6 @@ class TestCommanderProject:
 class TestCommanderGeometry:
     """Tests para el módulo commander_geometry."""
 
-    def test_import_commander_geometry(self):
-        """Test de importación del módulo commander_geometry."""
-        try:
-            from eflood2_backend.integrations.ras_commander import commander_geometry
-
-            assert commander_geometry is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_geometry: {e}")
-
     @patch(
         "eflood2_backend.integrations.ras_commander.commander_geometry.RAS_COMMANDER_AVAILABLE",
         True,
@@ -210,98 +260,6 @@ class TestCommanderGeometry:
         assert processor.validation_result is not None
 
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# TESTS PARA COMMANDER_RESULTS
-# ═══════════════════════════════════════════════════════════════════════════════
-
-
-class TestCommanderResults:
-    """Tests para el módulo commander_results."""
-
-    def test_import_commander_results(self):
-        """Test de importación del módulo commander_results."""
-        try:
-            from eflood2_backend.integrations.ras_commander import commander_results
-
-            assert commander_results is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_results: {e}")
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# TESTS PARA COMMANDER_FLOW
-# ═══════════════════════════════════════════════════════════════════════════════
-
-
-class TestCommanderFlow:
-    """Tests para el módulo commander_flow."""
-
-    def test_import_commander_flow(self):
-        """Test de importación del módulo commander_flow."""
-        try:
-            from eflood2_backend.integrations.ras_commander import commander_flow
-
-            assert commander_flow is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_flow: {e}")
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# TESTS PARA COMMANDER_INFRASTRUCTURE
-# ═══════════════════════════════════════════════════════════════════════════════
-
-
-class TestCommanderInfrastructure:
-    """Tests para el módulo commander_infrastructure."""
-
-    def test_import_commander_infrastructure(self):
-        """Test de importación del módulo commander_infrastructure."""
-        try:
-            from eflood2_backend.integrations.ras_commander import (
-                commander_infrastructure,
-            )
-
-            assert commander_infrastructure is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_infrastructure: {e}")
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# TESTS PARA COMMANDER_EXPORT
-# ═══════════════════════════════════════════════════════════════════════════════
-
-
-class TestCommanderExport:
-    """Tests para el módulo commander_export."""
-
-    def test_import_commander_export(self):
-        """Test de importación del módulo commander_export."""
-        try:
-            from eflood2_backend.integrations.ras_commander import commander_export
-
-            assert commander_export is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_export: {e}")
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# TESTS PARA COMMANDER_ANALYSIS
-# ═══════════════════════════════════════════════════════════════════════════════
-
-
-class TestCommanderAnalysis:
-    """Tests para el módulo commander_analysis."""
-
-    def test_import_commander_analysis(self):
-        """Test de importación del módulo commander_analysis."""
-        try:
-            from eflood2_backend.integrations.ras_commander import commander_analysis
-
-            assert commander_analysis is not None
-        except ImportError as e:
-            pytest.fail(f"Error importando commander_analysis: {e}")
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # TESTS DE INTEGRACIÓN
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -332,19 +290,13 @@ class TestIntegration:
             assert isinstance(info["modules"], list)
             assert len(info["modules"]) > 0
 
+            # Cada llamada devuelve una copia independiente
+            info["modules"].clear()
+            assert get_package_info()["modules"]
+
             # Verificar que todos los módulos commander_* están listados
-            expected_modules = [
-                "commander_project",
-                "commander_geometry",
-                "commander_flow",
-                "commander_results",
-                "commander_infrastructure",
-                "commander_export",
-                "commander_analysis",
-                "commander_utils",
-            ]
-
-            for module in expected_modules:
+            info = get_package_info()
+            for module in COMMANDER_MODULES:
                 assert (
                     module in info["modules"]
                 ), f"Módulo {module} no encontrado en la lista"
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests para utilidades comunes
+================================
+
+Verifica que dumps_json produzca la misma salida con y sin orjson.
+
+Autor: eFlood2 Technologies
+Versión: 0.1.0
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from eflood2_backend.utils import common
+from eflood2_backend.utils.common import dumps_json
+
+orjson_options = [False]
+if common.ORJSON_AVAILABLE:
+    orjson_options.append(True)
+
+
+@pytest.fixture(params=orjson_options, ids=lambda value: f"orjson={value}")
+def encoder(request, monkeypatch):
+    """dumps_json con y sin orjson (si está instalado)."""
+    monkeypatch.setattr(common, "ORJSON_AVAILABLE", request.param)
+    return dumps_json
+
+
+class TestDumpsJson:
+    """Tests para dumps_json."""
+
+    def test_numpy_payload(self, encoder):
+        """Los arreglos y escalares numpy se serializan como JSON nativo."""
+        payload = {"array": np.arange(3), "value": np.float32(1.5)}
+
+        assert json.loads(encoder(payload)) == {"array": [0, 1, 2], "value": 1.5}
+
+    def test_keeps_non_ascii_text(self, encoder):
+        """El texto en español no se escapa como \\uXXXX."""
+        assert encoder({"nombre": "Río Ñuble", "q": [1, 2]}) == (
+            '{"nombre":"Río Ñuble","q":[1,2]}'
+        )
+        assert encoder({"nombre": "Río"}, indent=True) == '{\n  "nombre": "Río"\n}'
+
+    def test_non_finite_as_null(self, encoder):
+        """NaN e infinito se escriben como null (JSON válido)."""
+        payload = {
+            "float": float("nan"),
+            "array": np.array([1.0, np.nan, np.inf]),
+            "nested": [{"value": -np.inf}],
+        }
+
+        text = encoder(payload, indent=True)
+
+        assert "NaN" not in text and "Infinity" not in text
+        assert json.loads(text) == {
+            "float": None,
+            "array": [1.0, None, None],
+            "nested": [{"value": None}],
+        }
+
+    def test_unsupported_type_raises(self, encoder):
+        """Sin default, los tipos no soportados lanzan TypeError."""
+        with pytest.raises(TypeError):
+            encoder({"value": object()})
+
+        assert json.loads(encoder({"value": object()}, default=lambda _: "x")) == {
+            "value": "x"
+        }
@@ -12,16 +12,31 @@ Uso:
     python test_complete_integration.py <ruta_archivo_hdf>
 """
 
-import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 # Agregar el directorio del backend al path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+try:
+    from eflood2_backend.integrations.ras_commander.commander_flow import CommanderFlowAnalyzer
+    from eflood2_backend.integrations.ras_commander.commander_geometry import CommanderGeometryProcessor
+    from eflood2_backend.integrations.ras_commander.commander_infrastructure import CommanderInfrastructureAnalyzer
+    from eflood2_backend.integrations.ras_commander.commander_project import CommanderProjectManager
+    from eflood2_backend.integrations.ras_commander.commander_results import CommanderResultsProcessor
+    from eflood2_backend.integrations.ras_commander.commander_utils import validate_hdf_file
+    from eflood2_backend.utils.common import dumps_json
+    _BACKEND_AVAILABLE = True
+except ImportError as e:
+    _BACKEND_IMPORT_ERROR = str(e)
+    _BACKEND_AVAILABLE = False
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,19 +45,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def test_backend_extraction(hdf_file_path: str):
+def test_backend_extraction(hdf_file_path: str, extraction_timestamp: str = None):
     """Probar extracción completa del backend."""
     logger.info("🔧 Probando extracción completa del backend...")
     
+    if not _BACKEND_AVAILABLE:
+        return {"success": False, "error": f"Backend no disponible: {_BACKEND_IMPORT_ERROR}"}
+    
     try:
-        # Importar todos los módulos del backend
-        from eflood2_backend.integrations.ras_commander.commander_project import CommanderProjectManager
-        from eflood2_backend.integrations.ras_commander.commander_geometry import CommanderGeometryProcessor
-        from eflood2_backend.integrations.ras_commander.commander_results import CommanderResultsProcessor
-        from eflood2_backend.integrations.ras_commander.commander_flow import CommanderFlowAnalyzer
-        from eflood2_backend.integrations.ras_commander.commander_infrastructure import CommanderInfrastructureAnalyzer
-        from eflood2_backend.integrations.ras_commander.commander_utils import validate_hdf_file
-        
         # 1. Validar archivo
         validation = validate_hdf_file(hdf_file_path)
         if not validation["success"]:
@@ -79,7 +89,7 @@ def test_backend_extraction(hdf_file_path: str):
             "hydrograph_analysis": hydrograph_result,
             "boundary_analysis": boundary_result,
             "infrastructure_analysis": infra_result,
-            "extraction_timestamp": datetime.now().isoformat(),
+            "extraction_timestamp": extraction_timestamp or datetime.now().isoformat(),
         }
         
         logger.info("✅ Extracción del backend completada exitosamente")
@@ -90,57 +100,74 @@ def test_backend_extraction(hdf_file_path: str):
         return {"success": False, "error": str(e)}
 
 def format_for_frontend(backend_data: dict):
-    """Formatear datos del backend para el frontend."""
+    """
+    Formatear datos del backend para el frontend.
+
+    El resultado es una vista superficial: las secciones "data" se comparten
+    con backend_data (geometry_info y analysisResults.geometry son el mismo
+    objeto), así que modificarlas en sitio afecta a ambos.
+    """
     logger.info("🎨 Formateando datos para el frontend...")
     
     try:
+        # Secciones del backend, extraídas una sola vez
+        validation = backend_data.get("file_validation") or {}
+        project = backend_data.get("project_analysis") or {}
+        geometry = backend_data.get("geometry_analysis") or {}
+        manning = backend_data.get("manning_analysis") or {}
+        hydrograph = backend_data.get("hydrograph_analysis") or {}
+        boundary = backend_data.get("boundary_analysis") or {}
+        infrastructure = backend_data.get("infrastructure_analysis") or {}
+        geometry_data = geometry.get("data") or {}
+        manning_data = manning.get("data") or {}
+        
         # Estructura que espera el frontend (basada en HecRasState)
         frontend_data = {
             # Metadatos del archivo
             "fileMetadata": {
-                "file_path": backend_data.get("file_validation", {}).get("file_path"),
-                "file_size": backend_data.get("file_validation", {}).get("file_size"),
-                "last_modified": backend_data.get("file_validation", {}).get("last_modified"),
-                "validation_status": backend_data.get("file_validation", {}).get("success", False),
+                "file_path": validation.get("file_path"),
+                "file_size": validation.get("file_size"),
+                "last_modified": validation.get("last_modified"),
+                "validation_status": validation.get("success", False),
             },
             
             # Datos del proyecto HEC-RAS
             "hdfData": {
-                "project_info": backend_data.get("project_analysis", {}).get("data", {}),
-                "geometry_info": backend_data.get("geometry_analysis", {}).get("data", {}),
+                "project_info": project.get("data") or {},
+                "geometry_info": geometry_data,
                 "analysis_timestamp": backend_data.get("extraction_timestamp"),
             },
             
             # Valores de Manning
             "manningValues": {
-                "success": backend_data.get("manning_analysis", {}).get("success", False),
-                "data": backend_data.get("manning_analysis", {}).get("data", {}),
+                "success": manning.get("success", False),
+                "data": manning_data,
                 "existing_method": {
                     "manning_data": {
-                        "total_zones": backend_data.get("manning_analysis", {}).get("data", {}).get("total_manning_zones", 0),
-                        "base_values": backend_data.get("manning_analysis", {}).get("data", {}).get("base_manning_values", []),
-                        "calibration_values": backend_data.get("manning_analysis", {}).get("data", {}).get("calibration_manning_values", []),
-                        "table_data": backend_data.get("manning_analysis", {}).get("data", {}).get("table_data", []),
+                        "total_zones": manning_data.get("total_manning_zones", 0),
+                        "base_values": manning_data.get("base_manning_values", []),
+                        "calibration_values": manning_data.get("calibration_manning_values", []),
+                        "table_data": manning_data.get("table_data", []),
                     }
                 }
             },
             
             # Datos de hidrogramas
             "hydrographData": {
-                "success": backend_data.get("hydrograph_analysis", {}).get("success", False),
-                "data": backend_data.get("hydrograph_analysis", {}).get("data", {}),
+                "success": hydrograph.get("success", False),
+                "data": hydrograph.get("data") or {},
             },
             
             # Condiciones de frontera
             "boundaryConditions": {
-                "success": backend_data.get("boundary_analysis", {}).get("success", False),
-                "data": backend_data.get("boundary_analysis", {}).get("data", {}),
+                "success": boundary.get("success", False),
+                "data": boundary.get("data") or {},
             },
             
             # Resultados de análisis
             "analysisResults": {
-                "geometry": backend_data.get("geometry_analysis", {}).get("data", {}),
-                "infrastructure": backend_data.get("infrastructure_analysis", {}).get("data", {}),
+                "geometry": geometry_data,
+                "infrastructure": infrastructure.get("data") or {},
                 "complete": True,
             },
         }
@@ -152,71 +179,73 @@ def format_for_frontend(backend_data: dict):
         logger.error(f"❌ Error formateando datos: {str(e)}")
         return {"success": False, "error": str(e)}
 
+def _len(data: dict, key: str) -> int:
+    """Longitud de data[key], o 0 si falta o está vacío."""
+    value = data.get(key)
+    return len(value) if value else 0
+
 def generate_frontend_preview(frontend_data: dict):
     """Generar vista previa de cómo se verán los datos en el frontend."""
     logger.info("👁️ Generando vista previa del frontend...")
     
     try:
+        file_meta = frontend_data.get("fileMetadata", {})
+        file_size = file_meta.get('file_size', 0)
+        file_size_str = f"{file_size:,}" if file_size is not None else "N/A"
+        manning_values = frontend_data.get("manningValues") or {}
+        manning_data = (manning_values.get("existing_method") or {}).get("manning_data") or {}
+        hydrograph = frontend_data.get("hydrographData") or {}
+        hydro_data = hydrograph.get("data") or {}
+        
+        # Fragmentos opcionales (vacíos si no hay datos)
+        base_range = []
+        if manning_data.get('base_values'):
+            base_values = np.asarray(manning_data['base_values'], dtype=np.float64)
+            base_range = [f"- **Rango base:** {base_values.min():.4f} - {base_values.max():.4f}"]
+        
+        calib_range = []
+        if manning_data.get('calibration_values'):
+            calib_values = np.asarray(manning_data['calibration_values'], dtype=np.float64)
+            calib_range = [f"- **Rango calibración:** {calib_values.min():.4f} - {calib_values.max():.4f}"]
+        
+        flow_stats = []
+        if hydro_data.get('flow_data'):
+            flow_data = np.asarray(hydro_data['flow_data'], dtype=np.float64)
+            flow_stats = [
+                f"- **Flujo mínimo:** {flow_data.min():.2f} m³/s",
+                f"- **Flujo máximo:** {flow_data.max():.2f} m³/s",
+                f"- **Flujo promedio:** {flow_data.mean():.2f} m³/s",
+            ]
+        
+        # Vista previa completa construida en una sola lista
         preview_lines = [
             "# 🎨 Vista Previa del Frontend - eFlood",
             "=" * 50,
             "",
             "## 📊 Datos que se mostrarán en el CompleteDataViewer:",
             "",
-        ]
-        
-        # Sección de metadatos
-        file_meta = frontend_data.get("fileMetadata", {})
-        file_size = file_meta.get('file_size', 0)
-        file_size_str = f"{file_size:,}" if file_size is not None else "N/A"
-
-        preview_lines.extend([
+            # Sección de metadatos
             "### 📁 Metadatos del Archivo",
             f"- **Archivo:** {file_meta.get('file_path', 'N/A')}",
             f"- **Tamaño:** {file_size_str} bytes",
             f"- **Modificado:** {file_meta.get('last_modified', 'N/A')}",
             f"- **Estado:** {'✅ Válido' if file_meta.get('validation_status') else '❌ Inválido'}",
             "",
-        ])
-        
-        # Sección de Manning
-        manning_data = frontend_data.get("manningValues", {}).get("existing_method", {}).get("manning_data", {})
-        preview_lines.extend([
+            # Sección de Manning
             "### 🌿 Valores de Manning",
             f"- **Total de zonas:** {manning_data.get('total_zones', 0)}",
-            f"- **Valores base:** {len(manning_data.get('base_values', []))} elementos",
-            f"- **Valores calibración:** {len(manning_data.get('calibration_values', []))} elementos",
-        ])
-        
-        if manning_data.get('base_values'):
-            base_values = manning_data['base_values']
-            preview_lines.append(f"- **Rango base:** {min(base_values):.4f} - {max(base_values):.4f}")
-        
-        if manning_data.get('calibration_values'):
-            calib_values = manning_data['calibration_values']
-            preview_lines.append(f"- **Rango calibración:** {min(calib_values):.4f} - {max(calib_values):.4f}")
-        
-        preview_lines.append("")
-        
-        # Sección de hidrogramas
-        hydro_data = frontend_data.get("hydrographData", {}).get("data", {})
-        preview_lines.extend([
+            f"- **Valores base:** {_len(manning_data, 'base_values')} elementos",
+            f"- **Valores calibración:** {_len(manning_data, 'calibration_values')} elementos",
+            *base_range,
+            *calib_range,
+            "",
+            # Sección de hidrogramas
             "### 📈 Datos de Hidrogramas",
-            f"- **Estado:** {'✅ Disponible' if frontend_data.get('hydrographData', {}).get('success') else '❌ No disponible'}",
+            f"- **Estado:** {'✅ Disponible' if hydrograph.get('success') else '❌ No disponible'}",
             f"- **Malla:** {hydro_data.get('mesh_name', 'N/A')}",
-            f"- **Puntos temporales:** {len(hydro_data.get('time_series', []))}",
-            f"- **Datos de flujo:** {len(hydro_data.get('flow_data', []))}",
-        ])
-        
-        if hydro_data.get('flow_data'):
-            flow_data = hydro_data['flow_data']
-            preview_lines.extend([
-                f"- **Flujo mínimo:** {min(flow_data):.2f} m³/s",
-                f"- **Flujo máximo:** {max(flow_data):.2f} m³/s",
-                f"- **Flujo promedio:** {sum(flow_data)/len(flow_data):.2f} m³/s",
-            ])
-        
-        preview_lines.extend([
+            f"- **Puntos temporales:** {_len(hydro_data, 'time_series')}",
+            f"- **Datos de flujo:** {_len(hydro_data, 'flow_data')}",
+            *flow_stats,
             "",
             "## 🎯 Componentes del Frontend que mostrarán estos datos:",
             "",
@@ -231,16 +260,23 @@ def generate_frontend_preview(frontend_data: dict):
             "- ✅ Datos se formatean para el frontend",
             "- ✅ Componentes visuales están listos",
             "- ✅ Sistema completo funcional",
-        ])
+        ]
         
-        preview_text = "\n".join(preview_lines)
         logger.info("✅ Vista previa generada")
-        return {"success": True, "preview": preview_text}
+        return {"success": True, "lines": preview_lines}
         
     except Exception as e:
         logger.error(f"❌ Error generando vista previa: {str(e)}")
         return {"success": False, "error": str(e)}
 
+def _write_output(path: str, payload):
+    """Escribir un archivo de salida: JSON ya codificado o líneas de texto."""
+    with open(path, 'w', encoding='utf-8') as f:
+        if isinstance(payload, str):
+            f.write(payload)
+        else:
+            f.writelines(f"{line}\n" for line in payload)
+
 def main():
     """Función principal."""
     print("🚀 Test de Integración Completa - eFlood Backend + Frontend")
@@ -260,10 +296,14 @@ def main():
     print(f"📁 Archivo a procesar: {hdf_file_path}")
     print()
     
+    # Una sola marca de tiempo para los datos y los nombres de archivo
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
+    
     # 1. Probar extracción del backend
     print("🔧 PASO 1: Extracción del Backend")
     print("-" * 40)
-    backend_result = test_backend_extraction(hdf_file_path)
+    backend_result = test_backend_extraction(hdf_file_path, now.isoformat())
     
     if not backend_result["success"]:
         print(f"❌ Error en backend: {backend_result['error']}")
@@ -294,22 +334,19 @@ def main():
         sys.exit(1)
     
     # 4. Guardar archivos de salida
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Guardar datos del backend
     backend_file = f"backend_data_{timestamp}.json"
-    with open(backend_file, 'w', encoding='utf-8') as f:
-        json.dump(backend_result["data"], f, indent=2, ensure_ascii=False, default=str)
-    
-    # Guardar datos del frontend
     frontend_file = f"frontend_data_{timestamp}.json"
-    with open(frontend_file, 'w', encoding='utf-8') as f:
-        json.dump(frontend_result["frontend_data"], f, indent=2, ensure_ascii=False, default=str)
-    
-    # Guardar vista previa
     preview_file = f"frontend_preview_{timestamp}.md"
-    with open(preview_file, 'w', encoding='utf-8') as f:
-        f.write(preview_result["preview"])
+    
+    # Serializar primero y escribir los tres archivos en paralelo
+    outputs = [
+        (backend_file, dumps_json(backend_result["data"], indent=True, default=str)),
+        (frontend_file, dumps_json(frontend_result["frontend_data"], indent=True, default=str)),
+        (preview_file, preview_result["lines"]),
+    ]
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        list(executor.map(lambda output: _write_output(*output), outputs))
     
     print("✅ Vista previa generada")
     print()
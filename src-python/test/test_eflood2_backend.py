@@ -7,8 +7,20 @@ import json
 import os
 import sys
 
+
+def _ensure_on_path(path):
+    """Agregar un directorio al path sólo si no está ya incluido"""
+    path = os.path.abspath(path)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+# Directorios de los módulos del backend
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "src-python"))
+_HECRAS = os.path.join(_SRC, "HECRAS-HDF")
+
 # Agregar el directorio src-python al path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src-python"))
+_ensure_on_path(_SRC)
 
 
 def test_hdf_reader():
@@ -41,9 +53,7 @@ def test_hecras_processor():
     """Probar el procesador HEC-RAS"""
     print("🔍 Probando hecras_processor...")
     try:
-        sys.path.insert(
-            0, os.path.join(os.path.dirname(__file__), "src-python", "HECRAS-HDF")
-        )
+        _ensure_on_path(_HECRAS)
         import hecras_processor
 
         print("✅ hecras_processor importado correctamente")
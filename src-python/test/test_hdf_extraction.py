@@ -13,7 +13,7 @@ Ejemplo:
     python test_hdf_extraction.py "D:\945_25 OHLA - No demoler puente Balta\4. Modelos Hidraulicos\ModelosFinales\945-25-03-12-00-NTV-001_A1_MULTICRITERIO\hy7782-2d-A1_MULTIC.p01.hdf"
 """
 
-import json
+import io
 import logging
 import os
 import sys
@@ -22,6 +22,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+# Agregar el directorio del backend al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eflood2_backend.utils.common import dumps_json
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -278,60 +283,49 @@ def test_infrastructure_analysis(hdf_file_path: str) -> Dict[str, Any]:
         logger.error(f"❌ {error_msg}")
         return {"success": False, "error": error_msg}
 
-def generate_report(results: Dict[str, Any], hdf_file_path: str) -> str:
+def generate_report(results: Dict[str, Any], hdf_file_path: str, generated_at: datetime) -> str:
     """Generar reporte completo en markdown."""
-    report_lines = [
-        "# 📊 Reporte de Análisis HDF - eFlood Backend",
-        "=" * 50,
-        "",
-        f"**Archivo analizado:** `{hdf_file_path}`",
-        f"**Fecha de análisis:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "",
-        "## 📋 Resumen de Resultados",
-        ""
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("# 📊 Reporte de Análisis HDF - eFlood Backend\n")
+    w("=" * 50 + "\n\n")
+    w(f"**Archivo analizado:** `{hdf_file_path}`\n")
+    w(f"**Fecha de análisis:** {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    w("## 📋 Resumen de Resultados\n\n")
     
     # Resumen de éxitos/fallos
     total_tests = len(results)
     successful_tests = sum(1 for r in results.values() if r.get("success", False))
     
-    report_lines.extend([
-        f"- **Tests ejecutados:** {total_tests}",
-        f"- **Tests exitosos:** {successful_tests}",
-        f"- **Tests fallidos:** {total_tests - successful_tests}",
-        f"- **Tasa de éxito:** {(successful_tests/total_tests)*100:.1f}%",
-        ""
-    ])
+    w(f"- **Tests ejecutados:** {total_tests}\n")
+    w(f"- **Tests exitosos:** {successful_tests}\n")
+    w(f"- **Tests fallidos:** {total_tests - successful_tests}\n")
+    w(f"- **Tasa de éxito:** {(successful_tests/total_tests)*100:.1f}%\n\n")
     
     # Detalles por sección
     for test_name, result in results.items():
         status = "✅ ÉXITO" if result.get("success", False) else "❌ FALLO"
-        report_lines.extend([
-            f"### {test_name.replace('_', ' ').title()}",
-            f"**Estado:** {status}",
-            ""
-        ])
+        w(f"### {test_name.replace('_', ' ').title()}\n")
+        w(f"**Estado:** {status}\n\n")
         
         if result.get("success", False):
             data = result.get("data", {})
             if data:
-                report_lines.append("**Datos extraídos:**")
+                w("**Datos extraídos:**\n")
                 for key, value in data.items():
                     if isinstance(value, list):
-                        report_lines.append(f"- {key}: {len(value)} elementos")
+                        w(f"- {key}: {len(value)} elementos\n")
                     elif isinstance(value, dict):
-                        report_lines.append(f"- {key}: {len(value)} propiedades")
+                        w(f"- {key}: {len(value)} propiedades\n")
                     else:
-                        report_lines.append(f"- {key}: {value}")
-                report_lines.append("")
+                        w(f"- {key}: {value}\n")
+                w("\n")
         else:
             error = result.get("error", "Error desconocido")
-            report_lines.extend([
-                f"**Error:** {error}",
-                ""
-            ])
+            w(f"**Error:** {error}\n\n")
     
-    return "\n".join(report_lines)
+    # Cada sección termina con una línea en blanco: el reporte acaba en un solo salto
+    return buf.getvalue()[:-1]
 
 def main():
     """Función principal."""
@@ -382,34 +376,45 @@ def main():
     print("📊 GENERANDO REPORTE FINAL")
     print("=" * 60)
     
-    report = generate_report(results, hdf_file_path)
+    # Una sola marca de tiempo para la fecha del reporte y los nombres de archivo
+    now = datetime.now()
+    report = generate_report(results, hdf_file_path, now)
+    
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
+    report_file = f"hdf_analysis_report_{timestamp}.md"
+    results_file = f"results_{timestamp}.json"
     
-    # Guardar reporte
-    report_file = f"hdf_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+    # Guardar reporte y datos completos antes de anunciarlos
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write(report)
-    
-    print(f"📄 Reporte guardado en: {report_file}")
-    print()
-    print("📋 RESUMEN FINAL:")
+    # orjson codifica los arreglos numpy directamente (fallback a json)
+    Path(results_file).write_text(dumps_json(results, indent=True, default=str), encoding="utf-8")
     
     total_tests = len(results)
     successful_tests = sum(1 for r in results.values() if r.get("success", False))
+    failed_tests = total_tests - successful_tests
     
-    print(f"   Tests ejecutados: {total_tests}")
-    print(f"   Tests exitosos: {successful_tests}")
-    print(f"   Tests fallidos: {total_tests - successful_tests}")
-    print(f"   Tasa de éxito: {(successful_tests/total_tests)*100:.1f}%")
-    
-    if successful_tests == total_tests:
-        print("\n🎉 ¡TODOS LOS TESTS PASARON! Backend funcionando correctamente.")
+    if failed_tests == 0:
+        verdict = "🎉 ¡TODOS LOS TESTS PASARON! Backend funcionando correctamente."
     else:
-        print(f"\n⚠️  {total_tests - successful_tests} tests fallaron. Revisar errores arriba.")
+        verdict = f"⚠️  {failed_tests} tests fallaron. Revisar errores arriba."
     
-    # Mostrar datos JSON para debugging
-    print(f"\n🔧 Datos completos guardados en: results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-    with open(f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json", 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+    # Resumen final en un solo bloque
+    summary = [
+        f"📄 Reporte guardado en: {report_file}",
+        "",
+        "📋 RESUMEN FINAL:",
+        f"   Tests ejecutados: {total_tests}",
+        f"   Tests exitosos: {successful_tests}",
+        f"   Tests fallidos: {failed_tests}",
+        f"   Tasa de éxito: {(successful_tests/total_tests)*100:.1f}%",
+        "",
+        verdict,
+        "",
+        # Mostrar datos JSON para debugging
+        f"🔧 Datos completos guardados en: {results_file}",
+    ]
+    print("\n".join(summary))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests para HydraulicCalculator
+=================================
+
+Verifica los solucionadores de tirante normal y crítico contra las
+ecuaciones de Manning y de flujo crítico.
+
+Autor: eFlood2 Technologies
+Versión: 0.1.0
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from eflood2_backend.processors import hydraulic_calculator
+from eflood2_backend.processors.hydraulic_calculator import HydraulicCalculator
+
+GRAVITY = 9.81
+
+
+def manning_flow(depth, slope, manning_n, width, side_slope=0.0):
+    """Caudal de Manning para una sección trapezoidal."""
+    area = (width + side_slope * depth) * depth
+    perimeter = width + 2 * depth * math.sqrt(1 + side_slope**2)
+    return area * (area / perimeter) ** (2 / 3) * math.sqrt(slope) / manning_n
+
+
+@pytest.fixture
+def calculator():
+    """Fixture que proporciona una instancia de HydraulicCalculator."""
+    return HydraulicCalculator()
+
+
+class TestNormalDepth:
+    """Tests para calculate_normal_depth."""
+
+    @pytest.mark.parametrize(
+        "flow_rate, slope, manning_n, width",
+        [
+            (10.0, 0.001, 0.03, 5.0),
+            (0.05, 0.02, 0.013, 0.5),
+            (2500.0, 1e-4, 0.05, 80.0),
+        ],
+    )
+    def test_rectangular_satisfies_manning(
+        self, calculator, flow_rate, slope, manning_n, width
+    ):
+        """El tirante normal debe reproducir el caudal de entrada."""
+        result = calculator.calculate_normal_depth(flow_rate, slope, manning_n, width)
+
+        assert result["success"]
+        depth = result["normal_depth"]
+        assert manning_flow(depth, slope, manning_n, width) == pytest.approx(
+            flow_rate, rel=1e-6
+        )
+
+    def test_trapezoidal_satisfies_manning(self, calculator):
+        """Sección trapezoidal con taludes 2H:1V."""
+        result = calculator.calculate_normal_depth(
+            25.0, 0.0005, 0.025, 4.0, "trapezoidal", side_slope=2.0
+        )
+
+        assert result["success"]
+        depth = result["normal_depth"]
+        assert manning_flow(depth, 0.0005, 0.025, 4.0, 2.0) == pytest.approx(
+            25.0, rel=1e-6
+        )
+        assert result["area"] == pytest.approx((4.0 + 2.0 * depth) * depth)
+
+    def test_invalid_input_reports_error(self, calculator):
+        """Pendiente nula no tiene tirante normal."""
+        result = calculator.calculate_normal_depth(10.0, 0.0, 0.03, 5.0)
+
+        assert not result["success"]
+        assert "error" in result
+
+    def test_zero_width_rectangular_reports_error(self, calculator):
+        """Un canal rectangular sin ancho no tiene solución (no debe colgarse)."""
+        result = calculator.calculate_normal_depth(10.0, 0.001, 0.03, 0.0)
+
+        assert not result["success"]
+        assert "error" in result
+
+
+class TestNormalDepthBatch:
+    """Tests para calculate_normal_depth_batch."""
+
+    def test_matches_scalar_solver(self, calculator):
+        """El lote vectorizado coincide con el cálculo escalar fila por fila."""
+        rng = np.random.default_rng(42)
+        flow_rate = rng.uniform(0.1, 500.0, 200)
+        slope = rng.uniform(1e-4, 0.05, 200)
+        manning_n = rng.uniform(0.012, 0.08, 200)
+        width = rng.uniform(0.5, 50.0, 200)
+        side_slope = rng.uniform(0.0, 3.0, 200)
+
+        result = calculator.calculate_normal_depth_batch(
+            flow_rate, slope, manning_n, width, side_slope
+        )
+
+        assert result["success"]
+        assert result["converged"].all()
+        for i in range(0, 200, 20):
+            scalar = calculator.calculate_normal_depth(
+                flow_rate[i],
+                slope[i],
+                manning_n[i],
+                width[i],
+                "trapezoidal",
+                side_slope[i],
+            )
+            assert result["normal_depth"][i] == pytest.approx(
+                scalar["normal_depth"], rel=1e-6
+            )
+
+    def test_parallel_path_matches_vectorized(self, calculator, monkeypatch):
+        """El kernel paralelo (numba) y la ruta NumPy dan el mismo resultado."""
+        rng = np.random.default_rng(7)
+        inputs = (
+            rng.uniform(0.1, 500.0, (4, 50)),
+            rng.uniform(1e-4, 0.05, (4, 50)),
+            0.03,
+            rng.uniform(0.5, 50.0, 50),
+            1.0,
+        )
+
+        monkeypatch.setattr(hydraulic_calculator, "PARALLEL_BATCH_MIN_SIZE", 10**9)
+        vectorized = calculator.calculate_normal_depth_batch(*inputs)
+        monkeypatch.setattr(hydraulic_calculator, "PARALLEL_BATCH_MIN_SIZE", 1)
+        parallel = calculator.calculate_normal_depth_batch(*inputs)
+
+        assert parallel["success"]
+        assert parallel["converged"].all()
+        assert parallel["normal_depth"].shape == (4, 50)
+        np.testing.assert_allclose(
+            parallel["normal_depth"], vectorized["normal_depth"], rtol=1e-6
+        )
+
+    def test_broadcasts_scalars(self, calculator):
+        """Se pueden combinar escalares con arreglos."""
+        result = calculator.calculate_normal_depth_batch(
+            [1.0, 10.0, 100.0], 0.001, 0.03, 5.0
+        )
+
+        assert result["success"]
+        assert result["normal_depth"].shape == (3,)
+        assert np.all(np.diff(result["normal_depth"]) > 0)
+
+
+class TestCriticalDepth:
+    """Tests para calculate_critical_depth."""
+
+    def test_rectangular_froude_is_one(self, calculator):
+        """En tirante crítico el número de Froude es 1."""
+        result = calculator.calculate_critical_depth(10.0, 5.0)
+
+        assert result["success"]
+        assert result["froude_number"] == pytest.approx(1.0)
+
+    def test_trapezoidal_satisfies_critical_flow(self, calculator):
+        """Q²T/(gA³) = 1 en sección trapezoidal."""
+        result = calculator.calculate_critical_depth(
+            25.0, 4.0, "trapezoidal", side_slope=1.5
+        )
+
+        assert result["success"]
+        depth = result["critical_depth"]
+        area = (4.0 + 1.5 * depth) * depth
+        top_width = 4.0 + 2 * 1.5 * depth
+        assert 25.0**2 * top_width / (GRAVITY * area**3) == pytest.approx(1.0)
+        assert result["froude_number"] == pytest.approx(1.0)
+
+
+class TestFlowConditions:
+    """Tests para analyze_flow_conditions."""
+
+    def test_flow_regime(self, calculator):
+        """Tirantes mayores al crítico son subcríticos y menores supercríticos."""
+        deep = calculator.analyze_flow_conditions(10.0, 3.0, 5.0, 0.001, 0.03)
+        shallow = calculator.analyze_flow_conditions(10.0, 0.2, 5.0, 0.001, 0.03)
+
+        assert deep["flow_regime"] == "subcritical"
+        assert shallow["flow_regime"] == "supercritical"
+        assert deep["critical_depth"] == pytest.approx(shallow["critical_depth"])
+
+    def test_zero_width_rectangular(self, calculator):
+        """Sin ancho no hay área: Froude 0 en lugar de una división por cero."""
+        result = calculator.analyze_flow_conditions(10.0, 1.0, 0.0, 0.001, 0.03)
+
+        assert result["success"]
+        assert result["froude_number"] == 0
+        assert result["area"] == 0
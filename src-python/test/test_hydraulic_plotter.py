@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests para HydraulicPlotter
+==============================
+
+Verifica las estadísticas usadas en los gráficos hidráulicos.
+
+Autor: eFlood2 Technologies
+Versión: 0.1.0
+"""
+
+import numpy as np
+import pytest
+
+from eflood2_backend.processors import hydraulic_plotter
+from eflood2_backend.processors.hydraulic_plotter import summary_stats
+
+
+class TestSummaryStats:
+    """Tests para summary_stats."""
+
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_ignores_nan(self, monkeypatch, numba_available):
+        """Los NaN (también en la primera posición) no afectan las estadísticas."""
+        monkeypatch.setattr(hydraulic_plotter, "NUMBA_AVAILABLE", numba_available)
+        data = np.array([[np.nan, 2.0, 5.0], [np.nan, -1.0, 3.0]])
+
+        assert summary_stats(data) == pytest.approx(
+            (np.nanmin(data), np.nanmax(data), np.nanmean(data))
+        )
+
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_all_nan(self, monkeypatch, numba_available):
+        """Sin valores válidos las tres estadísticas son NaN."""
+        monkeypatch.setattr(hydraulic_plotter, "NUMBA_AVAILABLE", numba_available)
+
+        assert np.isnan(summary_stats(np.full(4, np.nan))).all()
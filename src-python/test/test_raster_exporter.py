@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests para RasterExporter
+============================
+
+Verifica la escritura de GeoTIFF (compresión, nodata) y la interpolación
+de mallas a raster.
+
+Autor: eFlood2 Technologies
+Versión: 0.1.0
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+rasterio = pytest.importorskip("rasterio")
+
+from scipy.interpolate import griddata
+
+from eflood2_backend.exporters import raster_exporter
+from eflood2_backend.exporters.raster_exporter import RasterExporter
+
+
+@pytest.fixture
+def exporter():
+    """Fixture que proporciona una instancia de RasterExporter."""
+    return RasterExporter()
+
+
+class TestArrayToGeotiff:
+    """Tests para array_to_geotiff."""
+
+    def test_roundtrip_replaces_nan_with_nodata(self, exporter, tmp_path):
+        """Los NaN se escriben como nodata y el resto de valores se conserva."""
+        data = np.arange(12, dtype=np.float32).reshape(3, 4)
+        data[1, 2] = np.nan
+        output = tmp_path / "depth.tif"
+
+        exporter.array_to_geotiff(data, (0, 0, 4, 3), str(output), -9999.0)
+
+        with rasterio.open(output) as src:
+            band = src.read(1)
+            assert src.nodata == -9999.0
+            assert src.compression.name.lower() == "zstd"
+            assert src.profile["tiled"]
+
+        assert band[1, 2] == -9999.0
+        mask = ~np.isnan(data)
+        np.testing.assert_array_equal(band[mask], data[mask])
+        # El arreglo de entrada no se modifica
+        assert np.isnan(data[1, 2])
+
+    def test_inplace_replaces_nan_in_input(self, exporter, tmp_path):
+        """Con inplace=True los NaN se reemplazan en el propio arreglo."""
+        data = np.ones((4, 4), dtype=np.float64)
+        data[0, 0] = np.nan
+
+        exporter.array_to_geotiff(
+            data,
+            (0, 0, 4, 4),
+            str(tmp_path / "wse.tif"),
+            -1.0,
+            inplace=True,
+            dtype=None,
+        )
+
+        assert data[0, 0] == -1.0
+
+    def test_float64_written_as_float32(self, exporter, tmp_path):
+        """Los datos float64 se escriben en float32 sin modificar la entrada."""
+        data = np.linspace(0.0, 5.0, 20).reshape(4, 5)
+        data[2, 3] = np.nan
+        output = tmp_path / "velocity.tif"
+
+        exporter.array_to_geotiff(data, (0, 0, 5, 4), str(output), inplace=True)
+
+        with rasterio.open(output) as src:
+            assert src.dtypes[0] == "float32"
+            band = src.read(1)
+        assert band[2, 3] == -9999.0
+        assert np.isnan(data[2, 3])
+        mask = ~np.isnan(data)
+        np.testing.assert_array_equal(band[mask], data[mask].astype(np.float32))
+
+    def test_integer_data(self, exporter, tmp_path):
+        """Los rasters enteros se escriben sin conversión."""
+        data = np.arange(16, dtype=np.int16).reshape(4, 4)
+        output = tmp_path / "classes.tif"
+
+        exporter.array_to_geotiff(data, (0, 0, 4, 4), str(output), -1)
+
+        with rasterio.open(output) as src:
+            assert src.dtypes[0] == "int16"
+            np.testing.assert_array_equal(src.read(1), data)
+
+    def test_builds_overviews(self, tmp_path):
+        """Se generan overviews hasta que el raster cabe en un bloque."""
+        data = np.random.default_rng(1).random((100, 90), dtype=np.float32)
+        output = tmp_path / "overviews.tif"
+
+        RasterExporter(blocksize=16).array_to_geotiff(data, (0, 0, 90, 100), output)
+
+        with rasterio.open(output) as src:
+            assert src.overviews(1) == [2, 4]
+            assert src.tags(ns="rio_overview")["resampling"] == "average"
+            np.testing.assert_array_equal(src.read(1), data)
+
+    @pytest.mark.parametrize(
+        "dtype, compression, predictor",
+        [
+            (np.float32, "zstd", 3),
+            (np.int32, "deflate", 2),
+            (np.float32, "none", None),
+        ],
+    )
+    def test_predictor_options(self, dtype, compression, predictor):
+        """Predictor según el tipo de dato, sólo para códecs que lo admiten."""
+        options = RasterExporter(compression=compression)._creation_options(
+            np.dtype(dtype)
+        )
+
+        assert options.get("predictor") == predictor
+
+
+class TestHdfResultsToRasters:
+    """Tests para hdf_results_to_rasters."""
+
+    def test_writes_every_dataset(self, exporter, tmp_path):
+        """Cada dataset genera un raster, en el orden de entrada."""
+        rng = np.random.default_rng(5)
+        hdf_data = {f"Results/Var {i}": rng.random((20, 30)) for i in range(6)}
+        coordinates = {"x": np.array([0.0, 30.0]), "y": np.array([0.0, 20.0])}
+
+        created = exporter.hdf_results_to_rasters(
+            hdf_data, coordinates, str(tmp_path), prefix="run"
+        )
+
+        assert [Path(p).name for p in created] == [
+            f"run_Results_Var_{i}.tif" for i in range(6)
+        ]
+        for path, data in zip(created, hdf_data.values()):
+            with rasterio.open(path) as src:
+                assert src.dtypes[0] == "float32"
+                np.testing.assert_array_equal(src.read(1), data.astype(np.float32))
+
+
+@pytest.fixture
+def lattice_mesh():
+    """Malla regular (desordenada) con una superficie no separable."""
+    rng = np.random.default_rng(0)
+    x, y = np.meshgrid(np.arange(0.0, 60.0, 2.0), np.arange(10.0, 50.0, 2.0))
+    points = np.column_stack((x.ravel(), y.ravel()))
+    values = np.sin(points[:, 0] / 10) * np.cos(points[:, 1] / 7)
+    values += rng.random(len(points))
+    order = rng.permutation(len(points))
+    return points[order], values[order]
+
+
+class TestCreateMeshRaster:
+    """Tests para create_mesh_raster."""
+
+    @pytest.mark.parametrize("method", ["nearest", "linear", "cubic"])
+    def test_lattice_matches_griddata(self, exporter, lattice_mesh, method):
+        """Sobre una malla regular se obtiene lo mismo que con griddata."""
+        points, values = lattice_mesh
+        xi, yi = np.meshgrid(np.arange(-1.17, 62.0, 0.73), np.arange(8.83, 51.0, 0.73))
+
+        interpolate = exporter._mesh_interpolator(points, values, method)
+        expected = griddata(points, values, (xi, yi), method=method)
+
+        np.testing.assert_allclose(interpolate(xi, yi), expected, atol=1e-12)
+
+    def test_writes_raster(self, exporter, lattice_mesh, tmp_path):
+        """Se genera un raster con nodata fuera de la malla."""
+        points, values = lattice_mesh
+        output = tmp_path / "mesh.tif"
+
+        exporter.create_mesh_raster(points, values, str(output), resolution=1.5)
+
+        with rasterio.open(output) as src:
+            band = src.read(1, masked=True)
+            assert band.count() > 0
+            assert band.min() >= values.min() - 1e-6
+            assert band.max() <= values.max() + 1e-6
+
+    @pytest.mark.parametrize("method", ["linear", "cubic", "nearest"])
+    def test_scattered_matches_griddata(self, exporter, method):
+        """La ruta de puntos dispersos coincide con griddata."""
+        rng = np.random.default_rng(3)
+        points = rng.uniform(0.0, 50.0, (400, 2))
+        values = np.sin(points[:, 0] / 8) * points[:, 1]
+        xi, yi = np.meshgrid(np.linspace(-2, 52, 40), np.linspace(-2, 52, 30))
+
+        interpolate = exporter._mesh_interpolator(points, values, method)
+        expected = griddata(points, values, (xi, yi), method=method)
+
+        np.testing.assert_allclose(interpolate(xi, yi), expected, atol=1e-9)
+
+    def test_tiled_write_matches_single_tile(
+        self, exporter, lattice_mesh, tmp_path, monkeypatch
+    ):
+        """Escribir por bloques da el mismo raster que un único bloque."""
+        points, values = lattice_mesh
+        single = tmp_path / "single.tif"
+        tiled = tmp_path / "tiled.tif"
+
+        exporter.create_mesh_raster(points, values, str(single), resolution=0.5)
+        monkeypatch.setattr(raster_exporter, "MESH_RASTER_TILE", 40)
+        RasterExporter(blocksize=16).create_mesh_raster(
+            points, values, str(tiled), resolution=0.5
+        )
+
+        with rasterio.open(single) as a, rasterio.open(tiled) as b:
+            assert a.shape == b.shape
+            np.testing.assert_array_equal(a.read(1), b.read(1))
+
+    def test_reuses_given_triangulation(self, exporter, tmp_path):
+        """Una triangulación previa produce el mismo raster."""
+        from scipy.spatial import Delaunay
+
+        rng = np.random.default_rng(8)
+        points = rng.uniform(0.0, 40.0, (300, 2))
+        values = points[:, 0] - 0.5 * points[:, 1]
+        own = tmp_path / "own.tif"
+        shared = tmp_path / "shared.tif"
+
+        exporter.create_mesh_raster(points, values, str(own))
+        exporter.create_mesh_raster(
+            points, values, str(shared), triangulation=Delaunay(points)
+        )
+
+        with rasterio.open(own) as a, rasterio.open(shared) as b:
+            np.testing.assert_array_equal(a.read(1), b.read(1))
+
+        with pytest.raises(ValueError):
+            exporter.create_mesh_raster(
+                points, values, str(shared), triangulation=Delaunay(points[:50])
+            )
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests para los lectores HDF
+==============================
+
+Verifica HDFReader y BoundaryReader sobre un archivo HDF sintético con la
+estructura de HEC-RAS, tanto abriendo el archivo como compartiendo un
+handle abierto.
+
+Autor: eFlood2 Technologies
+Versión: 0.1.0
+"""
+
+import base64
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from eflood2_backend.readers import hdf_reader
+from eflood2_backend.readers.boundary_reader import BoundaryReader
+from eflood2_backend.readers.data_extractor import DataExtractor
+from eflood2_backend.readers.hdf_reader import HDFReader
+from eflood2_backend.readers.manning_reader import ManningReader
+
+BC_PATH = "Event Conditions/Unsteady/Boundary Conditions/Flow Hydrographs"
+# Caché de chunks: 64 MiB y un número primo de slots (~10x los chunks residentes)
+H5_OPEN_KW = dict(rdcc_nbytes=64 << 20, rdcc_nslots=12007, rdcc_w0=0.75)
+
+RESULTS_PATH = (
+    "Results/Unsteady/Output/Output Blocks/Base Output/Unsteady Time Series"
+    "/2D Flow Areas/2D Area 1"
+)
+
+
+@pytest.fixture(scope="session")
+def hdf_path(tmp_path_factory):
+    """Archivo HDF sintético con condiciones de contorno y resultados."""
+    path = tmp_path_factory.mktemp("hdf") / "model.p01.hdf"
+    rng = np.random.default_rng(0)
+
+    with h5py.File(path, "w") as f:
+        area = f.create_group("Geometry/2D Flow Areas/2D Area 1")
+        area.create_dataset("Cells Center Coordinate", data=rng.random((200, 2)))
+
+        hydrographs = f.create_group(BC_PATH)
+        hydrographs.create_dataset("Upstream Inflow", data=rng.random((48, 2)))
+
+        results = f.create_group(RESULTS_PATH)
+        results.create_dataset("Depth", data=rng.random((24, 200)), chunks=(6, 50))
+
+    return path
+
+
+@pytest.fixture(scope="session")
+def hdf_handle(hdf_path):
+    """Handle HDF abierto una sola vez y compartido por toda la sesión."""
+    with h5py.File(hdf_path, "r", **H5_OPEN_KW) as f:
+        yield f
+
+
+class TestHDFReader:
+    """Tests para HDFReader."""
+
+    def test_shared_handle_matches_path(self, hdf_path, hdf_handle):
+        """La estructura leída del handle coincide con la del archivo."""
+        shared = HDFReader.from_handle(hdf_handle).get_file_structure()
+        opened = HDFReader(str(hdf_path), **H5_OPEN_KW).get_file_structure()
+
+        assert shared.keys() == opened.keys()
+        assert shared[f"{RESULTS_PATH}/Depth"]["shape"] == (24, 200)
+        # El handle sigue abierto: pertenece a quien lo creó
+        assert hdf_handle.id.valid
+
+    def test_dataset_data(self, hdf_handle):
+        """Los datos de un dataset se leen completos."""
+        reader = HDFReader.from_handle(hdf_handle)
+
+        data = reader.get_dataset_data(f"{RESULTS_PATH}/Depth")
+
+        np.testing.assert_array_equal(data, hdf_handle[f"{RESULTS_PATH}/Depth"][()])
+
+    @pytest.mark.parametrize(
+        "name, data",
+        [
+            ("float", np.arange(60, dtype=np.float32).reshape(3, 4, 5)),
+            ("int", np.arange(10, dtype=np.int64)),
+            ("empty", np.empty((0, 3))),
+            ("scalar", np.float64(2.5)),
+        ],
+    )
+    def test_read_direct_matches_bracket(self, tmp_path, name, data):
+        """La lectura con read_direct coincide con dataset[()]."""
+        with h5py.File(tmp_path / f"{name}.h5", "w") as f:
+            dataset = f.create_dataset(name, data=data)
+
+            result = HDFReader._read_dataset_bulk(dataset)
+
+            assert result.dtype == dataset.dtype
+            np.testing.assert_array_equal(result, dataset[()])
+
+    def test_chunk_cache_options(self, hdf_path):
+        """Las opciones de caché de chunks se aplican al abrir el archivo."""
+        reader = HDFReader(str(hdf_path), **H5_OPEN_KW)
+
+        with reader._open() as f:
+            nslots, nbytes, w0 = f.id.get_access_plist().get_cache()[1:]
+
+        assert (nslots, nbytes, w0) == (12007, 64 << 20, 0.75)
+
+    def test_detailed_metadata_reuses_structure(self, hdf_path, monkeypatch):
+        """Con la estructura ya leída, los metadatos no reabren el archivo."""
+        expected = HDFReader(str(hdf_path)).get_detailed_metadata()
+        reader = HDFReader(str(hdf_path))
+        reader.get_file_structure()
+
+        monkeypatch.setattr(h5py, "File", None)
+        metadata = reader.get_detailed_metadata()
+
+        assert metadata == expected
+        assert metadata["variables"]["depth"]["max_shape"] == [24, 200]
+        assert reader.get_detailed_metadata() is metadata
+
+    def test_cli_batches_commands(self, hdf_path, monkeypatch, capsys):
+        """Varios comandos en una llamada equivalen a llamadas separadas."""
+        commands = ["info", "structure", "hydraulic"]
+
+        def run_cli(*args):
+            monkeypatch.setattr(sys, "argv", ["hdf_reader.py", str(hdf_path), *args])
+            hdf_reader.main()
+            return json.loads(capsys.readouterr().out)
+
+        batched = run_cli(*commands)
+
+        assert batched == {command: run_cli(command) for command in commands}
+
+
+class TestBoundaryReader:
+    """Tests para BoundaryReader."""
+
+    def test_shared_handle_matches_path(self, hdf_path, hdf_handle):
+        """Las condiciones de contorno son las mismas con handle o ruta."""
+        shared = BoundaryReader.from_handle(hdf_handle).extract_boundary_conditions()
+        opened = BoundaryReader(
+            str(hdf_path), **H5_OPEN_KW
+        ).extract_boundary_conditions()
+
+        names = [bc["name"] for bc in shared["boundary_conditions"]]
+        assert "Upstream Inflow" in names
+        assert names == [bc["name"] for bc in opened["boundary_conditions"]]
+        assert f"{BC_PATH}/Upstream Inflow" in shared["time_series"]
+        assert hdf_handle.id.valid
+
+    def test_json_safety(self, hdf_handle):
+        """El resultado se serializa en JSON compacto sin pérdida."""
+        result = BoundaryReader.from_handle(hdf_handle).extract_boundary_conditions()
+
+        json_str = json.dumps(result, separators=(",", ":"))
+
+        assert "\n" not in json_str
+        assert json.loads(json_str) == json.loads(json.dumps(result))
+
+
+class TestDataExtractor:
+    """Tests para DataExtractor."""
+
+    def test_shared_handle_matches_path(self, hdf_path, hdf_handle):
+        """Leer desde un handle compartido da los mismos datos que por ruta."""
+        dataset_path = f"{BC_PATH}/Upstream Inflow"
+
+        shared = DataExtractor.from_handle(hdf_handle).extract_dataset_data(
+            dataset_path
+        )
+        opened = DataExtractor(str(hdf_path), **H5_OPEN_KW).extract_dataset_data(
+            dataset_path
+        )
+
+        assert shared == opened
+        assert shared["metadata"]["shape"] == [48, 2]
+
+    def test_exports_reuse_extraction(self, hdf_path, monkeypatch):
+        """Las exportaciones reutilizan el dataset ya extraído."""
+        dataset_path = f"{BC_PATH}/Upstream Inflow"
+        extractor = DataExtractor(str(hdf_path))
+        data_info = extractor.extract_dataset_data(dataset_path)
+
+        monkeypatch.setattr(h5py, "File", None)
+        exported = json.loads(extractor.export_to_json(dataset_path))
+
+        assert exported["data"] == data_info["data"]
+        assert exported["summary_statistics"] == data_info["summary_stats"]
+
+    def test_hydrograph_png(self, hdf_path):
+        """El hidrograma se genera como PNG codificado en base64."""
+        image = DataExtractor(str(hdf_path)).create_hydrograph(
+            f"{BC_PATH}/Upstream Inflow"
+        )
+
+        assert base64.b64decode(image).startswith(b"\x89PNG")
+
+
+class TestManningReader:
+    """Tests para ManningReader."""
+
+    def test_chunk_cache_options_reach_landcover(self, tmp_path, monkeypatch):
+        """Las opciones de h5py se usan también al abrir LandCover.hdf."""
+        with h5py.File(tmp_path / "model.p01.hdf", "w") as f:
+            f.create_group("Geometry")
+        with h5py.File(tmp_path / "LandCover.hdf", "w") as f:
+            f.create_dataset("ManningsN", data=[0.03, 0.05, 0.035])
+
+        opened = []
+        h5py_file = h5py.File
+
+        def recording_file(name, *args, **kwargs):
+            opened.append((Path(name).name, kwargs))
+            return h5py_file(name, *args, **kwargs)
+
+        monkeypatch.setattr(h5py, "File", recording_file)
+        result = ManningReader(
+            str(tmp_path / "model.p01.hdf"), **H5_OPEN_KW
+        ).extract_manning_values()
+
+        assert result["success"]
+        assert result["source"] == "LandCover.hdf"
+        assert result["manning_data"]["total_zones"] == 3
+        assert opened == [("model.p01.hdf", H5_OPEN_KW), ("LandCover.hdf", H5_OPEN_KW)]
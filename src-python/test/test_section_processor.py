@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests para SectionProcessor
+==============================
+
+Verifica la extracción de perfiles y secciones transversales sobre un
+terreno interpolado.
+
+Autor: eFlood2 Technologies
+Versión: 0.1.0
+"""
+
+import numpy as np
+import pytest
+
+from eflood2_backend.processors import section_processor
+from eflood2_backend.processors.section_processor import SectionProcessor
+
+
+def plane(x, y):
+    """Terreno plano inclinado (la interpolación lineal es exacta)."""
+    return 100.0 + 0.02 * x - 0.01 * y
+
+
+@pytest.fixture
+def processor():
+    """Fixture con un terreno plano cargado sobre puntos dispersos."""
+    rng = np.random.default_rng(11)
+    points = rng.uniform(0.0, 200.0, (2000, 2))
+    corners = np.array([[0.0, 0.0], [200.0, 0.0], [0.0, 200.0], [200.0, 200.0]])
+    points = np.vstack((points, corners))
+
+    section_processor = SectionProcessor()
+    section_processor.load_terrain_data(points, plane(points[:, 0], points[:, 1]))
+    return section_processor
+
+
+class TestExtractSectionProfile:
+    """Tests para extract_section_profile."""
+
+    def test_profile_on_plane(self, processor):
+        """Las elevaciones y distancias coinciden con la geometría exacta."""
+        profile = processor.extract_section_profile((10.0, 20.0), (130.0, 180.0), 25)
+
+        x = np.asarray(profile["coordinates"]["x"])
+        y = np.asarray(profile["coordinates"]["y"])
+        np.testing.assert_allclose(profile["elevations"], plane(x, y))
+        assert profile["total_length"] == pytest.approx(200.0)
+        np.testing.assert_allclose(profile["distances"], np.linspace(0, 200.0, 25))
+
+    def test_idw_profile(self, processor):
+        """IDW sobre un plano queda cerca de la elevación exacta."""
+        profile = processor.extract_section_profile(
+            (20.0, 20.0), (180.0, 150.0), 40, interpolation_method="idw"
+        )
+
+        x = np.asarray(profile["coordinates"]["x"])
+        y = np.asarray(profile["coordinates"]["y"])
+        np.testing.assert_allclose(profile["elevations"], plane(x, y), atol=0.1)
+
+    def test_idw_exact_at_terrain_points(self, processor):
+        """En los puntos del terreno IDW devuelve el valor propio."""
+        points = processor.mesh_points[:50]
+
+        np.testing.assert_allclose(
+            processor._interpolate_batch(points), processor.mesh_values[:50]
+        )
+
+    def test_tree_built_on_demand(self, processor):
+        """El KD-tree sólo se construye para 'idw' y 'nearest'."""
+        processor.extract_section_profile((10.0, 20.0), (130.0, 180.0), 10)
+        assert processor._tree is None
+
+        processor.extract_section_profile(
+            (10.0, 20.0), (130.0, 180.0), 10, interpolation_method="nearest"
+        )
+        tree = processor._tree
+        assert tree is not None
+
+        processor.extract_section_profile(
+            (10.0, 20.0), (130.0, 180.0), 10, interpolation_method="idw"
+        )
+        assert processor._tree is tree
+
+    def test_to_json_roundtrip(self, processor):
+        """Los perfiles guardan arreglos y se serializan sólo con to_json."""
+        import json
+
+        profile = processor.extract_section_profile((10.0, 20.0), (30.0, 20.0), 5)
+        assert isinstance(profile["elevations"], np.ndarray)
+
+        decoded = json.loads(SectionProcessor.to_json(profile))
+        assert decoded["distances"] == pytest.approx([0.0, 5.0, 10.0, 15.0, 20.0])
+        np.testing.assert_allclose(decoded["elevations"], profile["elevations"])
+
+    @pytest.mark.parametrize("method", ["linear", "cubic", "nearest"])
+    def test_matches_griddata(self, processor, method):
+        """Los interpoladores en caché coinciden con griddata."""
+        from scipy.interpolate import griddata
+
+        query = np.random.default_rng(2).uniform(-5.0, 205.0, (300, 2))
+        expected = griddata(
+            processor.mesh_points, processor.mesh_values, query, method=method
+        )
+
+        for _ in range(2):
+            np.testing.assert_allclose(
+                processor._interpolate_elevations(query, method), expected, atol=1e-9
+            )
+
+    def test_requires_terrain(self):
+        """Sin terreno cargado se lanza ValueError."""
+        with pytest.raises(ValueError):
+            SectionProcessor().extract_section_profile((0, 0), (1, 1))
+
+
+@pytest.fixture
+def axis_data():
+    """Eje recto de 150 m con rumbo de 30°."""
+    stations = np.array([0.0, 50.0, 150.0])
+    bearing = np.radians(30.0)
+    return {
+        "name": "Eje 1",
+        "coordinates": {
+            "x": (40.0 + stations * np.sin(bearing)).tolist(),
+            "y": (30.0 + stations * np.cos(bearing)).tolist(),
+        },
+        "stations": stations.tolist(),
+        "bearings": [30.0, 30.0, 30.0],
+    }
+
+
+class TestGenerateMultipleSections:
+    """Tests para generate_multiple_sections."""
+
+    def test_matches_single_profiles(self, processor, axis_data):
+        """Cada sección del lote coincide con su extracción individual."""
+        sections = processor.generate_multiple_sections(axis_data, 25.0, 40.0, 30)
+
+        assert [s["section_id"] for s in sections] == list(range(1, 8))
+        assert [s["station"] for s in sections] == pytest.approx(
+            np.arange(0.0, 151.0, 25.0)
+        )
+        for section in sections:
+            assert section["bearing"] == pytest.approx(120.0)
+            assert section["axis_name"] == "Eje 1"
+            assert section["total_length"] == pytest.approx(40.0)
+
+            single = processor.extract_section_profile(
+                section["start_point"], section["end_point"], 30
+            )
+            np.testing.assert_allclose(
+                section["elevations"], single["elevations"], rtol=1e-12
+            )
+            np.testing.assert_allclose(
+                section["coordinates"]["x"], single["coordinates"]["x"]
+            )
+
+    def test_skips_stations_outside_axis(self, processor, axis_data):
+        """Las estaciones fuera del eje se omiten en lugar de recortarse."""
+        axis_data["stations"] = [20.0, 70.0, 150.0]
+
+        sections = processor.generate_multiple_sections(axis_data, 25.0, 40.0, 30)
+
+        assert [s["section_id"] for s in sections] == list(range(2, 8))
+        assert sections[0]["station"] == pytest.approx(25.0)
+
+    def test_failed_section_skips_only_itself(self, processor, axis_data, monkeypatch):
+        """Un error en una sección no descarta el resto del lote."""
+        interpolate = processor._interpolate_elevations
+        calls = []
+
+        def failing_interpolate(query_points, *args):
+            calls.append(len(query_points))
+            # Falla el lote completo y la tercera sección individual
+            if len(query_points) > 30 or len(calls) == 4:
+                raise ValueError("bad section")
+            return interpolate(query_points, *args)
+
+        monkeypatch.setattr(processor, "_interpolate_elevations", failing_interpolate)
+        sections = processor.generate_multiple_sections(axis_data, 25.0, 40.0, 30)
+
+        assert [s["section_id"] for s in sections] == [1, 2, 4, 5, 6, 7]
+        for section in sections:
+            assert not np.isnan(section["elevations"]).all()
+
+
+class TestHydraulicProperties:
+    """Tests para calculate_hydraulic_properties."""
+
+    def test_trapezoidal_channel(self):
+        """Canal trapezoidal: área, perímetro y ancho superficial exactos."""
+        distances = np.array([0.0, 2.0, 4.0, 10.0, 12.0, 14.0])
+        elevations = np.array([4.0, 2.0, 0.0, 0.0, 2.0, 4.0])
+        section = {"distances": distances, "elevations": elevations}
+
+        result = SectionProcessor().calculate_hydraulic_properties(section, 2.0)
+
+        assert result["wetted_area"] == pytest.approx(2.0 * 6.0 + 2.0 * 2.0)
+        assert result["wetted_perimeter"] == pytest.approx(6.0 + 2 * np.hypot(2, 2))
+        assert result["top_width"] == pytest.approx(10.0)
+        assert result["max_depth"] == pytest.approx(2.0)
+        assert result["hydraulic_radius"] == pytest.approx(
+            result["wetted_area"] / result["wetted_perimeter"]
+        )
+
+    def test_skips_nan_elevations(self):
+        """Los NaN se omiten; sin datos válidos se informa el error."""
+        section = {
+            "distances": [0.0, 1.0, 2.0, 3.0],
+            "elevations": [1.0, np.nan, 0.0, 1.0],
+        }
+        processor = SectionProcessor()
+
+        result = processor.calculate_hydraulic_properties(section, 1.0)
+        assert result["wetted_area"] == pytest.approx(1.0 + 0.5)
+        assert result["top_width"] == pytest.approx(3.0)
+
+        dry = processor.calculate_hydraulic_properties(section, -0.5)
+        assert dry["wetted_area"] == 0.0
+
+        empty = {"distances": [0.0, 1.0], "elevations": [np.nan, np.nan]}
+        assert "error" in processor.calculate_hydraulic_properties(empty, 1.0)
+
+
+class TestExportSectionsToCsv:
+    """Tests para export_sections_to_csv."""
+
+    def test_min_max_ignore_nan(self, tmp_path):
+        """Las elevaciones mínima y máxima ignoran los NaN."""
+        import csv
+
+        sections = [
+            {"section_id": 1, "elevations": [np.nan, 3.0, 1.5, np.nan]},
+            {"section_id": 2, "elevations": [np.nan, np.nan]},
+        ]
+        output = tmp_path / "sections.csv"
+
+        SectionProcessor().export_sections_to_csv(sections, str(output))
+
+        with open(output, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert float(rows[0]["Min_Elevation"]) == 1.5
+        assert float(rows[0]["Max_Elevation"]) == 3.0
+        assert rows[1]["Min_Elevation"] == rows[1]["Max_Elevation"] == ""
+
+    def test_vectorized_fallback_matches_kernel(self, monkeypatch):
+        """La ruta NumPy (sin numba) coincide con el kernel compilado."""
+        rng = np.random.default_rng(4)
+        distances = np.sort(rng.uniform(0.0, 500.0, 400))
+        elevations = 10.0 * np.abs(np.sin(distances / 60.0))
+        elevations[rng.choice(400, 40, replace=False)] = np.nan
+        section = {"distances": distances, "elevations": elevations}
+        processor = SectionProcessor()
+
+        monkeypatch.setattr(section_processor, "NUMBA_AVAILABLE", True)
+        compiled = processor.calculate_hydraulic_properties(section, 6.0)
+        monkeypatch.setattr(section_processor, "NUMBA_AVAILABLE", False)
+        vectorized = processor.calculate_hydraulic_properties(section, 6.0)
+
+        assert vectorized == pytest.approx(compiled)
+
+
+class TestPlotSectionProfile:
+    """Tests para plot_section_profile."""
+
+    def test_reuses_figure(self, processor, tmp_path):
+        """Varias secciones se dibujan sobre la misma figura."""
+        profile = processor.extract_section_profile((10.0, 20.0), (130.0, 180.0), 25)
+        first = tmp_path / "first.png"
+        second = tmp_path / "second.png"
+
+        processor.plot_section_profile(profile, str(first))
+        figure = processor._figure
+        processor.plot_section_profile(profile, str(second), show_water_level=101.0)
+
+        assert processor._figure is figure
+        assert len(figure.axes) == 1
+        assert first.stat().st_size > 0 and second.stat().st_size > 0
+
+    def test_figure_not_registered_in_pyplot(self, processor, tmp_path):
+        """La figura no queda abierta en el registro global de pyplot."""
+        import matplotlib.pyplot as plt
+
+        profile = processor.extract_section_profile((10.0, 20.0), (130.0, 180.0), 25)
+        open_figures = plt.get_fignums()
+
+        processor.plot_section_profile(profile, str(tmp_path / "profile.png"))
+
+        assert plt.get_fignums() == open_figures